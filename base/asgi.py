@@ -0,0 +1,73 @@
+import io
+
+import django
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import RequestAborted
+from django.core.handlers.asgi import ASGIHandler
+
+
+class ASGIBodyStream(io.RawIOBase):
+    
+    def __init__(self, receive):
+        self.receive = receive
+        self.buffer = bytearray()
+        self.finished = False
+    
+    async def __call__(self):
+        return await self.receive()
+    
+    def readable(self):
+        return True
+    
+    def read(self, size=-1):
+        while not self.finished and (size is None or size < 0 or len(self.buffer) < size):
+            message = async_to_sync(self.receive)()
+            if message['type'] == 'http.disconnect':
+                raise RequestAborted()
+            self.buffer += message.get('body', b'')
+            self.finished = not message.get('more_body', False)
+        
+        if size is None or size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class StreamingASGIHandler(ASGIHandler):
+    STREAMED_CONTENT_TYPES = (b'multipart/form-data',)
+    
+    async def handle(self, scope, receive, send):
+        if self._has_streamed_body(scope):
+            receive = ASGIBodyStream(receive)
+        await super().handle(scope, receive, send)
+    
+    async def read_body(self, receive):
+        if isinstance(receive, ASGIBodyStream):
+            return receive
+        return await super().read_body(receive)
+    
+    async def send_response(self, response, send):
+        if response.streaming and not response.is_async:
+            response.streaming_content = self._aiter_content(response.streaming_content)
+        await super().send_response(response, send)
+    
+    def _has_streamed_body(self, scope):
+        for name, value in scope.get('headers', []):
+            if name.lower() == b'content-type':
+                return value.lower().startswith(self.STREAMED_CONTENT_TYPES)
+        return False
+    
+    async def _aiter_content(self, content):
+        iterator = iter(content)
+        next_part = sync_to_async(next, thread_sensitive=True)
+        while True:
+            part = await next_part(iterator, None)
+            if part is None:
+                return
+            yield part
+
+
+def get_streaming_asgi_application():
+    django.setup(set_prefix=False)
+    return StreamingASGIHandler()
@@ -54,3 +54,4 @@ class AbstractBaseModel(BaseTimeModel, DeletionModel, BaseUUIDModel):
     @property
     def is_active(self):
         return self.state == StateStatuses.ACTIVE
+
@@ -0,0 +1,18 @@
+from django.db.migrations.operations import AddIndex
+
+
+class AddPostgresIndex(AddIndex):
+    
+    def state_forwards(self, app_label, state):
+        pass
+    
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+    
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+    
+    def describe(self):
+        return f"{super().describe()} on PostgreSQL"
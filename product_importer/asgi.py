@@ -9,8 +9,8 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+from base.asgi import get_streaming_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'product_importer.settings')
 
-application = get_asgi_application()
+application = get_streaming_asgi_application()
@@ -47,7 +47,10 @@ ssl_options = {
 
 if broker_url and broker_url.startswith('rediss://'):
     app.conf.broker_use_ssl = ssl_options
-    app.conf.broker_transport_options = ssl_options
+    app.conf.broker_transport_options = {
+        **ssl_options,
+        'visibility_timeout': app.conf.broker_transport_options.get('visibility_timeout'),
+    }
 
 if result_backend and result_backend.startswith('rediss://'):
     app.conf.result_backend_transport_options = ssl_options
@@ -159,15 +159,35 @@ def add_ssl_to_redis_url(url):
 CELERY_BROKER_URL = add_ssl_to_redis_url(os.environ.get('CELERY_BROKER_URL', REDIS_URL))
 CELERY_RESULT_BACKEND = add_ssl_to_redis_url(os.environ.get('CELERY_RESULT_BACKEND', REDIS_URL))
 
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {'ssl_cert_reqs': None} if REDIS_URL.startswith('rediss://') else {},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+CELERY_BROKER_VISIBILITY_TIMEOUT = 2 * 60 * 60
+
 if CELERY_BROKER_URL.startswith('rediss://'):
     CELERY_BROKER_TRANSPORT_OPTIONS = {
         'ssl_cert_reqs': ssl.CERT_NONE,
         'ssl_ca_certs': None,
         'ssl_certfile': None,
         'ssl_keyfile': None,
+        'visibility_timeout': CELERY_BROKER_VISIBILITY_TIMEOUT,
     }
 else:
-    CELERY_BROKER_TRANSPORT_OPTIONS = {}
+    CELERY_BROKER_TRANSPORT_OPTIONS = {
+        'visibility_timeout': CELERY_BROKER_VISIBILITY_TIMEOUT,
+    }
 
 if CELERY_RESULT_BACKEND.startswith('rediss://'):
     CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {
@@ -187,6 +207,25 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60
 CELERY_RESULT_EXPIRES = 3600
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+IMPORT_WORKER_CONCURRENCY = int(os.environ.get('IMPORT_WORKER_CONCURRENCY', 2))
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_ROUTES = {
+    'products.tasks.process_csv_import': {'queue': 'imports'},
+    'products.tasks.process_csv_import_parallel': {'queue': 'imports'},
+    'products.tasks.process_csv_range': {'queue': 'imports'},
+    'products.tasks.finalize_parallel_csv_import': {'queue': 'default'},
+    'products.tasks.fail_parallel_csv_import': {'queue': 'default'},
+    'products.tasks.purge_expired_import_rejects': {'queue': 'default'},
+    'products.tasks.trigger_webhooks_for_event': {'queue': 'webhooks_fanout'},
+    'products.tasks.deliver_webhook_task': {'queue': 'webhooks'},
+}
+CELERY_BEAT_SCHEDULE = {
+    'purge-expired-import-rejects': {
+        'task': 'products.tasks.purge_expired_import_rejects',
+        'schedule': 24 * 60 * 60,
+    },
+}
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [],
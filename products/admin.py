@@ -27,5 +27,6 @@ class ImportJobAdmin(BaseAdmin):
     list_display = ('uuid', 'status', 'progress', 'total_records', 'created_at')
     search_fields = ('file_name', 'status')
     list_filter = ('status', 'state', 'created_at')
-    readonly_fields = ('uuid', 'created_at', 'updated_at', 'started_at', 'completed_at')
-
+    readonly_fields = (
+        'uuid', 'created_at', 'updated_at', 'started_at', 'completed_at', 'stage_metrics'
+    )
@@ -20,6 +20,7 @@ class ImportJobStatuses:
     PROCESSING = 'processing'
     COMPLETED = 'completed'
     FAILED = 'failed'
+    TERMINAL_STATUSES = (COMPLETED, FAILED)
 
 
 IMPORT_JOB_STATUS_CHOICES = (
@@ -28,3 +29,61 @@ IMPORT_JOB_STATUS_CHOICES = (
     (ImportJobStatuses.COMPLETED, 'Completed'),
     (ImportJobStatuses.FAILED, 'Failed'),
 )
+
+
+class UpsertEngines:
+    AUTO = 'auto'
+    ORM = 'orm'
+    POSTGRES_COPY = 'postgres_copy'
+
+
+class CountStrategies:
+    EXACT = 'exact'
+    CACHED = 'cached'
+    ESTIMATE = 'estimate'
+
+
+class CompressionFormats:
+    NONE = 'none'
+    GZIP = 'gzip'
+    BZIP2 = 'bzip2'
+    ZSTD = 'zstd'
+
+
+class ImportFileFormats:
+    CSV = 'csv'
+    JSONL = 'jsonl'
+    PARQUET = 'parquet'
+    ARROW_IPC = 'arrow_ipc'
+    COLUMNAR_FORMATS = (PARQUET, ARROW_IPC)
+
+
+class RejectReasons:
+    MALFORMED_ROW = 'malformed_row'
+    MISSING_SKU = 'missing_sku'
+    MISSING_NAME = 'missing_name'
+    SKU_TOO_LONG = 'sku_too_long'
+    NAME_TOO_LONG = 'name_too_long'
+    DUPLICATE_SKU = 'duplicate_sku'
+
+
+class DuplicatePolicies:
+    FIRST_WINS = 'first_wins'
+    LAST_WINS = 'last_wins'
+    REJECT = 'reject'
+    POLICIES = (FIRST_WINS, LAST_WINS, REJECT)
+
+
+DUPLICATE_POLICY_CHOICES = (
+    (DuplicatePolicies.FIRST_WINS, 'First Wins'),
+    (DuplicatePolicies.LAST_WINS, 'Last Wins'),
+    (DuplicatePolicies.REJECT, 'Reject'),
+)
+
+
+class CeleryQueues:
+    DEFAULT = 'default'
+    IMPORTS = 'imports'
+    IMPORTS_SMALL = 'imports_small'
+    WEBHOOKS_FANOUT = 'webhooks_fanout'
+    WEBHOOKS = 'webhooks'
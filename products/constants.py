@@ -1,15 +1,68 @@
+from products.choices import CountStrategies, ImportFileFormats, UpsertEngines
+
+
 class ProductConstants:
     CSV_CHUNK_SIZE = 5000
     CSV_MAX_FILE_SIZE = 100 * 1024 * 1024
-    CSV_ALLOWED_EXTENSIONS = ['.csv']
+    CSV_MAX_DECOMPRESSED_SIZE = 2 * 1024 * 1024 * 1024
+    IMPORT_FILE_EXTENSIONS = {
+        '.csv': ImportFileFormats.CSV,
+        '.csv.gz': ImportFileFormats.CSV,
+        '.csv.bz2': ImportFileFormats.CSV,
+        '.csv.zst': ImportFileFormats.CSV,
+        '.jsonl': ImportFileFormats.JSONL,
+        '.jsonl.gz': ImportFileFormats.JSONL,
+        '.jsonl.bz2': ImportFileFormats.JSONL,
+        '.jsonl.zst': ImportFileFormats.JSONL,
+        '.parquet': ImportFileFormats.PARQUET,
+        '.arrow': ImportFileFormats.ARROW_IPC,
+        '.feather': ImportFileFormats.ARROW_IPC,
+    }
+    IMPORT_ALLOWED_EXTENSIONS = list(IMPORT_FILE_EXTENSIONS)
+    CSV_DECOMPRESSION_READ_SIZE = 64 * 1024
+    CSV_REQUIRED_COLUMNS = ['sku', 'name']
+    IMPORT_COLUMNS = ['sku', 'name', 'description']
+    ARROW_VALIDATION_MIN_BATCH_SIZE = 1000
+    CSV_UPLOAD_CHUNK_SIZE = 1024 * 1024
+    CSV_HEADER_MAX_SIZE = 64 * 1024
+    CSV_ESTIMATE_TOTAL_RECORDS = True
+    CSV_ROW_ESTIMATE_SAMPLE_SIZE = 1024 * 1024
     PROGRESS_UPDATE_INTERVAL = 5000
     PROGRESS_UPDATE_TIME_INTERVAL = 2
     SKU_MAX_LENGTH = 255
     SKU_MIN_LENGTH = 1
     PRODUCT_NAME_MAX_LENGTH = 500
     DESCRIPTION_MAX_LENGTH = 5000
+    CONTENT_HASH_LENGTH = 32
     BULK_CREATE_BATCH_SIZE = 5000
-    BULK_UPDATE_BATCH_SIZE = 5000
+    ADAPTIVE_CHUNK_SIZING = True
+    CHUNK_SIZE_MIN = 500
+    CHUNK_SIZE_MAX = 50000
+    CHUNK_SIZE_INCREASE_STEP = 2500
+    CHUNK_SIZE_DECREASE_FACTOR = 0.5
+    CHUNK_TARGET_DB_SECONDS = 1.0
+    CHUNK_MAX_RSS_MB = 384
+    UPSERT_ENGINE = UpsertEngines.AUTO
+    PARALLEL_IMPORT_MAX_RANGES = 8
+    PARALLEL_IMPORT_MIN_RANGE_SIZE = 4 * 1024 * 1024
+    SKU_INDEX_ENABLED = True
+    SKU_INDEX_MIN_IMPORT_RECORDS = 50000
+    SKU_INDEX_MAX_CATALOG_SIZE = 20000000
+    SKU_INDEX_BUILD_BATCH_SIZE = 10000
+    SKU_INDEX_RUN_SIZE = 65536
+    SEARCH_CONFIG = 'simple'
+    SEARCH_FTS_TABLE = 'products_fts'
+    SEARCH_FTS_MIN_TERM_LENGTH = 3
+    COUNT_STRATEGY = CountStrategies.CACHED
+    COUNT_CACHE_KEY_PREFIX = 'product_count'
+    COUNT_CACHE_TIMEOUT = 30
+    COUNT_ESTIMATE_MIN_ROWS = 10000
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_KEY_PREFIX = 'product_response'
+    RESPONSE_CACHE_VERSION_KEY = 'product_catalog_version'
+    RESPONSE_CACHE_TIMEOUT = 5 * 60
+    EXPORT_ITERATOR_CHUNK_SIZE = 2000
+    EXPORT_FLUSH_SIZE = 64 * 1024
 
 
 class WebhookConstants:
@@ -23,6 +76,33 @@ class WebhookConstants:
 
 class ImportJobConstants:
     STATUS_MAX_LENGTH = 20
+    DUPLICATE_POLICY_MAX_LENGTH = 20
     FILE_NAME_MAX_LENGTH = 255
+    FILE_CHECKSUM_MAX_LENGTH = 64
     PROGRESS_MIN = 0
     PROGRESS_MAX = 100
+    FILE_PATH_MAX_LENGTH = 500
+    MAX_AUTO_RESUMES = 5
+    SMALL_IMPORT_MAX_FILE_SIZE = 10 * 1024 * 1024
+    MAX_CONCURRENT_LARGE_IMPORTS = 2
+    ADMISSION_RETRY_DELAY = 30
+    ADMISSION_STALE_AFTER = 60 * 60
+    PROCESSING_STALE_AFTER = 10 * 60
+    REJECTS_DIR_NAME = 'import_rejects'
+    REJECTS_REASON_COLUMN = 'reject_reason'
+    REJECTS_RETENTION_DAYS = 7
+    PROGRESS_CACHE_KEY_PREFIX = 'import_job_progress'
+    PROGRESS_CACHE_TIMEOUT = 60 * 60
+    EVENT_STREAM_POLL_INTERVAL = 1
+    EVENT_STREAM_HEARTBEAT_INTERVAL = 15
+    EVENT_STREAM_MAX_DURATION = 5 * 60
+    EVENT_STREAM_RETRY_MS = 3000
+
+
+class BenchmarkConstants:
+    SKU_PREFIX = 'BENCH'
+    DESCRIPTION_LENGTH = 120
+    TEXT_POOL_SIZE = 64 * 1024
+    DEFAULT_ROW_COUNTS = [100000]
+    SQLITE_DATABASE_NAME = 'benchmark.sqlite3'
+    RSS_SAMPLE_INTERVAL = 0.02
@@ -1,7 +1,9 @@
 from base.dbio import BaseDbIO
 from products.models import (
     ImportJob,
+    ImportSeenSku,
     Product,
+    ProductStateCount,
     Webhook
 )
 
@@ -26,3 +28,17 @@ class ImportJobDbIO(BaseDbIO):
     def model(self):
         return ImportJob
 
+
+
+class ImportSeenSkuDbIO(BaseDbIO):
+    
+    @property
+    def model(self):
+        return ImportSeenSku
+
+
+class ProductStateCountDbIO(BaseDbIO):
+    
+    @property
+    def model(self):
+        return ProductStateCount
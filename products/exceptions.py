@@ -0,0 +1,6 @@
+class ImportJobConflictError(ValueError):
+    pass
+
+
+class ImportJobOwnershipLostError(Exception):
+    pass
@@ -0,0 +1,150 @@
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+from products.choices import RejectReasons
+from products.constants import ProductConstants
+
+
+ASCII_WHITESPACE = ''.join(chr(code) for code in range(128) if chr(code).isspace())
+
+
+def validate_product_batch(columns):
+    if pa is None:
+        return _validate_python_batch(columns)
+    
+    if len(columns['sku']) >= ProductConstants.ARROW_VALIDATION_MIN_BATCH_SIZE:
+        arrow_columns = {
+            field: _to_arrow_array(values) for field, values in columns.items()
+        }
+        if all(_is_ascii(values) for values in arrow_columns.values()):
+            return _validate_arrow_batch(arrow_columns)
+    
+    return _validate_python_batch({
+        field: _to_python_list(values) for field, values in columns.items()
+    })
+
+
+def _validate_python_batch(columns):
+    sku_max_length = ProductConstants.SKU_MAX_LENGTH
+    name_max_length = ProductConstants.PRODUCT_NAME_MAX_LENGTH
+    description_max_length = ProductConstants.DESCRIPTION_MAX_LENGTH
+    valid_products = []
+    rejected_rows = []
+    
+    for sku, name, description in zip(columns['sku'], columns['name'], columns['description']):
+        if sku is None or name is None or description is None:
+            rejected_rows.append([sku, name, description, RejectReasons.MALFORMED_ROW])
+            continue
+        
+        clean_sku = sku.strip()
+        clean_name = name.strip()
+        if (not clean_sku or not clean_name or
+                len(clean_sku) > sku_max_length or len(clean_name) > name_max_length):
+            rejected_rows.append([sku, name, description, get_reject_reason(clean_sku, clean_name)])
+            continue
+        
+        valid_products.append({
+            'sku': clean_sku.lower(),
+            'name': clean_name,
+            'description': description.strip()[:description_max_length] or None,
+        })
+    
+    return valid_products, rejected_rows
+
+
+def iter_valid_skus(columns):
+    sku_max_length = ProductConstants.SKU_MAX_LENGTH
+    name_max_length = ProductConstants.PRODUCT_NAME_MAX_LENGTH
+    
+    if pa is not None:
+        columns = {field: _to_python_list(values) for field, values in columns.items()}
+    
+    for sku, name, description in zip(columns['sku'], columns['name'], columns['description']):
+        if sku is None or name is None or description is None:
+            continue
+        
+        clean_sku = sku.strip()
+        clean_name = name.strip()
+        if (clean_sku and clean_name and
+                len(clean_sku) <= sku_max_length and len(clean_name) <= name_max_length):
+            yield clean_sku.lower()
+
+
+def _validate_arrow_batch(columns):
+    skus = pc.utf8_trim(columns['sku'], characters=ASCII_WHITESPACE)
+    names = pc.utf8_trim(columns['name'], characters=ASCII_WHITESPACE)
+    descriptions = pc.utf8_trim(columns['description'], characters=ASCII_WHITESPACE)
+    
+    sku_lengths = pc.utf8_length(skus)
+    name_lengths = pc.utf8_length(names)
+    valid_mask = pc.and_(
+        pc.and_(
+            pc.and_(pc.greater(sku_lengths, 0), pc.greater(name_lengths, 0)),
+            pc.and_(
+                pc.less_equal(sku_lengths, ProductConstants.SKU_MAX_LENGTH),
+                pc.less_equal(name_lengths, ProductConstants.PRODUCT_NAME_MAX_LENGTH)
+            )
+        ),
+        pc.is_valid(descriptions)
+    ).fill_null(False)
+    
+    skus = pc.ascii_lower(pc.filter(skus, valid_mask))
+    names = pc.filter(names, valid_mask)
+    descriptions = pc.utf8_slice_codeunits(
+        pc.filter(descriptions, valid_mask), 0, ProductConstants.DESCRIPTION_MAX_LENGTH
+    )
+    descriptions = pc.if_else(
+        pc.equal(pc.utf8_length(descriptions), 0),
+        pa.scalar(None, type=pa.string()),
+        descriptions
+    )
+    
+    valid_products = [
+        {'sku': sku, 'name': name, 'description': description}
+        for sku, name, description in zip(
+            skus.to_pylist(), names.to_pylist(), descriptions.to_pylist()
+        )
+    ]
+    
+    rejected_rows = []
+    for index in pc.indices_nonzero(pc.invert(valid_mask)).to_pylist():
+        sku, name, description = (columns[field][index].as_py() for field in ProductConstants.IMPORT_COLUMNS)
+        if sku is None or name is None or description is None:
+            reason = RejectReasons.MALFORMED_ROW
+        else:
+            reason = get_reject_reason(sku.strip(), name.strip())
+        rejected_rows.append([sku, name, description, reason])
+    
+    return valid_products, rejected_rows
+
+
+def get_reject_reason(sku, name):
+    if not sku:
+        return RejectReasons.MISSING_SKU
+    if not name:
+        return RejectReasons.MISSING_NAME
+    if len(sku) > ProductConstants.SKU_MAX_LENGTH:
+        return RejectReasons.SKU_TOO_LONG
+    return RejectReasons.NAME_TOO_LONG
+
+
+def _to_arrow_array(values):
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        if values.type != pa.string():
+            return pc.cast(values, pa.string())
+        return values
+    return pa.array(values, type=pa.string())
+
+
+def _to_python_list(values):
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return values.to_pylist()
+    return values
+
+
+def _is_ascii(values):
+    return pc.all(pc.string_is_ascii(values)).as_py() is not False
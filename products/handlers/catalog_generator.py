@@ -0,0 +1,63 @@
+import csv
+import random
+import string
+
+from products.constants import BenchmarkConstants, ProductConstants
+from products.dbio import ProductDbIO
+
+
+def build_catalog_sku(index):
+    return f"{BenchmarkConstants.SKU_PREFIX}-{index:010d}"
+
+
+def generate_catalog_csv(file_path, row_count, duplicate_ratio=0.0, invalid_ratio=0.0,
+                         description_length=BenchmarkConstants.DESCRIPTION_LENGTH, seed=None):
+    rng = random.Random(seed)
+    text_pool = ''.join(
+        rng.choice(string.ascii_letters + ' ')
+        for _ in range(BenchmarkConstants.TEXT_POOL_SIZE + description_length)
+    )
+    
+    with open(file_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(ProductConstants.IMPORT_COLUMNS)
+        
+        for index in range(row_count):
+            if index and rng.random() < duplicate_ratio:
+                sku = build_catalog_sku(rng.randrange(index))
+            else:
+                sku = build_catalog_sku(index)
+            
+            name = '' if rng.random() < invalid_ratio else f"Product {index}"
+            offset = rng.randrange(BenchmarkConstants.TEXT_POOL_SIZE)
+            writer.writerow([sku, name, text_pool[offset:offset + description_length]])
+    
+    return file_path
+
+
+def seed_catalog_products(row_count, update_ratio, seed=None):
+    rng = random.Random(seed)
+    product_dbio = ProductDbIO()
+    batch_size = ProductConstants.BULK_CREATE_BATCH_SIZE
+    batch = []
+    seeded_count = 0
+    
+    for index in range(row_count):
+        if rng.random() >= update_ratio:
+            continue
+        
+        batch.append(product_dbio.model(
+            sku=build_catalog_sku(index).lower(),
+            name=f"Stale product {index}",
+            description='stale'
+        ))
+        if len(batch) >= batch_size:
+            product_dbio.model.objects.bulk_create(batch, ignore_conflicts=True)
+            seeded_count += len(batch)
+            batch = []
+    
+    if batch:
+        product_dbio.model.objects.bulk_create(batch, ignore_conflicts=True)
+        seeded_count += len(batch)
+    
+    return seeded_count
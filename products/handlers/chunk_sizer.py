@@ -0,0 +1,49 @@
+import os
+import resource
+import sys
+
+from products.constants import ProductConstants
+
+
+def get_current_rss_mb():
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_peak_rss_mb():
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss / (1024 * 1024)
+    return peak_rss / 1024
+
+
+class AdaptiveChunkSizer:
+    
+    def __init__(self, chunk_size=None, enabled=None):
+        self.enabled = ProductConstants.ADAPTIVE_CHUNK_SIZING if enabled is None else enabled
+        self.min_chunk_size = ProductConstants.CHUNK_SIZE_MIN
+        self.max_chunk_size = ProductConstants.CHUNK_SIZE_MAX
+        self.chunk_size = self._clamp(chunk_size or ProductConstants.CSV_CHUNK_SIZE)
+    
+    def record_chunk(self, row_count, db_seconds):
+        if not self.enabled:
+            return self.chunk_size
+        
+        rss_mb = get_current_rss_mb()
+        if (db_seconds > ProductConstants.CHUNK_TARGET_DB_SECONDS or
+                (rss_mb is not None and rss_mb > ProductConstants.CHUNK_MAX_RSS_MB)):
+            self.chunk_size = self._clamp(
+                int(self.chunk_size * ProductConstants.CHUNK_SIZE_DECREASE_FACTOR)
+            )
+        elif (row_count >= self.chunk_size and
+                db_seconds < ProductConstants.CHUNK_TARGET_DB_SECONDS / 2):
+            self.chunk_size = self._clamp(self.chunk_size + ProductConstants.CHUNK_SIZE_INCREASE_STEP)
+        
+        return self.chunk_size
+    
+    def _clamp(self, chunk_size):
+        return max(self.min_chunk_size, min(self.max_chunk_size, chunk_size))
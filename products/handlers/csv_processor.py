@@ -1,213 +1,595 @@
-import csv
 import os
+import time
+import uuid
 
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
 from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Least
 from django.utils import timezone
 
-from products.choices import ImportJobStatuses, WebhookEventTypes
+from base.choices import StateStatuses
+from products.choices import DuplicatePolicies, ImportJobStatuses, RejectReasons, WebhookEventTypes
 from products.constants import ImportJobConstants, ProductConstants
 from products.dbio import ImportJobDbIO, ProductDbIO
+from products.exceptions import ImportJobOwnershipLostError
+from products.handlers.batch_validator import validate_product_batch
+from products.handlers.chunk_sizer import AdaptiveChunkSizer
+from products.handlers.csv_stream import split_csv_byte_ranges
+from products.handlers.duplicate_filter import (
+    DuplicateSkuFilter,
+    load_range_duplicates,
+    plan_range_duplicates,
+    remove_duplicate_plans
+)
+from products.handlers.full_sync import FullSyncHandler
+from products.handlers.import_admission import ImportAdmissionPolicy
+from products.handlers.import_job_handler import ImportJobHandler
+from products.handlers.product_cache import ProductResponseCache
+from products.handlers.product_counts import ProductStateCounter
+from products.handlers.product_upsert import DryRunProductDiffEngine, get_product_upsert_engine
+from products.handlers.progress_cache import ImportProgressCache
+from products.handlers.rejects_writer import RejectsWriter, build_rejects_file_path
+from products.handlers.readers import open_import_reader
+from products.handlers.sku_index import ProductSkuIndex
+from products.handlers.stage_metrics import ImportStageMetrics
+from products.models import Product
 
 
 class CsvProcessor:
+    COUNTER_FIELDS = (
+        'processed_records',
+        'successful_records',
+        'failed_records',
+        'duplicate_records',
+        'created_records',
+        'updated_records',
+        'unchanged_records',
+    )
+    CHECKPOINT_FIELDS = (
+        'total_records',
+        'checkpoint_offset',
+        'checkpoint_records',
+        'reject_reason_counts',
+        'rejects_file_path',
+        'rejects_file_size',
+        'chunk_size',
+        'batch_size',
+        'updated_at',
+        *COUNTER_FIELDS,
+    )
+    THROTTLED_PROGRESS_FIELDS = (
+        'progress',
+        'stage_metrics',
+    )
+    PROGRESS_FIELDS = (
+        *THROTTLED_PROGRESS_FIELDS,
+        *CHECKPOINT_FIELDS,
+    )
     
     def __init__(self, import_job_uuid):
         self.import_job_uuid = import_job_uuid
         self.import_job_dbio = ImportJobDbIO()
-        self.product_dbio = ProductDbIO()
+        self.upsert_engine = get_product_upsert_engine()
         self.import_job = None
+        self.file_size = 0
+        self.rows_read = 0
+        self.persist_progress = True
+        self.chunks_processed = 0
+        self.stage_metrics = ImportStageMetrics()
+        self.progress_persisted_at = None
+        self.progress_cache = ImportProgressCache()
+        self.rejects_writer = None
+        self.pending_rejects = []
+        self.duplicate_filter = None
+        self.reported_counters = {}
     
     def process_csv_file(self, file_path):
+        if not self._start_processing(file_path):
+            return
+        
+        try:
+            self._build_sku_index()
+            self._prepare_duplicate_filter(file_path, self.import_job.checkpoint_offset)
+            self._process_in_chunks(
+                file_path,
+                start_offset=self.import_job.checkpoint_offset or None
+            )
+            self._complete_import()
+        except ImportJobOwnershipLostError:
+            return
+        except SoftTimeLimitExceeded:
+            raise
+        except Exception as e:
+            self._handle_processing_error(str(e))
+            self._trigger_import_failed_webhook(str(e))
+            raise
+        finally:
+            if self.import_job.status in ImportJobStatuses.TERMINAL_STATUSES:
+                self._remove_file(file_path)
+    
+    def start_parallel_import(self, file_path):
+        if not self._start_processing(file_path):
+            return None
+        
+        try:
+            with open_import_reader(file_path) as reader:
+                if not reader.supports_byte_ranges:
+                    return [(0, None)]
+            
+            range_count = min(
+                ProductConstants.PARALLEL_IMPORT_MAX_RANGES,
+                max(1, settings.IMPORT_WORKER_CONCURRENCY),
+                max(1, self.file_size // ProductConstants.PARALLEL_IMPORT_MIN_RANGE_SIZE)
+            )
+            byte_ranges = split_csv_byte_ranges(file_path, range_count)
+            if len(byte_ranges) > 1:
+                self._plan_range_duplicates(file_path, byte_ranges)
+            return byte_ranges
+        except Exception as e:
+            self.fail_parallel_import(str(e), file_path)
+            raise
+    
+    def process_csv_range(self, file_path, start_offset, end_offset):
+        self.import_job = self.import_job_dbio.get_obj({
+            'uuid': self.import_job_uuid
+            })
+        self.persist_progress = False
+        self._use_dry_run_engine()
+        for field in self.COUNTER_FIELDS:
+            setattr(self.import_job, field, 0)
+        self.import_job.reject_reason_counts = {}
+        self.rejects_writer = RejectsWriter(
+            build_rejects_file_path(self.import_job_uuid, part=start_offset),
+            include_header=False
+        )
+        self.rejects_writer.truncate(0)
+        
+        self.duplicate_filter = DuplicateSkuFilter(
+            self.import_job.duplicate_policy,
+            load_range_duplicates(file_path, start_offset)
+        )
+        self._process_in_chunks(file_path, start_offset, end_offset)
+        self._report_range_progress(force=True)
+        
+        range_result = {
+            field: getattr(self.import_job, field) for field in self.COUNTER_FIELDS
+        }
+        range_result['rows_read'] = self.rows_read
+        range_result['chunk_size'] = self.import_job.chunk_size
+        range_result['batch_size'] = self.import_job.batch_size
+        range_result['stage_metrics'] = self.stage_metrics.to_dict()
+        range_result['reject_reason_counts'] = self.import_job.reject_reason_counts
+        range_result['rejects_file_path'] = (
+            self.rejects_writer.file_path if self.rejects_writer.size else None
+        )
+        return range_result
+    
+    def finalize_parallel_import(self, range_results, file_path):
         self.import_job = self.import_job_dbio.get_obj({
             'uuid': self.import_job_uuid
             })
         
+        try:
+            for field in self.COUNTER_FIELDS:
+                setattr(self.import_job, field, sum(r[field] for r in range_results))
+            self.rows_read = sum(r['rows_read'] for r in range_results)
+            self.import_job.chunk_size = max(
+                (r['chunk_size'] for r in range_results), default=self.import_job.chunk_size
+            )
+            self.import_job.batch_size = max(
+                (r['batch_size'] for r in range_results), default=self.import_job.batch_size
+            )
+            self.stage_metrics = ImportStageMetrics(self.import_job.stage_metrics)
+            for range_result in range_results:
+                self.stage_metrics.merge(range_result['stage_metrics'])
+            self._merge_range_rejects(range_results)
+            self._complete_import()
+        except Exception as e:
+            self._handle_processing_error(str(e))
+            self._trigger_import_failed_webhook(str(e))
+            raise
+        finally:
+            self._remove_file(file_path)
+            remove_duplicate_plans(file_path)
+    
+    def _merge_range_rejects(self, range_results):
+        reject_reason_counts = {}
+        for range_result in range_results:
+            for reason, count in range_result['reject_reason_counts'].items():
+                reject_reason_counts[reason] = reject_reason_counts.get(reason, 0) + count
+        self.import_job.reject_reason_counts = reject_reason_counts
+        
+        part_paths = [r['rejects_file_path'] for r in range_results if r['rejects_file_path']]
+        if part_paths:
+            self.rejects_writer = RejectsWriter(build_rejects_file_path(self.import_job_uuid))
+            self.rejects_writer.merge(part_paths)
+            self.import_job.rejects_file_path = self.rejects_writer.file_path
+            self.import_job.rejects_file_size = self.rejects_writer.size
+    
+    def fail_parallel_import(self, error_message, file_path):
+        if self.import_job is None:
+            self.import_job = self.import_job_dbio.get_obj({
+                'uuid': self.import_job_uuid
+                })
+        
+        self._handle_processing_error(error_message)
+        self._trigger_import_failed_webhook(error_message)
+        self._remove_file(file_path)
+        remove_duplicate_plans(file_path)
+    
+    def _start_processing(self, file_path):
+        if not self._claim_job():
+            return False
+        
+        self._use_dry_run_engine()
+        
         if not os.path.exists(file_path):
-            error_msg = f"CSV file not found at path: {file_path}"
+            error_msg = f"Import file not found at path: {file_path}"
             self._handle_processing_error(error_msg)
             self._trigger_import_failed_webhook(error_msg)
             raise FileNotFoundError(error_msg)
         
-        self._update_job_status(ImportJobStatuses.PROCESSING)
-        self.import_job.started_at = timezone.now()
-        self.import_job.save(update_fields=['status', 'started_at'])
+        self.stage_metrics = ImportStageMetrics(self.import_job.stage_metrics)
+        self._publish_progress()
         
         try:
-            total_records = self._count_csv_rows(file_path)
-            self.import_job.total_records = total_records
-            self.import_job.save(update_fields=['total_records'])
+            self.file_size = self.import_job.file_size or os.path.getsize(file_path)
+            self.rows_read = self.import_job.checkpoint_records
+            self.rejects_writer = RejectsWriter(build_rejects_file_path(self.import_job_uuid))
+            self.rejects_writer.truncate(self.import_job.rejects_file_size)
             
-            self._process_csv_in_chunks(file_path)
+            if self.import_job.checkpoint_offset:
+                return True
             
-            self._update_job_status(ImportJobStatuses.COMPLETED)
-            self.import_job.completed_at = timezone.now()
-            self.import_job.save(update_fields=['status', 'completed_at'])
-            
-            self._trigger_import_completed_webhook()
+            with open_import_reader(file_path) as reader:
+                total_records, is_estimated = reader.count_records(
+                    estimate=ProductConstants.CSV_ESTIMATE_TOTAL_RECORDS
+                )
             
+            if total_records is not None:
+                self.import_job.total_records = total_records
+                self.import_job.total_records_estimated = is_estimated
+                self.import_job.save(
+                    update_fields=['total_records', 'total_records_estimated']
+                )
+                self._publish_progress()
         except Exception as e:
             self._handle_processing_error(str(e))
             self._trigger_import_failed_webhook(str(e))
+            self._remove_file(file_path)
             raise
-        finally:
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception:
-                    pass
-    
-    def _count_csv_rows(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            return sum(1 for _ in reader)
-    
-    def _process_csv_in_chunks(self, file_path):
-        chunk_size = ProductConstants.CSV_CHUNK_SIZE
-        chunk = []
-        processed_count = 0
-        progress_update_interval = ProductConstants.PROGRESS_UPDATE_INTERVAL
-        
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row in reader:
-                processed_row = self._process_row(row)
-                if processed_row:
-                    chunk.append(processed_row)
-                
-                if len(chunk) >= chunk_size:
-                    self._bulk_upsert_products(chunk)
-                    processed_count += len(chunk)
-                    
-                    if processed_count % progress_update_interval == 0:
-                        self._update_progress(processed_count)
-                    
-                    chunk = []
-            
-            if chunk:
-                self._bulk_upsert_products(chunk)
-                processed_count += len(chunk)
-            
-            self._update_progress(processed_count)
+        
+        return True
     
-    def _process_row(self, row):
-        try:
-            sku = row.get('sku', '').strip()
-            name = row.get('name', '').strip()
-            description = row.get('description', '').strip() or None
-            
-            if not sku or not name:
-                self.import_job.failed_records += 1
-                return None
-            
-            if len(sku) > ProductConstants.SKU_MAX_LENGTH:
-                self.import_job.failed_records += 1
-                return None
-            
-            if len(name) > ProductConstants.PRODUCT_NAME_MAX_LENGTH:
-                self.import_job.failed_records += 1
-                return None
-            
-            if description and len(description) > ProductConstants.DESCRIPTION_MAX_LENGTH:
-                description = description[:ProductConstants.DESCRIPTION_MAX_LENGTH]
+    @transaction.atomic
+    def _claim_job(self):
+        self.import_job = self.import_job_dbio.filter_obj({
+            'uuid': self.import_job_uuid
+            }).select_for_update().get()
+        
+        if self.import_job.status in ImportJobStatuses.TERMINAL_STATUSES:
+            return False
+        if ImportAdmissionPolicy().is_held_by_worker(self.import_job):
+            return False
+        
+        self.import_job.status = ImportJobStatuses.PROCESSING
+        self.import_job.started_at = self.import_job.started_at or timezone.now()
+        self.import_job.worker_token = uuid.uuid4()
+        self.import_job.save(update_fields=['status', 'started_at', 'worker_token', 'updated_at'])
+        return True
+    
+    def release_job(self):
+        if self.import_job is None or self.import_job.worker_token is None:
+            return
+        self.import_job_dbio.filter_obj({
+            'uuid': self.import_job_uuid,
+            'worker_token': self.import_job.worker_token,
+        }).update(worker_token=None)
+        self.import_job.worker_token = None
+    
+    def _lock_job(self):
+        is_owner = self.import_job_dbio.filter_obj({
+            'uuid': self.import_job_uuid,
+            'worker_token': self.import_job.worker_token,
+        }).select_for_update().exists()
+        if not is_owner:
+            raise ImportJobOwnershipLostError(
+                f"Import job {self.import_job_uuid} was claimed by another worker"
+            )
+    
+    def _use_dry_run_engine(self):
+        if self.import_job.dry_run:
+            self.upsert_engine = DryRunProductDiffEngine()
+    
+    def _build_sku_index(self):
+        if (not ProductConstants.SKU_INDEX_ENABLED or
+                not hasattr(self.upsert_engine, 'sku_index') or
+                self.import_job.total_records < ProductConstants.SKU_INDEX_MIN_IMPORT_RECORDS):
+            return
+        
+        if ProductStateCounter().total() > ProductConstants.SKU_INDEX_MAX_CATALOG_SIZE:
+            return
+        
+        with self.stage_metrics.measure('sku_index'):
+            self.upsert_engine.sku_index = ProductSkuIndex.build()
+    
+    def _prepare_duplicate_filter(self, file_path, start_position):
+        self.duplicate_filter = DuplicateSkuFilter(self.import_job.duplicate_policy)
+        if start_position:
+            with self.stage_metrics.measure('duplicate_scan'):
+                self.duplicate_filter.prepare(file_path, start_position)
+    
+    def _plan_range_duplicates(self, file_path, byte_ranges):
+        with self.stage_metrics.measure('duplicate_scan'):
+            plan_range_duplicates(file_path, byte_ranges, self.import_job.duplicate_policy)
+        self.import_job.stage_metrics = self.stage_metrics.to_dict()
+        self.import_job.save(update_fields=['stage_metrics', 'updated_at'])
+    
+    def _complete_import(self):
+        if self.import_job.full_sync:
+            with self.stage_metrics.measure('full_sync'):
+                deactivated_count, reactivated_count = FullSyncHandler(self.import_job).apply()
+            self.import_job.deactivated_records = deactivated_count
+            self.import_job.reactivated_records = reactivated_count
+        
+        self.import_job.status = ImportJobStatuses.COMPLETED
+        self.import_job.total_records = self.rows_read
+        self.import_job.total_records_estimated = False
+        self.import_job.progress = ImportJobConstants.PROGRESS_MAX
+        self.import_job.completed_at = timezone.now()
+        self.import_job.stage_metrics = self.stage_metrics.to_dict()
+        self.import_job.save(update_fields=[
+            'status', 'total_records_estimated', 'completed_at',
+            'deactivated_records', 'reactivated_records', *self.PROGRESS_FIELDS
+        ])
+        self._publish_progress()
+        
+        self._trigger_import_completed_webhook()
+    
+    def _remove_file(self, file_path):
+        if os.path.exists(file_path):
+            try:
+                os.remove(file_path)
+            except Exception:
+                pass
+    
+    def _process_in_chunks(self, file_path, start_offset=None, end_offset=None):
+        chunk_sizer = AdaptiveChunkSizer(self.import_job.chunk_size)
+        self.upsert_engine.max_batch_size = chunk_sizer.chunk_size
+        self.upsert_engine.stage_metrics = self.stage_metrics
+        
+        with open_import_reader(file_path, chunk_sizer.chunk_size, chunk_sizer.max_chunk_size) as reader:
+            batches = reader.iter_batches(start_offset, end_offset)
             
-            return {
-                'sku': sku.lower(),
-                'name': name,
-                'description': description,
-            }
-        except Exception:
-            self.import_job.failed_records += 1
-            return None
+            while True:
+                with self.stage_metrics.measure('read'):
+                    batch = next(batches, None)
+                if batch is None:
+                    break
+                
+                columns, row_count = batch
+                self.stage_metrics.add_rows('read', row_count)
+                self.rows_read += row_count
+                self.chunks_processed += 1
+                
+                with self.stage_metrics.measure('validate', row_count):
+                    products_data, overwriting_products, rejected_skus = self._validate_batch(columns)
+                
+                started_at = time.perf_counter()
+                with self.stage_metrics.measure('commit', len(products_data)):
+                    self._commit_chunk(
+                        products_data, overwriting_products, rejected_skus,
+                        reader.position, reader.progress_offset()
+                    )
+                self._resize_chunks(chunk_sizer, reader, row_count, time.perf_counter() - started_at)
+                if not self.persist_progress:
+                    self._report_range_progress()
     
-    @transaction.atomic
-    def _bulk_upsert_products(self, products_data):
-        if not products_data:
+    def _report_range_progress(self, force=False):
+        now = time.monotonic()
+        if (not force and self.progress_persisted_at is not None and
+                now - self.progress_persisted_at < ProductConstants.PROGRESS_UPDATE_TIME_INTERVAL):
             return
+        self.progress_persisted_at = now
         
-        deduplicated_data = {}
-        for product_data in products_data:
-            sku = product_data['sku']
-            deduplicated_data[sku] = product_data
+        deltas = {
+            field: getattr(self.import_job, field) - self.reported_counters.get(field, 0)
+            for field in self.COUNTER_FIELDS
+        }
+        if not any(deltas.values()):
+            return
+        
+        rows_done = (
+            F('processed_records') + F('failed_records') + F('duplicate_records') +
+            deltas['processed_records'] + deltas['failed_records'] + deltas['duplicate_records']
+        )
+        import_jobs = self.import_job_dbio.filter_obj({'uuid': self.import_job_uuid})
+        import_jobs.update(
+            progress=Least(
+                Value(ImportJobConstants.PROGRESS_MAX - 1),
+                rows_done * ImportJobConstants.PROGRESS_MAX / Greatest(F('total_records'), Value(1))
+            ),
+            updated_at=timezone.now(),
+            **{field: F(field) + delta for field, delta in deltas.items() if delta}
+        )
+        self.reported_counters = {field: getattr(self.import_job, field) for field in self.COUNTER_FIELDS}
+        self.progress_cache.set(
+            self.import_job_uuid,
+            ImportJobHandler().serialize_job(import_jobs.get())
+        )
+    
+    def _resize_chunks(self, chunk_sizer, reader, row_count, db_seconds):
+        self.import_job.chunk_size = reader.batch_size
+        self.import_job.batch_size = self.upsert_engine.batch_size
+        
+        reader.batch_size = chunk_sizer.record_chunk(row_count, db_seconds)
+        self.upsert_engine.max_batch_size = reader.batch_size
+    
+    def _validate_batch(self, columns):
+        products_data, rejected_rows = validate_product_batch(columns)
+        products_data, overwriting_products, duplicate_products = self.duplicate_filter.split(products_data)
+        self.import_job.duplicate_records += len(overwriting_products) + len(duplicate_products)
+        if duplicate_products and self.import_job.duplicate_policy == DuplicatePolicies.REJECT:
+            rejected_rows.extend(
+                [p['sku'], p['name'], p['description'] or '', RejectReasons.DUPLICATE_SKU]
+                for p in duplicate_products
+            )
+        
+        if not rejected_rows:
+            return products_data, overwriting_products, set()
+        
+        self._record_rejects(rejected_rows)
+        if not self.import_job.full_sync:
+            return products_data, overwriting_products, set()
+        return products_data, overwriting_products, self._get_rejected_skus(rejected_rows)
+    
+    def _record_seen_skus(self, skus):
+        with self.stage_metrics.measure('seen_skus', len(skus)):
+            FullSyncHandler(self.import_job).record_seen_skus(skus)
+    
+    def _get_rejected_skus(self, rejected_rows):
+        rejected_skus = set()
+        for rejected_row in rejected_rows:
+            sku = (rejected_row[0] or '').strip()
+            if sku and len(sku) <= ProductConstants.SKU_MAX_LENGTH:
+                rejected_skus.add(sku.lower())
+        return rejected_skus
+    
+    def _record_rejects(self, rejected_rows):
+        self.import_job.failed_records += len(rejected_rows)
         
-        products_data = list(deduplicated_data.values())
+        reject_reason_counts = self.import_job.reject_reason_counts
+        for rejected_row in rejected_rows:
+            reason = rejected_row[-1]
+            reject_reason_counts[reason] = reject_reason_counts.get(reason, 0) + 1
+        
+        self.pending_rejects.extend(rejected_rows)
+    
+    def _write_rejects(self):
+        if not self.pending_rejects:
+            return
         
-        existing_skus = set()
-        existing_products = {}
+        self.rejects_writer.write(self.pending_rejects)
+        self.import_job.rejects_file_path = self.rejects_writer.file_path
+        self.import_job.rejects_file_size = self.rejects_writer.size
+        self.pending_rejects = []
+    
+    @transaction.atomic
+    def _commit_chunk(self, products_data, overwriting_products, rejected_skus,
+                      checkpoint_offset, progress_offset):
+        if self.persist_progress:
+            self._lock_job()
+        self._write_rejects()
         
-        skus = [p['sku'] for p in products_data]
-        existing_products_qs = self.product_dbio.filter_obj({'sku__in': skus}).only('sku', 'name', 'description')
+        with self.stage_metrics.measure('upsert', len(products_data) + len(overwriting_products)):
+            created_count, changed_count = self._bulk_upsert_products(products_data, overwriting_products)
         
-        for product in existing_products_qs:
-            existing_skus.add(product.sku)
-            existing_products[product.sku] = product
+        if self.import_job.full_sync:
+            self._record_seen_skus(
+                rejected_skus.union(product_data['sku'] for product_data in products_data)
+            )
         
-        products_to_create = []
-        products_to_update = []
-        current_time = timezone.now()
+        if self.persist_progress:
+            self._save_checkpoint(checkpoint_offset, progress_offset)
         
-        for product_data in products_data:
-            sku = product_data['sku']
-            if sku in existing_skus:
-                existing_product = existing_products[sku]
-                existing_product.name = product_data['name']
-                existing_product.description = product_data['description']
-                existing_product.updated_at = current_time
-                products_to_update.append(existing_product)
+        if self.import_job.dry_run:
+            return
+        if created_count:
+            ProductStateCounter().adjust({StateStatuses.ACTIVE: created_count})
+        if changed_count:
+            ProductResponseCache().bump_version_on_commit()
+    
+    def _save_checkpoint(self, checkpoint_offset, progress_offset):
+        with self.stage_metrics.measure('checkpoint'):
+            self._update_progress(progress_offset)
+            self.import_job.checkpoint_offset = checkpoint_offset
+            self.import_job.checkpoint_records = self.rows_read
+            
+            now = time.monotonic()
+            if (self.progress_persisted_at is None or
+                    now - self.progress_persisted_at >= ProductConstants.PROGRESS_UPDATE_TIME_INTERVAL):
+                self.import_job.stage_metrics = self.stage_metrics.to_dict()
+                self.import_job.save(update_fields=list(self.PROGRESS_FIELDS))
+                self.progress_persisted_at = now
+                transaction.on_commit(self._publish_progress)
             else:
-                product = self.product_dbio.model(**product_data)
-                product.created_at = current_time
-                product.updated_at = current_time
-                products_to_create.append(product)
-        
-        if products_to_create:
-            batch_size = ProductConstants.BULK_CREATE_BATCH_SIZE
-            for i in range(0, len(products_to_create), batch_size):
-                batch = products_to_create[i:i + batch_size]
-                self.product_dbio.model.objects.bulk_create(
-                    batch,
-                    ignore_conflicts=True
-                )
-            self.import_job.successful_records += len(products_to_create)
-        
-        if products_to_update:
-            batch_size = ProductConstants.BULK_UPDATE_BATCH_SIZE
-            for i in range(0, len(products_to_update), batch_size):
-                batch = products_to_update[i:i + batch_size]
-                self.product_dbio.model.objects.bulk_update(
-                    batch,
-                    ['name', 'description', 'updated_at']
-                )
-            self.import_job.successful_records += len(products_to_update)
+                self.import_job.save(update_fields=list(self.CHECKPOINT_FIELDS))
+    
+    def flush_progress(self):
+        if self.import_job is None or self.import_job.worker_token is None:
+            return
+        self.import_job.stage_metrics = self.stage_metrics.to_dict()
+        self.import_job_dbio.filter_obj({
+            'uuid': self.import_job_uuid,
+            'worker_token': self.import_job.worker_token,
+        }).update(
+            updated_at=timezone.now(),
+            **{field: getattr(self.import_job, field) for field in self.THROTTLED_PROGRESS_FIELDS}
+        )
+        self._publish_progress()
+    
+    def _bulk_upsert_products(self, products_data, overwriting_products=()):
+        created_count, updated_count = self._upsert_products(products_data)
+        unchanged_count = len(products_data) - created_count - updated_count
         
+        self.import_job.created_records += created_count
+        self.import_job.updated_records += updated_count
+        self.import_job.unchanged_records += unchanged_count
+        self.import_job.successful_records += len(products_data)
         self.import_job.processed_records += len(products_data)
-        self.import_job.save(
-            update_fields=['successful_records', 'processed_records']
-        )
+        
+        if overwriting_products:
+            overwrite_created_count, overwrite_updated_count = self._upsert_products(overwriting_products)
+            if self.import_job.dry_run:
+                overwrite_created_count, overwrite_updated_count = (
+                    0, overwrite_created_count + overwrite_updated_count
+                )
+            self.import_job.created_records += overwrite_created_count
+            self.import_job.updated_records += overwrite_updated_count
+            created_count += overwrite_created_count
+            updated_count += overwrite_updated_count
+        return created_count, created_count + updated_count
+    
+    def _upsert_products(self, products_data):
+        if not products_data:
+            return 0, 0
+        
+        for product_data in products_data:
+            product_data['content_hash'] = Product.build_content_hash(
+                product_data['name'], product_data['description']
+            )
+        return self.upsert_engine.upsert(products_data)
     
-    def _update_progress(self, processed_count):
-        if self.import_job.total_records > 0:
+    def _update_progress(self, progress_offset):
+        if self.file_size > 0:
             progress = int(
-                (processed_count / self.import_job.total_records) * 
+                (progress_offset / self.file_size) *
                 ImportJobConstants.PROGRESS_MAX
             )
             self.import_job.progress = min(progress, ImportJobConstants.PROGRESS_MAX)
-            self.import_job.save(update_fields=['progress'])
+        self.import_job.total_records = max(self.import_job.total_records, self.rows_read)
     
-    def _update_job_status(self, status):
-        self.import_job.status = status
-        self.import_job.save(update_fields=['status'])
+    def _publish_progress(self):
+        self.progress_cache.set(
+            self.import_job_uuid,
+            ImportJobHandler().serialize_job(self.import_job)
+        )
     
     def _handle_processing_error(self, error_message):
         self.import_job.status = ImportJobStatuses.FAILED
         self.import_job.error_message = error_message
         self.import_job.completed_at = timezone.now()
+        self.import_job.stage_metrics = self.stage_metrics.to_dict()
         self.import_job.save(
-            update_fields=['status', 'error_message', 'completed_at']
+            update_fields=['status', 'error_message', 'completed_at', 'stage_metrics']
         )
+        if self.import_job.full_sync:
+            FullSyncHandler(self.import_job).clear()
+        self._publish_progress()
     
     def _trigger_import_completed_webhook(self):
-        from products.handlers.import_job_handler import ImportJobHandler
         from products.tasks import trigger_webhooks_for_event
         
         job_data = ImportJobHandler().get_job_status(str(self.import_job.uuid))
@@ -217,7 +599,6 @@ class CsvProcessor:
         )
     
     def _trigger_import_failed_webhook(self, error_message):
-        from products.handlers.import_job_handler import ImportJobHandler
         from products.tasks import trigger_webhooks_for_event
         
         job_data = ImportJobHandler().get_job_status(str(self.import_job.uuid))
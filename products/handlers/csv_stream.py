@@ -0,0 +1,236 @@
+import bz2
+import csv
+import gzip
+import io
+import itertools
+import os
+from operator import itemgetter
+
+import zstandard
+
+from products.choices import CompressionFormats
+from products.constants import ProductConstants
+
+
+COMPRESSION_MAGIC_NUMBERS = {
+    CompressionFormats.GZIP: b'\x1f\x8b',
+    CompressionFormats.BZIP2: b'BZh',
+    CompressionFormats.ZSTD: b'\x28\xb5\x2f\xfd',
+}
+
+
+def detect_compression(file_prefix):
+    for compression, magic_number in COMPRESSION_MAGIC_NUMBERS.items():
+        if file_prefix.startswith(magic_number):
+            return compression
+    return CompressionFormats.NONE
+
+
+def open_decompressed_stream(binary_file, compression):
+    if compression == CompressionFormats.GZIP:
+        return gzip.GzipFile(fileobj=binary_file, mode='rb')
+    if compression == CompressionFormats.BZIP2:
+        return bz2.BZ2File(binary_file, mode='rb')
+    if compression == CompressionFormats.ZSTD:
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(
+                binary_file,
+                read_size=ProductConstants.CSV_DECOMPRESSION_READ_SIZE,
+                closefd=False
+            )
+        )
+    return binary_file
+
+
+def decompress_prefix(data, max_size):
+    compression = detect_compression(data)
+    if compression == CompressionFormats.NONE:
+        return data[:max_size]
+    
+    stream = open_decompressed_stream(io.BytesIO(data), compression)
+    prefix = b''
+    try:
+        while len(prefix) < max_size and b'\n' not in prefix:
+            block = stream.read(ProductConstants.CSV_DECOMPRESSION_READ_SIZE)
+            if not block:
+                break
+            prefix += block
+    except (EOFError, OSError, zstandard.ZstdError):
+        pass
+    return prefix[:max_size]
+
+
+class CsvFile:
+    
+    def __init__(self, file_path):
+        self.raw_file = open(file_path, 'rb')
+        self.compression = detect_compression(self.raw_file.read(4))
+        self.raw_file.seek(0)
+        self.stream = open_decompressed_stream(self.raw_file, self.compression)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @property
+    def is_compressed(self):
+        return self.compression != CompressionFormats.NONE
+    
+    def skip_to(self, offset, current_offset):
+        if not self.is_compressed:
+            self.stream.seek(offset)
+            return
+        
+        remaining = offset - current_offset
+        while remaining > 0:
+            block = self.stream.read(min(remaining, ProductConstants.CSV_DECOMPRESSION_READ_SIZE))
+            if not block:
+                break
+            remaining -= len(block)
+    
+    def progress_offset(self, bytes_read):
+        if self.is_compressed:
+            return self.raw_file.tell()
+        return bytes_read
+    
+    def close(self):
+        if self.stream is not self.raw_file:
+            self.stream.close()
+        self.raw_file.close()
+
+
+def is_compressed_csv(file_path):
+    with open(file_path, 'rb') as csvfile:
+        return detect_compression(csvfile.read(4)) != CompressionFormats.NONE
+
+
+class CsvLineStream:
+    
+    def __init__(self, binary_file, encoding='utf-8', start_offset=0, end_offset=None, max_bytes=None):
+        self.binary_file = binary_file
+        self.encoding = encoding
+        self.bytes_read = start_offset
+        self.end_offset = end_offset
+        self.max_bytes = max_bytes
+    
+    def __iter__(self):
+        if self.end_offset is not None and self.bytes_read >= self.end_offset:
+            return
+        
+        for line in self.binary_file:
+            self.bytes_read += len(line)
+            if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+                raise ValueError(
+                    f"Decompressed CSV exceeds maximum allowed size of "
+                    f"{self.max_bytes / (1024 * 1024)} MB"
+                )
+            yield line.decode(self.encoding)
+            if self.end_offset is not None and self.bytes_read >= self.end_offset:
+                break
+
+
+def read_csv_header(csvfile):
+    line_stream = CsvLineStream(csvfile)
+    header = next(csv.reader(line_stream), None)
+    return header, line_stream.bytes_read
+
+
+def iter_csv_column_batches(reader, header, get_batch_size):
+    column_indexes = {name: index for index, name in enumerate(header or [])}
+    
+    while True:
+        rows = list(itertools.islice(reader, get_batch_size()))
+        if not rows:
+            return
+        
+        rows = [row for row in rows if row]
+        yield _rows_to_columns(rows, column_indexes), len(rows)
+
+
+def _rows_to_columns(rows, column_indexes):
+    shortest_row_length = min(map(len, rows), default=0)
+    columns = {}
+    
+    for field in ProductConstants.IMPORT_COLUMNS:
+        index = column_indexes.get(field)
+        if index is None:
+            columns[field] = [''] * len(rows)
+        elif index < shortest_row_length:
+            columns[field] = list(map(itemgetter(index), rows))
+        else:
+            columns[field] = [row[index] if index < len(row) else None for row in rows]
+    
+    return columns
+
+
+def split_csv_byte_ranges(file_path, range_count):
+    file_size = os.path.getsize(file_path)
+    
+    with open(file_path, 'rb') as csvfile:
+        _, header_size = read_csv_header(csvfile)
+        csvfile.seek(header_size)
+        
+        range_size = max(1, (file_size - header_size) // max(1, range_count))
+        boundaries = [header_size]
+        next_boundary = header_size + range_size
+        offset = header_size
+        in_quoted_field = False
+        
+        for line in csvfile:
+            offset += len(line)
+            if line.count(b'"') % 2:
+                in_quoted_field = not in_quoted_field
+            
+            if not in_quoted_field and next_boundary <= offset < file_size:
+                boundaries.append(offset)
+                next_boundary = offset + range_size
+    
+    boundaries.append(file_size)
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def read_file_sample(file_path, sample_size):
+    file_size = os.path.getsize(file_path)
+    
+    with CsvFile(file_path) as csv_file:
+        sample = csv_file.stream.read(sample_size)
+        if csv_file.is_compressed and sample:
+            file_size = int(file_size * len(sample) / max(1, csv_file.raw_file.tell()))
+    
+    return sample, file_size
+
+
+def estimate_csv_records(file_path, sample_size=None):
+    sample_size = sample_size or ProductConstants.CSV_ROW_ESTIMATE_SAMPLE_SIZE
+    sample, file_size = read_file_sample(file_path, sample_size)
+    
+    is_complete = len(sample) < sample_size
+    if not is_complete:
+        sample = sample[:sample.rfind(b'\n') + 1]
+    
+    line_stream = CsvLineStream(io.BytesIO(sample))
+    reader = csv.reader(line_stream)
+    
+    header = next(reader, None)
+    if header is None:
+        return 0
+    header_size = line_stream.bytes_read
+    
+    record_count = 0
+    try:
+        for _ in reader:
+            record_count += 1
+    except csv.Error:
+        pass
+    
+    if is_complete or record_count == 0:
+        return record_count
+    
+    bytes_per_record = (line_stream.bytes_read - header_size) / record_count
+    return int((file_size - header_size) / bytes_per_record)
@@ -1,34 +1,84 @@
-from products.choices import ImportJobStatuses
+import uuid
+
+from products.choices import DuplicatePolicies, ImportJobStatuses
 from products.dbio import ImportJobDbIO
 from products.handlers.file_handler import (
+    StagedUploadedFile,
     save_uploaded_file_to_temp, 
     validate_csv_file
 )
-from products.tasks import process_csv_import
+from products.tasks import enqueue_csv_import
 
 
 class CsvUploadHandler:
     
-    def upload_csv_file(self, uploaded_file):
-        validate_csv_file(uploaded_file)
+    def upload_csv_file(self, uploaded_file, parallel=False, retry_of=None, dry_run=False,
+                        full_sync=False, duplicate_policy=None):
+        import_job_dbio = ImportJobDbIO()
+        try:
+            duplicate_policy = self._validate_duplicate_policy(duplicate_policy)
+            retry_of = self._validate_retry_of(import_job_dbio, retry_of)
+        except ValueError:
+            if isinstance(uploaded_file, StagedUploadedFile):
+                uploaded_file.discard()
+            raise
         
-        temp_file_path = save_uploaded_file_to_temp(uploaded_file)
+        if isinstance(uploaded_file, StagedUploadedFile):
+            if uploaded_file.validation_error:
+                raise ValueError(uploaded_file.validation_error)
+            temp_file_path = uploaded_file.temporary_file_path()
+            checksum = uploaded_file.checksum
+        else:
+            validate_csv_file(uploaded_file)
+            temp_file_path, checksum = save_uploaded_file_to_temp(uploaded_file)
         
-        import_job_dbio = ImportJobDbIO()
         import_job = import_job_dbio.create_obj({
             'status': ImportJobStatuses.PENDING,
             'file_name': uploaded_file.name,
             'file_size': uploaded_file.size,
+            'file_checksum': checksum,
+            'file_path': temp_file_path,
+            'retry_of_id': retry_of,
+            'dry_run': dry_run,
+            'full_sync': full_sync,
+            'duplicate_policy': duplicate_policy,
             'total_records': 0,
             'progress': 0,
         })
         
-        process_csv_import.delay(str(import_job.uuid), temp_file_path)
+        enqueue_csv_import(
+            str(import_job.uuid),
+            temp_file_path,
+            import_job.file_size,
+            parallel=parallel
+        )
         
         return {
             'job_id': str(import_job.uuid),
             'status': import_job.status,
             'file_name': import_job.file_name,
             'file_size': import_job.file_size,
+            'file_checksum': import_job.file_checksum,
+            'retry_of': retry_of,
+            'dry_run': import_job.dry_run,
+            'full_sync': import_job.full_sync,
+            'duplicate_policy': import_job.duplicate_policy,
         }
-
+    
+    def _validate_duplicate_policy(self, duplicate_policy):
+        duplicate_policy = duplicate_policy or DuplicatePolicies.LAST_WINS
+        if duplicate_policy not in DuplicatePolicies.POLICIES:
+            raise ValueError(f"Invalid duplicate policy. Only {list(DuplicatePolicies.POLICIES)} are allowed")
+        return duplicate_policy
+    
+    def _validate_retry_of(self, import_job_dbio, retry_of):
+        if not retry_of:
+            return retry_of
+        
+        try:
+            retry_of = str(uuid.UUID(str(retry_of)))
+        except ValueError:
+            raise ValueError(f"Invalid import job ID: {retry_of}")
+        if not import_job_dbio.filter_obj({'uuid': retry_of}).exists():
+            raise ValueError(f"Import job with ID {retry_of} not found")
+        return retry_of
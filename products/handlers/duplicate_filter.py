@@ -0,0 +1,119 @@
+import glob
+import os
+from array import array
+
+from products.choices import DuplicatePolicies
+from products.handlers.batch_validator import iter_valid_skus
+from products.handlers.readers import open_import_reader
+from products.handlers.sku_index import SkuHashSet, hash_sku
+
+
+def build_duplicate_plan_path(file_path, part):
+    return f"{file_path}.duplicates_part{part}"
+
+
+def remove_duplicate_plans(file_path):
+    for plan_path in glob.glob(f"{glob.escape(file_path)}.duplicates_part*"):
+        try:
+            os.remove(plan_path)
+        except OSError:
+            pass
+
+
+def scan_sku_hashes(file_path, start_position=None, end_position=None):
+    sku_hashes = SkuHashSet()
+    with open_import_reader(file_path) as reader:
+        for columns, _ in reader.iter_batches(start_position, end_position):
+            for sku in iter_valid_skus(columns):
+                sku_hashes.add_hash(hash_sku(sku))
+    sku_hashes.flush()
+    return sku_hashes
+
+
+def plan_range_duplicates(file_path, byte_ranges, policy):
+    range_hashes = [scan_sku_hashes(file_path, start, end) for start, end in byte_ranges]
+    
+    ordered_ranges = list(enumerate(range_hashes))
+    if policy == DuplicatePolicies.LAST_WINS:
+        ordered_ranges.reverse()
+    
+    winning_hashes = SkuHashSet()
+    for index, sku_hashes in ordered_ranges:
+        losing_hashes = array('Q', (
+            sku_hash for sku_hash in sku_hashes.iter_hashes()
+            if winning_hashes.contains_hash(sku_hash)
+        ))
+        for sku_hash in sku_hashes.iter_hashes():
+            winning_hashes.add_hash(sku_hash)
+        winning_hashes.flush()
+        
+        start_offset = byte_ranges[index][0]
+        with open(build_duplicate_plan_path(file_path, start_offset), 'wb') as plan_file:
+            losing_hashes.tofile(plan_file)
+
+
+def load_range_duplicates(file_path, start_offset):
+    plan_path = build_duplicate_plan_path(file_path, start_offset)
+    losing_hashes = SkuHashSet()
+    if not os.path.exists(plan_path):
+        return losing_hashes
+    
+    hashes = array('Q')
+    with open(plan_path, 'rb') as plan_file:
+        hashes.frombytes(plan_file.read())
+    if hashes:
+        losing_hashes.runs.append(hashes)
+    return losing_hashes
+
+
+class DuplicateSkuFilter:
+    
+    def __init__(self, policy, excluded_skus=None):
+        self.policy = policy
+        self.seen_skus = SkuHashSet()
+        self.excluded_skus = excluded_skus or SkuHashSet()
+    
+    def prepare(self, file_path, start_position=None):
+        if start_position:
+            self.seen_skus = scan_sku_hashes(file_path, None, start_position)
+    
+    def split(self, products_data):
+        if self.policy == DuplicatePolicies.LAST_WINS:
+            return self._split_last_wins(products_data)
+        
+        unique_products = []
+        duplicate_products = []
+        
+        for product_data in products_data:
+            sku_hash = hash_sku(product_data['sku'])
+            if self.excluded_skus.contains_hash(sku_hash) or self.seen_skus.contains_hash(sku_hash):
+                duplicate_products.append(product_data)
+            else:
+                self.seen_skus.add_hash(sku_hash)
+                unique_products.append(product_data)
+        
+        return unique_products, [], duplicate_products
+    
+    def _split_last_wins(self, products_data):
+        last_products = {}
+        duplicate_products = []
+        
+        for product_data in products_data:
+            sku_hash = hash_sku(product_data['sku'])
+            if self.excluded_skus.contains_hash(sku_hash):
+                duplicate_products.append(product_data)
+                continue
+            if sku_hash in last_products:
+                duplicate_products.append(last_products[sku_hash])
+            last_products[sku_hash] = product_data
+        
+        unique_products = []
+        overwriting_products = []
+        for sku_hash, product_data in last_products.items():
+            if self.seen_skus.contains_hash(sku_hash):
+                overwriting_products.append(product_data)
+            else:
+                self.seen_skus.add_hash(sku_hash)
+                unique_products.append(product_data)
+        
+        return unique_products, overwriting_products, duplicate_products
@@ -1,42 +1,190 @@
+import csv
+import hashlib
 import os
-import tempfile
 import uuid
-from pathlib import Path
 
 from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
 
+from products.choices import ImportFileFormats
 from products.constants import ProductConstants
+from products.handlers.csv_stream import decompress_prefix
+from products.handlers.readers import validate_import_file_format
+
+
+def validate_csv_file_name(file_name):
+    return validate_import_file_format(file_name)
+
+
+def validate_csv_file_size(file_size):
+    if file_size > ProductConstants.CSV_MAX_FILE_SIZE:
+        raise ValueError(f"File size exceeds maximum allowed size of {ProductConstants.CSV_MAX_FILE_SIZE / (1024 * 1024)} MB")
+    
+    return True
+
+
+def validate_csv_header(header_line):
+    header = next(csv.reader([header_line.decode('utf-8')]), [])
+    missing_columns = [
+        column for column in ProductConstants.CSV_REQUIRED_COLUMNS
+        if column not in header
+    ]
+    
+    if missing_columns:
+        raise ValueError(f"CSV header is missing required columns: {', '.join(missing_columns)}")
+    
+    return True
 
 
 def validate_csv_file(uploaded_file):
     if not uploaded_file:
         raise ValueError("No file provided")
     
-    file_name = uploaded_file.name
-    file_extension = Path(file_name).suffix.lower()
-    
-    if file_extension not in ProductConstants.CSV_ALLOWED_EXTENSIONS:
-        raise ValueError(f"Invalid file type. Only {ProductConstants.CSV_ALLOWED_EXTENSIONS} are allowed")
-    
-    if uploaded_file.size > ProductConstants.CSV_MAX_FILE_SIZE:
-        raise ValueError(f"File size exceeds maximum allowed size of {ProductConstants.CSV_MAX_FILE_SIZE / (1024 * 1024)} MB")
+    validate_csv_file_name(uploaded_file.name)
+    validate_csv_file_size(uploaded_file.size)
     
     return True
 
 
-def save_uploaded_file_to_temp(uploaded_file):
-    validate_csv_file(uploaded_file)
-    
+def build_staged_file_path(file_name):
     temp_dir = os.path.join(settings.BASE_DIR, 'temp_csv_files')
     os.makedirs(temp_dir, exist_ok=True)
     
     unique_id = str(uuid.uuid4())
-    safe_filename = "".join(c for c in uploaded_file.name if c.isalnum() or c in (' ', '-', '_', '.')).strip()
-    temp_file_path = os.path.join(temp_dir, f"csv_import_{unique_id}_{safe_filename}")
+    safe_filename = "".join(c for c in file_name if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+    return os.path.join(temp_dir, f"csv_import_{unique_id}_{safe_filename}")
+
+
+def save_uploaded_file_to_temp(uploaded_file):
+    temp_file_path = build_staged_file_path(uploaded_file.name)
+    checksum = hashlib.sha256()
     
     with open(temp_file_path, 'wb+') as destination:
         for chunk in uploaded_file.chunks():
+            checksum.update(chunk)
             destination.write(chunk)
     
-    return temp_file_path
+    return temp_file_path, checksum.hexdigest()
+
+
+class StagedUploadedFile(UploadedFile):
+    
+    def __init__(self, staged_path, name, content_type, size, charset,
+                 checksum, validation_error=None, content_type_extra=None):
+        super().__init__(None, name, content_type, size, charset, content_type_extra)
+        self.staged_path = staged_path
+        self.checksum = checksum
+        self.validation_error = validation_error
+    
+    def temporary_file_path(self):
+        return self.staged_path
+    
+    def open(self, mode='rb'):
+        self.file = open(self.staged_path, mode)
+        return self
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+    
+    def discard(self):
+        self.close()
+        if self.staged_path and os.path.exists(self.staged_path):
+            os.remove(self.staged_path)
 
+
+class StagedCsvUploadHandler(FileUploadHandler):
+    chunk_size = ProductConstants.CSV_UPLOAD_CHUNK_SIZE
+    
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.staged_path = None
+        self.destination = None
+    
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.staged_path = None
+        self.destination = None
+        self.size = 0
+        self.checksum = hashlib.sha256()
+        self.header_buffer = b''
+        self.header_validated = False
+        self.validation_error = None
+        
+        try:
+            file_format = validate_csv_file_name(self.file_name)
+            self.header_validated = file_format != ImportFileFormats.CSV
+            self.staged_path = build_staged_file_path(self.file_name)
+            self.destination = open(self.staged_path, 'wb')
+        except ValueError as e:
+            self.validation_error = str(e)
+        
+        raise StopFutureHandlers()
+    
+    def receive_data_chunk(self, raw_data, start):
+        if self.validation_error:
+            return None
+        
+        try:
+            self.size += len(raw_data)
+            validate_csv_file_size(self.size)
+            
+            if not self.header_validated:
+                self._validate_header_chunk(raw_data)
+            
+            self.checksum.update(raw_data)
+            self.destination.write(raw_data)
+        except ValueError as e:
+            self.validation_error = str(e)
+            self._discard_staged_file()
+        
+        return None
+    
+    def file_complete(self, file_size):
+        if not self.validation_error and not self.header_validated:
+            try:
+                validate_csv_header(
+                    decompress_prefix(self.header_buffer, ProductConstants.CSV_HEADER_MAX_SIZE)
+                )
+            except ValueError as e:
+                self.validation_error = str(e)
+        
+        if self.validation_error:
+            self._discard_staged_file()
+        else:
+            self.destination.close()
+        
+        return StagedUploadedFile(
+            staged_path=self.staged_path,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=self.size,
+            charset=self.charset,
+            checksum=self.checksum.hexdigest(),
+            validation_error=self.validation_error,
+            content_type_extra=self.content_type_extra,
+        )
+    
+    def upload_interrupted(self):
+        self._discard_staged_file()
+    
+    def _validate_header_chunk(self, raw_data):
+        self.header_buffer += raw_data
+        header_data = decompress_prefix(self.header_buffer, ProductConstants.CSV_HEADER_MAX_SIZE)
+        line_end = header_data.find(b'\n')
+        
+        if line_end == -1:
+            if len(header_data) >= ProductConstants.CSV_HEADER_MAX_SIZE:
+                raise ValueError("CSV header line is too long")
+            return
+        
+        validate_csv_header(header_data[:line_end + 1])
+        self.header_validated = True
+        self.header_buffer = b''
+    
+    def _discard_staged_file(self):
+        if self.destination is not None:
+            self.destination.close()
+        if self.staged_path and os.path.exists(self.staged_path):
+            os.remove(self.staged_path)
@@ -0,0 +1,65 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from base.choices import StateStatuses
+from products.constants import ProductConstants
+from products.dbio import ImportSeenSkuDbIO, ProductDbIO
+from products.handlers.product_cache import ProductResponseCache
+from products.handlers.product_counts import ProductStateCounter
+
+
+class FullSyncHandler:
+    
+    def __init__(self, import_job):
+        self.import_job = import_job
+        self.seen_sku_dbio = ImportSeenSkuDbIO()
+        self.product_dbio = ProductDbIO()
+    
+    def record_seen_skus(self, skus):
+        self.seen_sku_dbio.model.objects.bulk_create(
+            [
+                self.seen_sku_dbio.model(import_job_id=self.import_job.pk, sku=sku)
+                for sku in skus
+            ],
+            batch_size=ProductConstants.BULK_CREATE_BATCH_SIZE,
+            ignore_conflicts=True
+        )
+    
+    def apply(self):
+        seen_skus = self.seen_sku_dbio.filter_obj({'import_job_id': self.import_job.pk})
+        if not seen_skus.exists():
+            raise ValueError("Full sync aborted: the file contained no valid products")
+        
+        is_seen = Exists(seen_skus.filter(sku=OuterRef('sku')))
+        products_to_deactivate = self.product_dbio.get_all_active().filter(~is_seen)
+        products_to_reactivate = self.product_dbio.filter_obj({
+            'state': StateStatuses.INACTIVE
+        }).filter(is_seen)
+        
+        if self.import_job.dry_run:
+            deactivated_count = products_to_deactivate.count()
+            reactivated_count = products_to_reactivate.count()
+        else:
+            current_time = timezone.now()
+            with transaction.atomic():
+                deactivated_count = products_to_deactivate.update(
+                    state=StateStatuses.INACTIVE,
+                    updated_at=current_time
+                )
+                reactivated_count = products_to_reactivate.update(
+                    state=StateStatuses.ACTIVE,
+                    updated_at=current_time
+                )
+                ProductStateCounter().adjust({
+                    StateStatuses.ACTIVE: reactivated_count - deactivated_count,
+                    StateStatuses.INACTIVE: deactivated_count - reactivated_count
+                })
+                if deactivated_count or reactivated_count:
+                    ProductResponseCache().bump_version_on_commit()
+        
+        self.clear()
+        return deactivated_count, reactivated_count
+    
+    def clear(self):
+        self.seen_sku_dbio.filter_obj({'import_job_id': self.import_job.pk}).delete()
@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from products.choices import CeleryQueues, ImportJobStatuses
+from products.constants import ImportJobConstants
+from products.dbio import ImportJobDbIO
+
+
+class ImportAdmissionPolicy:
+    
+    def __init__(self):
+        self.import_job_dbio = ImportJobDbIO()
+    
+    def is_small_import(self, file_size):
+        return file_size <= ImportJobConstants.SMALL_IMPORT_MAX_FILE_SIZE
+    
+    def get_queue(self, file_size):
+        if self.is_small_import(file_size):
+            return CeleryQueues.IMPORTS_SMALL
+        return CeleryQueues.IMPORTS
+    
+    def is_held_by_worker(self, import_job):
+        if import_job.status != ImportJobStatuses.PROCESSING or import_job.worker_token is None:
+            return False
+        
+        held_since = timezone.now() - timedelta(seconds=ImportJobConstants.PROCESSING_STALE_AFTER)
+        return import_job.updated_at >= held_since
+    
+    def can_start(self, import_job):
+        if import_job.status in ImportJobStatuses.TERMINAL_STATUSES:
+            return True
+        if self.is_held_by_worker(import_job):
+            return False
+        if self.is_small_import(import_job.file_size):
+            return True
+        if import_job.status == ImportJobStatuses.PROCESSING:
+            return True
+        
+        active_since = timezone.now() - timedelta(seconds=ImportJobConstants.ADMISSION_STALE_AFTER)
+        active_large_imports = self.import_job_dbio.filter_obj({
+            'status': ImportJobStatuses.PROCESSING,
+            'file_size__gt': ImportJobConstants.SMALL_IMPORT_MAX_FILE_SIZE,
+            'updated_at__gte': active_since,
+        }).exclude(uuid=import_job.uuid).count()
+        
+        return active_large_imports < ImportJobConstants.MAX_CONCURRENT_LARGE_IMPORTS
@@ -0,0 +1,140 @@
+import os
+import threading
+import time
+
+from django.db import connection
+from django.utils import timezone
+
+from products.choices import ImportJobStatuses
+from products.constants import BenchmarkConstants, ProductConstants
+from products.dbio import ImportJobDbIO, ProductDbIO
+from products.handlers.catalog_generator import generate_catalog_csv, seed_catalog_products
+from products.handlers.chunk_sizer import get_current_rss_mb, get_peak_rss_mb
+from products.handlers.csv_processor import CsvProcessor
+from products.handlers.product_counts import ProductStateCounter
+from products.handlers.product_upsert import get_product_upsert_engine
+from products.handlers.stage_metrics import QueryCounter
+
+
+class PeakRssSampler:
+    
+    def __init__(self, interval=BenchmarkConstants.RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.baseline_rss_mb = 0.0
+        self.peak_rss_mb = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def __enter__(self):
+        self.baseline_rss_mb = self.peak_rss_mb = self._get_rss_mb()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.stop_event.set()
+        self.thread.join()
+        self._record()
+        return False
+    
+    def _sample(self):
+        while not self.stop_event.wait(self.interval):
+            self._record()
+    
+    def _record(self):
+        self.peak_rss_mb = max(self.peak_rss_mb, self._get_rss_mb())
+    
+    def _get_rss_mb(self):
+        rss_mb = get_current_rss_mb()
+        if rss_mb is None:
+            return get_peak_rss_mb()
+        return rss_mb
+
+
+class ImportBenchmark:
+    
+    def __init__(self, work_dir, duplicate_ratio=0.0, update_ratio=0.0, invalid_ratio=0.0,
+                 description_length=BenchmarkConstants.DESCRIPTION_LENGTH, seed=None):
+        self.work_dir = work_dir
+        self.duplicate_ratio = duplicate_ratio
+        self.update_ratio = update_ratio
+        self.invalid_ratio = invalid_ratio
+        self.description_length = description_length
+        self.seed = seed
+        self.product_dbio = ProductDbIO()
+        self.import_job_dbio = ImportJobDbIO()
+    
+    def run(self, row_count):
+        self.product_dbio.get_all().delete()
+        
+        file_path = os.path.join(self.work_dir, f"benchmark_{row_count}.csv")
+        started_at = time.perf_counter()
+        generate_catalog_csv(
+            file_path,
+            row_count,
+            duplicate_ratio=self.duplicate_ratio,
+            invalid_ratio=self.invalid_ratio,
+            description_length=self.description_length,
+            seed=self.seed
+        )
+        generate_seconds = time.perf_counter() - started_at
+        seeded_products = seed_catalog_products(row_count, self.update_ratio, seed=self.seed)
+        ProductStateCounter().recount()
+        
+        file_size = os.path.getsize(file_path)
+        import_job = self.import_job_dbio.create_obj({
+            'status': ImportJobStatuses.PENDING,
+            'file_name': os.path.basename(file_path),
+            'file_size': file_size,
+            'file_path': file_path,
+            'total_records': 0,
+            'progress': 0,
+        })
+        
+        processor = CsvProcessor(str(import_job.uuid))
+        query_counter = QueryCounter()
+        started_at = time.perf_counter()
+        with PeakRssSampler() as rss_sampler, connection.execute_wrapper(query_counter):
+            processor.process_csv_file(file_path)
+        import_seconds = time.perf_counter() - started_at
+        
+        import_job.refresh_from_db()
+        chunks = max(1, processor.chunks_processed)
+        
+        return {
+            'rows': row_count,
+            'file_size': file_size,
+            'status': import_job.status,
+            'error_message': import_job.error_message,
+            'seeded_products': seeded_products,
+            'generate_seconds': round(generate_seconds, 3),
+            'import_seconds': round(import_seconds, 3),
+            'rows_per_second': round(row_count / import_seconds, 1) if import_seconds else None,
+            'baseline_rss_mb': round(rss_sampler.baseline_rss_mb, 1),
+            'peak_rss_mb': round(rss_sampler.peak_rss_mb, 1),
+            'import_rss_mb': round(rss_sampler.peak_rss_mb - rss_sampler.baseline_rss_mb, 1),
+            'queries': query_counter.count,
+            'chunks': processor.chunks_processed,
+            'chunk_size': import_job.chunk_size,
+            'batch_size': import_job.batch_size,
+            'queries_per_chunk': round(query_counter.count / chunks, 2),
+            'stages': processor.stage_metrics.to_dict(),
+            'counters': {
+                field: getattr(import_job, field) for field in CsvProcessor.COUNTER_FIELDS
+            },
+        }
+    
+    def run_all(self, row_counts):
+        return {
+            'database': connection.vendor,
+            'started_at': timezone.now().isoformat(),
+            'chunk_size': ProductConstants.CSV_CHUNK_SIZE,
+            'adaptive_chunk_sizing': ProductConstants.ADAPTIVE_CHUNK_SIZING,
+            'upsert_engine': type(get_product_upsert_engine()).__name__,
+            'duplicate_ratio': self.duplicate_ratio,
+            'update_ratio': self.update_ratio,
+            'invalid_ratio': self.invalid_ratio,
+            'description_length': self.description_length,
+            'results': [self.run(row_count) for row_count in row_counts],
+        }
@@ -1,29 +1,155 @@
+import os
+from datetime import timedelta
+
+from django.utils import timezone
+
+from products.choices import ImportJobStatuses
+from products.constants import ImportJobConstants
 from products.dbio import ImportJobDbIO
+from products.exceptions import ImportJobConflictError
+from products.handlers.import_admission import ImportAdmissionPolicy
+from products.handlers.progress_cache import ImportProgressCache
+from products.handlers.rejects_writer import get_rejects_dir, parse_rejects_file_job_uuid, remove_rejects_files
 
 
 class ImportJobHandler:
     
     def get_job_status(self, job_uuid):
+        job_data = ImportProgressCache().get(job_uuid)
+        if job_data is not None:
+            return job_data
+        
         import_job_dbio = ImportJobDbIO()
         
         try:
             import_job = import_job_dbio.get_obj({'uuid': job_uuid})
-            
-            return {
-                'job_id': str(import_job.uuid),
-                'status': import_job.status,
-                'progress': import_job.progress,
-                'total_records': import_job.total_records,
-                'processed_records': import_job.processed_records,
-                'successful_records': import_job.successful_records,
-                'failed_records': import_job.failed_records,
-                'file_name': import_job.file_name,
-                'file_size': import_job.file_size,
-                'error_message': import_job.error_message,
-                'started_at': import_job.started_at.isoformat() if import_job.started_at else None,
-                'completed_at': import_job.completed_at.isoformat() if import_job.completed_at else None,
-                'duration': import_job.duration,
-            }
         except import_job_dbio.model.DoesNotExist:
             raise ValueError(f"Import job with ID {job_uuid} not found")
-
+        
+        job_data = self.serialize_job(import_job)
+        if import_job.status in ImportJobStatuses.TERMINAL_STATUSES:
+            ImportProgressCache().set(job_uuid, job_data)
+        return job_data
+    
+    def serialize_job(self, import_job):
+        return {
+            'job_id': str(import_job.uuid),
+            'status': import_job.status,
+            'dry_run': import_job.dry_run,
+            'full_sync': import_job.full_sync,
+            'duplicate_policy': import_job.duplicate_policy,
+            'progress': import_job.progress,
+            'total_records': import_job.total_records,
+            'total_records_estimated': import_job.total_records_estimated,
+            'processed_records': import_job.processed_records,
+            'successful_records': import_job.successful_records,
+            'created_records': import_job.created_records,
+            'updated_records': import_job.updated_records,
+            'unchanged_records': import_job.unchanged_records,
+            'failed_records': import_job.failed_records,
+            'duplicate_records': import_job.duplicate_records,
+            'deactivated_records': import_job.deactivated_records,
+            'reactivated_records': import_job.reactivated_records,
+            'file_name': import_job.file_name,
+            'file_size': import_job.file_size,
+            'file_checksum': import_job.file_checksum,
+            'error_message': import_job.error_message,
+            'started_at': import_job.started_at.isoformat() if import_job.started_at else None,
+            'completed_at': import_job.completed_at.isoformat() if import_job.completed_at else None,
+            'duration': import_job.duration,
+            'checkpoint_records': import_job.checkpoint_records,
+            'resume_count': import_job.resume_count,
+            'chunk_size': import_job.chunk_size,
+            'batch_size': import_job.batch_size,
+            'stage_metrics': import_job.stage_metrics,
+            'reject_reason_counts': import_job.reject_reason_counts,
+            'rejects_available': bool(import_job.rejects_file_path),
+            'retry_of': str(import_job.retry_of_id) if import_job.retry_of_id else None,
+        }
+    
+    def resume_job(self, job_uuid):
+        from products.tasks import enqueue_csv_import
+        
+        import_job_dbio = ImportJobDbIO()
+        
+        try:
+            import_job = import_job_dbio.get_obj({'uuid': job_uuid})
+        except import_job_dbio.model.DoesNotExist:
+            raise ValueError(f"Import job with ID {job_uuid} not found")
+        
+        if import_job.status in ImportJobStatuses.TERMINAL_STATUSES:
+            raise ValueError(f"Import job with ID {job_uuid} is already {import_job.status}")
+        
+        if ImportAdmissionPolicy().is_held_by_worker(import_job):
+            raise ImportJobConflictError(f"Import job with ID {job_uuid} is still being processed")
+        
+        if not import_job.file_path or not os.path.exists(import_job.file_path):
+            raise ValueError(f"Staged file for import job {job_uuid} is no longer available")
+        
+        enqueue_csv_import(str(import_job.uuid), import_job.file_path, import_job.file_size)
+        
+        return {
+            'job_id': str(import_job.uuid),
+            'status': import_job.status,
+            'checkpoint_records': import_job.checkpoint_records,
+        }
+    
+    def get_rejects_file(self, job_uuid):
+        import_job_dbio = ImportJobDbIO()
+        
+        try:
+            import_job = import_job_dbio.get_obj({'uuid': job_uuid})
+        except import_job_dbio.model.DoesNotExist:
+            raise ValueError(f"Import job with ID {job_uuid} not found")
+        
+        if not import_job.rejects_file_path or not os.path.exists(import_job.rejects_file_path):
+            raise ValueError(f"Import job {job_uuid} has no rejected rows")
+        
+        file_stem = os.path.basename(import_job.file_name).split('.')[0] or 'import'
+        return import_job.rejects_file_path, f"{file_stem}_rejects.csv.gz"
+    
+    def purge_expired_rejects(self, retention_days=None):
+        if retention_days is None:
+            retention_days = ImportJobConstants.REJECTS_RETENTION_DAYS
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        import_job_dbio = ImportJobDbIO()
+        
+        expired_jobs = import_job_dbio.filter_obj({
+            'status__in': ImportJobStatuses.TERMINAL_STATUSES,
+            'completed_at__lt': cutoff,
+        }).exclude(rejects_file_path='')
+        expired_job_uuids = list(expired_jobs.values_list('uuid', flat=True))
+        removed_files = sum(remove_rejects_files(job_uuid) for job_uuid in expired_job_uuids)
+        import_job_dbio.filter_obj({'uuid__in': expired_job_uuids}).update(
+            rejects_file_path='',
+            rejects_file_size=0
+        )
+        for job_uuid in expired_job_uuids:
+            ImportProgressCache().delete(str(job_uuid))
+        
+        return removed_files + self._purge_orphaned_rejects(cutoff.timestamp())
+    
+    def _purge_orphaned_rejects(self, cutoff_timestamp):
+        rejects_dir = get_rejects_dir()
+        if not os.path.isdir(rejects_dir):
+            return 0
+        
+        orphaned_files = {}
+        for file_name in os.listdir(rejects_dir):
+            job_uuid = parse_rejects_file_job_uuid(file_name)
+            file_path = os.path.join(rejects_dir, file_name)
+            if job_uuid and os.path.getmtime(file_path) < cutoff_timestamp:
+                orphaned_files.setdefault(job_uuid, []).append(file_path)
+        
+        existing_job_uuids = {
+            str(job_uuid) for job_uuid in
+            ImportJobDbIO().filter_obj({'uuid__in': list(orphaned_files)}).values_list('uuid', flat=True)
+        }
+        removed_files = 0
+        for job_uuid, file_paths in orphaned_files.items():
+            if job_uuid in existing_job_uuids:
+                continue
+            for file_path in file_paths:
+                os.remove(file_path)
+                removed_files += 1
+        return removed_files
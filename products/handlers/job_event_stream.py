@@ -0,0 +1,84 @@
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+
+from products.choices import ImportJobStatuses
+from products.constants import ImportJobConstants
+from products.handlers.import_job_handler import ImportJobHandler
+
+
+class ImportJobEventStream:
+    
+    def __init__(self, job_uuid, job_data):
+        self.job_uuid = job_uuid
+        self.job_data = job_data
+        self.import_job_handler = ImportJobHandler()
+        self.last_sent = {}
+        self.started_at = time.monotonic()
+        self.last_event_at = self.started_at
+    
+    async def aiter_events(self):
+        yield self._format_retry()
+        job_data = self.job_data
+        
+        while True:
+            events, finished = self._build_events(job_data)
+            for event in events:
+                yield event
+            if finished:
+                return
+            
+            await asyncio.sleep(ImportJobConstants.EVENT_STREAM_POLL_INTERVAL)
+            job_data = await sync_to_async(self._get_job_status)()
+    
+    def iter_events(self):
+        yield self._format_retry()
+        job_data = self.job_data
+        
+        while True:
+            events, finished = self._build_events(job_data)
+            yield from events
+            if finished:
+                return
+            
+            time.sleep(ImportJobConstants.EVENT_STREAM_POLL_INTERVAL)
+            job_data = self._get_job_status()
+    
+    def _get_job_status(self):
+        try:
+            return self.import_job_handler.get_job_status(self.job_uuid)
+        except ValueError as e:
+            return {'error': str(e)}
+    
+    def _build_events(self, job_data):
+        now = time.monotonic()
+        
+        if 'error' in job_data:
+            return [self._format_event('not_found', job_data)], True
+        
+        events = []
+        delta = {
+            key: value for key, value in job_data.items()
+            if key not in self.last_sent or self.last_sent[key] != value
+        }
+        if delta:
+            events.append(self._format_event('progress', delta))
+            self.last_sent = job_data
+            self.last_event_at = now
+        elif now - self.last_event_at >= ImportJobConstants.EVENT_STREAM_HEARTBEAT_INTERVAL:
+            events.append(': keep-alive\n\n')
+            self.last_event_at = now
+        
+        if job_data['status'] in ImportJobStatuses.TERMINAL_STATUSES:
+            events.append(self._format_event('end', {'status': job_data['status']}))
+            return events, True
+        
+        return events, now - self.started_at >= ImportJobConstants.EVENT_STREAM_MAX_DURATION
+    
+    def _format_event(self, event_type, data):
+        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+    
+    def _format_retry(self):
+        return f"retry: {ImportJobConstants.EVENT_STREAM_RETRY_MS}\n\n"
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from products.constants import ProductConstants
+
+
+class ProductResponseCache:
+    
+    def __init__(self):
+        self.cache = caches['default']
+        self.enabled = ProductConstants.RESPONSE_CACHE_ENABLED and not isinstance(self.cache, LocMemCache)
+    
+    def get_or_build(self, kind, params, build):
+        if not self.enabled:
+            return build()
+        
+        cache_key = self._build_key(kind, params)
+        try:
+            data = self.cache.get(cache_key) if cache_key else None
+        except Exception:
+            data = None
+        if data is not None:
+            return data
+        
+        data = build()
+        if cache_key:
+            try:
+                self.cache.set(cache_key, data, ProductConstants.RESPONSE_CACHE_TIMEOUT)
+            except Exception:
+                pass
+        return data
+    
+    def get_version(self):
+        try:
+            version = self.cache.get(ProductConstants.RESPONSE_CACHE_VERSION_KEY)
+            if version is None:
+                self.cache.add(ProductConstants.RESPONSE_CACHE_VERSION_KEY, time.time_ns(), None)
+                version = self.cache.get(ProductConstants.RESPONSE_CACHE_VERSION_KEY)
+            return version
+        except Exception:
+            return None
+    
+    def bump_version(self):
+        try:
+            self.cache.incr(ProductConstants.RESPONSE_CACHE_VERSION_KEY)
+        except ValueError:
+            self._reset_version()
+        except Exception:
+            pass
+    
+    def bump_version_on_commit(self):
+        if self.enabled:
+            transaction.on_commit(self.bump_version)
+    
+    def _reset_version(self):
+        try:
+            self.cache.set(ProductConstants.RESPONSE_CACHE_VERSION_KEY, time.time_ns(), None)
+        except Exception:
+            pass
+    
+    def _build_key(self, kind, params):
+        version = self.get_version()
+        if version is None:
+            return None
+        
+        normalized_params = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha256(normalized_params.encode('utf-8')).hexdigest()
+        return f"{ProductConstants.RESPONSE_CACHE_KEY_PREFIX}:{version}:{kind}:{digest}"
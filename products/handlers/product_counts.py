@@ -0,0 +1,121 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+
+from base.choices import STATE_CHOICES
+from products.choices import CountStrategies
+from products.constants import ProductConstants
+from products.dbio import ProductDbIO, ProductStateCountDbIO
+
+
+class ProductStateCounter:
+    
+    def __init__(self):
+        self.state_count_dbio = ProductStateCountDbIO()
+        self.product_dbio = ProductDbIO()
+    
+    def get(self, state):
+        try:
+            return self.state_count_dbio.get_obj({'state': state}).count
+        except self.state_count_dbio.model.DoesNotExist:
+            return self.recount()[state]
+    
+    def total(self):
+        counts = self.state_count_dbio.get_all().aggregate(total=Sum('count'), states=Count('pk'))
+        if counts['states'] < len(STATE_CHOICES):
+            return sum(self.recount().values())
+        return counts['total']
+    
+    def adjust(self, deltas):
+        for state in sorted(deltas):
+            if deltas[state]:
+                self.state_count_dbio.filter_obj({'state': state}).update(
+                    count=F('count') + deltas[state]
+                )
+    
+    def move(self, from_state, to_state, count):
+        self.adjust({from_state: -count, to_state: count})
+    
+    @transaction.atomic
+    def recount(self):
+        counts = dict.fromkeys((state for state, _ in STATE_CHOICES), 0)
+        counts.update(
+            self.product_dbio.get_all().values_list('state').annotate(count=Count('pk')).order_by()
+        )
+        self.set(counts)
+        return counts
+    
+    def set(self, counts):
+        for state, count in counts.items():
+            self.state_count_dbio.update_or_create({'state': state}, {'count': count})
+
+
+class ExactCountStrategy:
+    
+    def count(self, queryset):
+        return queryset.count(), True
+
+
+class CachedCountStrategy(ExactCountStrategy):
+    
+    def count(self, queryset):
+        cache_key = self._build_key(queryset)
+        try:
+            count = cache.get(cache_key)
+        except Exception:
+            count = None
+        if count is not None:
+            return count, False
+        
+        count, exact = super().count(queryset)
+        try:
+            cache.set(cache_key, count, ProductConstants.COUNT_CACHE_TIMEOUT)
+        except Exception:
+            pass
+        return count, exact
+    
+    def _build_key(self, queryset):
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.sha256(f"{sql}\x1f{params!r}".encode('utf-8')).hexdigest()
+        return f"{ProductConstants.COUNT_CACHE_KEY_PREFIX}:{digest}"
+
+
+class EstimatedCountStrategy(CachedCountStrategy):
+    
+    def count(self, queryset):
+        if connection.vendor != 'postgresql':
+            return super().count(queryset)
+        
+        estimate = self._estimate(queryset)
+        if estimate < ProductConstants.COUNT_ESTIMATE_MIN_ROWS:
+            return super().count(queryset)
+        return estimate, False
+    
+    def _estimate(self, queryset):
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class CountedPaginator(Paginator):
+    
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+
+def get_product_count_strategy():
+    strategy = ProductConstants.COUNT_STRATEGY
+    if strategy == CountStrategies.EXACT:
+        return ExactCountStrategy()
+    if strategy == CountStrategies.ESTIMATE:
+        return EstimatedCountStrategy()
+    return CachedCountStrategy()
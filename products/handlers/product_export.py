@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+
+from asgiref.sync import sync_to_async
+
+from products.choices import ImportFileFormats
+from products.constants import ProductConstants
+
+
+class ProductExporter:
+    CONTENT_TYPES = {
+        ImportFileFormats.CSV: 'text/csv',
+        ImportFileFormats.JSONL: 'application/x-ndjson',
+    }
+    
+    def __init__(self, file_format):
+        if file_format not in self.CONTENT_TYPES:
+            raise ValueError(
+                f"Unsupported export format: {file_format}. "
+                f"Allowed formats: {', '.join(self.CONTENT_TYPES)}"
+            )
+        self.file_format = file_format
+    
+    @property
+    def content_type(self):
+        return self.CONTENT_TYPES[self.file_format]
+    
+    @property
+    def file_name(self):
+        return f"products.{self.file_format}"
+    
+    def iter_content(self, queryset):
+        rows = queryset.values_list(*ProductConstants.IMPORT_COLUMNS).iterator(
+            chunk_size=ProductConstants.EXPORT_ITERATOR_CHUNK_SIZE
+        )
+        if self.file_format == ImportFileFormats.CSV:
+            return self._iter_csv(rows)
+        return self._iter_jsonl(rows)
+    
+    async def aiter_content(self, queryset):
+        content = self.iter_content(queryset)
+        next_chunk = sync_to_async(next, thread_sensitive=True)
+        try:
+            while True:
+                chunk = await next_chunk(content, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await sync_to_async(content.close, thread_sensitive=True)()
+    
+    def _iter_csv(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(ProductConstants.IMPORT_COLUMNS)
+        
+        for row in rows:
+            writer.writerow(row)
+            if buffer.tell() >= ProductConstants.EXPORT_FLUSH_SIZE:
+                yield self._drain(buffer)
+        
+        if buffer.tell():
+            yield self._drain(buffer)
+    
+    def _iter_jsonl(self, rows):
+        buffer = io.StringIO()
+        encoder = json.JSONEncoder(ensure_ascii=False)
+        
+        for row in rows:
+            buffer.write(encoder.encode(dict(zip(ProductConstants.IMPORT_COLUMNS, row))))
+            buffer.write('\n')
+            if buffer.tell() >= ProductConstants.EXPORT_FLUSH_SIZE:
+                yield self._drain(buffer)
+        
+        if buffer.tell():
+            yield self._drain(buffer)
+    
+    def _drain(self, buffer):
+        content = buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+        return content
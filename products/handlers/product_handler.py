@@ -1,9 +1,24 @@
-from django.core.paginator import Paginator
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Q
 
 from base.choices import StateStatuses
 from base.constants import BaseConstants
+from products.choices import ImportFileFormats
 from products.constants import ProductConstants
 from products.dbio import ProductDbIO
+from products.handlers.product_cache import ProductResponseCache
+from products.handlers.product_counts import (
+    CountedPaginator,
+    ProductStateCounter,
+    get_product_count_strategy
+)
+from products.handlers.product_export import ProductExporter
+from products.handlers.product_search import get_product_search_backend
 from products.models import Product
 
 
@@ -11,6 +26,7 @@ class ProductHandler:
     
     def __init__(self):
         self.product_dbio = ProductDbIO()
+        self.response_cache = ProductResponseCache()
     
     def validate_product_data(self, data):
         errors = {}
@@ -51,45 +67,144 @@ class ProductHandler:
             'updated_at': product.updated_at.isoformat() if product.updated_at else None,
         }
     
+    @transaction.atomic
     def create_product(self, data):
         validated_data = self.validate_product_data(data)
         product = self.product_dbio.create_obj(validated_data)
+        ProductStateCounter().adjust({product.state: 1})
+        self.response_cache.bump_version_on_commit()
         return self.product_to_dict(product)
     
     def get_product(self, product_uuid):
-        product = self.product_dbio.get_obj({'uuid': product_uuid})
-        return self.product_to_dict(product)
+        return self.response_cache.get_or_build(
+            'detail',
+            str(product_uuid),
+            lambda: self.product_to_dict(self.product_dbio.get_obj({'uuid': product_uuid}))
+        )
     
+    @transaction.atomic
     def update_product(self, product_uuid, data):
         validated_data = self.validate_product_data(data)
         product = self.product_dbio.get_obj({'uuid': product_uuid})
         self.product_dbio.update_obj(product, validated_data)
+        self.response_cache.bump_version_on_commit()
         return self.product_to_dict(product)
     
+    @transaction.atomic
     def delete_product(self, product_uuid):
         product = self.product_dbio.get_obj({'uuid': product_uuid})
+        if product.state != StateStatuses.INACTIVE:
+            ProductStateCounter().move(product.state, StateStatuses.INACTIVE, 1)
         product.soft_delete()
+        self.response_cache.bump_version_on_commit()
         return {'message': 'Product deleted successfully'}
     
     def list_products(self, filters=None, page=None, page_size=None):
+        page_size = page_size or BaseConstants.PAGINATION_PAGE_SIZE
+        page = page or 1
+        return self.response_cache.get_or_build(
+            'list',
+            [self._normalize_filters(filters), page, page_size],
+            lambda: self._build_product_page(filters, page, page_size)
+        )
+    
+    def list_products_by_cursor(self, filters=None, cursor=None, page_size=None):
+        page_size = page_size or BaseConstants.PAGINATION_PAGE_SIZE
+        return self.response_cache.get_or_build(
+            'cursor',
+            [self._normalize_filters(filters), cursor or '', page_size],
+            lambda: self._build_product_cursor_page(filters, cursor, page_size)
+        )
+    
+    def export_products(self, filters=None, file_format=ImportFileFormats.CSV, is_async=False):
+        exporter = ProductExporter(file_format)
+        queryset = self._filter_products(filters).order_by('-created_at', '-uuid')
+        content = exporter.aiter_content(queryset) if is_async else exporter.iter_content(queryset)
+        return content, exporter.content_type, exporter.file_name
+    
+    def _build_product_page(self, filters, page, page_size):
+        queryset = self._filter_products(filters, ranked=True)
+        total_count, total_count_exact = self._count_products(queryset, filters)
+        paginator = CountedPaginator(queryset, page_size, total_count)
+        page_obj = paginator.get_page(page)
+        
+        products_list = [self.product_to_dict(product) for product in page_obj]
+        
+        return {
+            'results': products_list,
+            'total_count': total_count,
+            'total_count_exact': total_count_exact,
+            'page': page_obj.number,
+            'page_size': page_size,
+            'total_pages': paginator.num_pages,
+            'has_next': page_obj.has_next(),
+            'has_previous': page_obj.has_previous(),
+        }
+    
+    def _build_product_cursor_page(self, filters, cursor, page_size):
+        queryset = self._filter_products(filters).order_by('-created_at', '-uuid')
+        
+        if cursor:
+            created_at, product_uuid = self._decode_cursor(cursor)
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) |
+                Q(created_at=created_at, uuid__lt=product_uuid)
+            )
+        
+        products = list(queryset[:page_size + 1])
+        has_next = len(products) > page_size
+        products = products[:page_size]
+        
+        return {
+            'results': [self.product_to_dict(product) for product in products],
+            'page_size': page_size,
+            'next_cursor': self._encode_cursor(products[-1]) if has_next else None,
+            'has_next': has_next,
+        }
+    
+    def _encode_cursor(self, product):
+        payload = json.dumps([product.created_at.isoformat(), str(product.uuid)])
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    def _decode_cursor(self, cursor):
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            created_at, product_uuid = json.loads(payload)
+            return datetime.fromisoformat(created_at), uuid.UUID(product_uuid)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+    
+    def _normalize_filters(self, filters=None):
+        return {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in (filters or {}).items()
+            if value is not None and value != ''
+        }
+    
+    def _count_products(self, queryset, filters=None):
+        filters = filters or {}
+        is_filtered = any(filters.get(field) for field in ('sku', 'name', 'description', 'search'))
+        if not is_filtered and filters.get('active') is not False:
+            return ProductStateCounter().get(StateStatuses.ACTIVE), False
+        return get_product_count_strategy().count(queryset)
+    
+    def _filter_products(self, filters=None, ranked=False):
         if filters is None:
             filters = {}
         
         queryset = self.product_dbio.get_all_active().only(
             'uuid', 'sku', 'name', 'description', 'state', 'created_at', 'updated_at'
         )
+        search_backend = get_product_search_backend()
         
-        sku = filters.get('sku')
-        if sku:
-            queryset = queryset.filter(sku__icontains=sku.lower())
+        for field in ('sku', 'name', 'description'):
+            value = filters.get(field)
+            if value:
+                queryset = search_backend.filter_substring(queryset, field, value)
         
-        name = filters.get('name')
-        if name:
-            queryset = queryset.filter(name__icontains=name)
-        
-        description = filters.get('description')
-        if description:
-            queryset = queryset.filter(description__icontains=description)
+        search = filters.get('search')
+        if search:
+            queryset = search_backend.search(queryset, search, ranked=ranked)
         
         active = filters.get('active')
         if active is not None:
@@ -98,31 +213,17 @@ class ProductHandler:
             else:
                 queryset = queryset.filter(state=StateStatuses.INACTIVE)
         
-        page_size = page_size or BaseConstants.PAGINATION_PAGE_SIZE
-        page = page or 1
-        
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
-        
-        products_list = [self.product_to_dict(product) for product in page_obj]
-        
-        return {
-            'results': products_list,
-            'total_count': paginator.count,
-            'page': page_obj.number,
-            'page_size': page_size,
-            'total_pages': paginator.num_pages,
-            'has_next': page_obj.has_next(),
-            'has_previous': page_obj.has_previous(),
-        }
+        return queryset
     
+    @transaction.atomic
     def bulk_delete_all_products(self):
         products = self.product_dbio.get_all()
         count = products.count()
         
         if count > 0:
-            from base.choices import StateStatuses
             products.update(state=StateStatuses.INACTIVE)
+            ProductStateCounter().set({StateStatuses.ACTIVE: 0, StateStatuses.INACTIVE: count})
+            self.response_cache.bump_version_on_commit()
         
         return count
 
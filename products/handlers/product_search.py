@@ -0,0 +1,148 @@
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from products.constants import ProductConstants
+
+
+class IcontainsSearchBackend:
+    SEARCH_FIELDS = ('sku', 'name', 'description')
+    
+    def filter_substring(self, queryset, field, value):
+        if field == 'sku':
+            value = value.lower()
+        return queryset.filter(**{f'{field}__icontains': value})
+    
+    def search(self, queryset, query, ranked=True):
+        condition = Q()
+        for field in self.SEARCH_FIELDS:
+            condition |= Q(**{f'{field}__icontains': query})
+        return queryset.filter(condition)
+    
+    def rebuild_index(self):
+        return False
+
+
+class PostgresSearchBackend(IcontainsSearchBackend):
+    
+    def search(self, queryset, query, ranked=True):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+        
+        search_vector = SearchVector('name', 'description', config=ProductConstants.SEARCH_CONFIG)
+        search_query = SearchQuery(query, config=ProductConstants.SEARCH_CONFIG, search_type='websearch')
+        queryset = queryset.annotate(search_vector=search_vector).filter(
+            Q(search_vector=search_query) | Q(sku__icontains=query.lower())
+        )
+        if not ranked:
+            return queryset
+        
+        return queryset.annotate(
+            search_rank=SearchRank(search_vector, search_query)
+        ).order_by('-search_rank', '-created_at')
+
+
+class SqliteFts5SearchBackend(IcontainsSearchBackend):
+    TRIGGER_NAMES = ('products_fts_insert', 'products_fts_delete', 'products_fts_update')
+    INDEX_SQL = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+            sku, name, description, content='products', content_rowid='rowid', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN
+            INSERT INTO products_fts (rowid, sku, name, description)
+            VALUES (new.rowid, new.sku, new.name, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN
+            INSERT INTO products_fts (products_fts, rowid, sku, name, description)
+            VALUES ('delete', old.rowid, old.sku, old.name, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS products_fts_update AFTER UPDATE OF sku, name, description ON products BEGIN
+            INSERT INTO products_fts (products_fts, rowid, sku, name, description)
+            VALUES ('delete', old.rowid, old.sku, old.name, old.description);
+            INSERT INTO products_fts (rowid, sku, name, description)
+            VALUES (new.rowid, new.sku, new.name, new.description);
+        END
+        """,
+    ]
+    
+    def filter_substring(self, queryset, field, value):
+        match_query = self._build_match_query([value], field)
+        if match_query is None:
+            return super().filter_substring(queryset, field, value)
+        
+        return queryset.filter(pk__in=self._match_uuids(match_query))
+    
+    def search(self, queryset, query, ranked=True):
+        terms = query.split()
+        match_query = self._build_match_query(terms)
+        if match_query is None:
+            return super().search(queryset, query, ranked)
+        
+        for term in terms:
+            if len(term) < ProductConstants.SEARCH_FTS_MIN_TERM_LENGTH:
+                queryset = super().search(queryset, term, ranked)
+        
+        queryset = queryset.filter(pk__in=self._match_uuids(match_query))
+        if not ranked:
+            return queryset
+        
+        fts_table = ProductConstants.SEARCH_FTS_TABLE
+        return queryset.annotate(search_rank=RawSQL(
+            f"SELECT bm25({fts_table}) FROM {fts_table} "
+            f"WHERE {fts_table} MATCH %s AND {fts_table}.rowid = products.rowid",
+            [match_query]
+        )).order_by('search_rank', '-created_at')
+    
+    def rebuild_index(self):
+        fts_table = ProductConstants.SEARCH_FTS_TABLE
+        with connection.cursor() as cursor:
+            for sql in self.INDEX_SQL:
+                cursor.execute(sql)
+            cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+        return True
+    
+    def _match_uuids(self, match_query):
+        fts_table = ProductConstants.SEARCH_FTS_TABLE
+        return RawSQL(
+            f"SELECT uuid FROM products WHERE rowid IN "
+            f"(SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s)",
+            [match_query]
+        )
+    
+    def _build_match_query(self, terms, field=None):
+        phrases = [
+            '"' + term.replace('"', '""') + '"'
+            for term in terms
+            if len(term) >= ProductConstants.SEARCH_FTS_MIN_TERM_LENGTH
+        ]
+        if not phrases:
+            return None
+        
+        match_query = ' '.join(phrases)
+        if field is not None:
+            return f'{field} : ({match_query})'
+        return match_query
+
+
+def has_fts5_index():
+    object_names = [ProductConstants.SEARCH_FTS_TABLE, *SqliteFts5SearchBackend.TRIGGER_NAMES]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({', '.join(['%s'] * len(object_names))})",
+            object_names
+        )
+        return cursor.fetchone()[0] == len(object_names)
+
+
+def get_product_search_backend():
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite' and has_fts5_index():
+        return SqliteFts5SearchBackend()
+    return IcontainsSearchBackend()
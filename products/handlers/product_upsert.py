@@ -0,0 +1,245 @@
+import csv
+import io
+import uuid
+
+from django.db import connection
+from django.utils import timezone
+
+from base.choices import StateStatuses
+from products.choices import UpsertEngines
+from products.constants import ProductConstants
+from products.dbio import ProductDbIO
+from products.handlers.stage_metrics import ImportStageMetrics
+
+
+class OrmProductUpsertEngine:
+    UPDATE_FIELDS = ['name', 'description', 'content_hash', 'updated_at']
+    
+    def __init__(self):
+        self.product_dbio = ProductDbIO()
+        self.sku_index = None
+        self.max_batch_size = ProductConstants.BULK_CREATE_BATCH_SIZE
+        self.batch_size = 0
+        self.stage_metrics = ImportStageMetrics()
+    
+    def upsert(self, products_data):
+        existing_products = {}
+        
+        skus = _filter_possibly_existing_skus(products_data, self.sku_index)
+        if skus:
+            with self.stage_metrics.measure('lookup', len(skus)):
+                existing_products_qs = self.product_dbio.filter_obj({'sku__in': skus}).only('sku', 'content_hash')
+                
+                for product in existing_products_qs:
+                    existing_products[product.sku] = product
+        
+        products_to_create = []
+        products_to_update = []
+        current_time = timezone.now()
+        
+        for product_data in products_data:
+            existing_product = existing_products.get(product_data['sku'])
+            if existing_product is not None:
+                if existing_product.content_hash == product_data['content_hash']:
+                    continue
+                existing_product.name = product_data['name']
+                existing_product.description = product_data['description']
+                existing_product.content_hash = product_data['content_hash']
+                existing_product.updated_at = current_time
+                products_to_update.append(existing_product)
+            else:
+                product = self.product_dbio.model(**product_data)
+                product.created_at = current_time
+                product.updated_at = current_time
+                products_to_create.append(product)
+        
+        if products_to_create:
+            batch_size = self._get_batch_size(
+                self.product_dbio.model._meta.concrete_fields, products_to_create
+            )
+            with self.stage_metrics.measure('create', len(products_to_create)):
+                for i in range(0, len(products_to_create), batch_size):
+                    batch = products_to_create[i:i + batch_size]
+                    self.product_dbio.model.objects.bulk_create(
+                        batch,
+                        ignore_conflicts=True
+                    )
+                conflicting_products = self._find_conflicts(products_to_create)
+            if self.sku_index is not None:
+                self.sku_index.update(product.sku for product in products_to_create)
+            
+            if conflicting_products:
+                conflicting_uuids = {product.uuid for product in conflicting_products}
+                products_to_create = [
+                    product for product in products_to_create if product.uuid not in conflicting_uuids
+                ]
+                products_to_update.extend(self._resolve_conflicts(conflicting_products, current_time))
+        
+        if products_to_update:
+            batch_size = self._get_batch_size(['pk', 'pk', *self.UPDATE_FIELDS], products_to_update)
+            with self.stage_metrics.measure('update', len(products_to_update)):
+                for i in range(0, len(products_to_update), batch_size):
+                    batch = products_to_update[i:i + batch_size]
+                    self.product_dbio.model.objects.bulk_update(
+                        batch,
+                        self.UPDATE_FIELDS
+                    )
+        
+        return len(products_to_create), len(products_to_update)
+    
+    def _find_conflicts(self, created_products):
+        conflicting_products = []
+        batch_size = max(1, connection.ops.bulk_batch_size(['uuid'], created_products))
+        for i in range(0, len(created_products), batch_size):
+            batch = created_products[i:i + batch_size]
+            inserted_products = self.product_dbio.filter_obj({
+                'uuid__in': [product.uuid for product in batch]
+                })
+            if inserted_products.count() == len(batch):
+                continue
+            
+            inserted_uuids = set(inserted_products.values_list('uuid', flat=True))
+            conflicting_products.extend(
+                product for product in batch if product.uuid not in inserted_uuids
+            )
+        return conflicting_products
+    
+    def _resolve_conflicts(self, conflicting_products, current_time):
+        conflicting_data = {product.sku: product for product in conflicting_products}
+        existing_products = self.product_dbio.filter_obj({
+            'sku__in': list(conflicting_data)
+            }).only('sku', 'content_hash')
+        
+        products_to_update = []
+        for existing_product in existing_products:
+            product = conflicting_data[existing_product.sku]
+            if existing_product.content_hash == product.content_hash:
+                continue
+            existing_product.name = product.name
+            existing_product.description = product.description
+            existing_product.content_hash = product.content_hash
+            existing_product.updated_at = current_time
+            products_to_update.append(existing_product)
+        return products_to_update
+    
+    def _get_batch_size(self, fields, objs):
+        self.batch_size = max(1, min(
+            self.max_batch_size,
+            connection.ops.bulk_batch_size(fields, objs)
+        ))
+        return self.batch_size
+
+
+class PostgresCopyUpsertEngine:
+    STAGING_TABLE = 'product_import_staging'
+    STAGING_COLUMNS = ('uuid', 'sku', 'name', 'description', 'content_hash')
+    
+    def __init__(self):
+        self.product_dbio = ProductDbIO()
+        self.max_batch_size = ProductConstants.BULK_CREATE_BATCH_SIZE
+        self.batch_size = 0
+        self.stage_metrics = ImportStageMetrics()
+    
+    def upsert(self, products_data):
+        self.batch_size = len(products_data)
+        staging_table = connection.ops.quote_name(self.STAGING_TABLE)
+        products_table = connection.ops.quote_name(self.product_dbio.model._meta.db_table)
+        current_time = timezone.now()
+        
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {staging_table} (
+                    uuid uuid NOT NULL,
+                    sku varchar({ProductConstants.SKU_MAX_LENGTH}) NOT NULL,
+                    name varchar({ProductConstants.PRODUCT_NAME_MAX_LENGTH}) NOT NULL,
+                    description text,
+                    content_hash varchar({ProductConstants.CONTENT_HASH_LENGTH}) NOT NULL
+                )
+            """)
+            cursor.execute(f"TRUNCATE {staging_table}")
+            with self.stage_metrics.measure('copy', len(products_data)):
+                cursor.copy_expert(
+                    f"COPY {staging_table} ({', '.join(self.STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                    self._to_copy_buffer(products_data)
+                )
+            with self.stage_metrics.measure('merge', len(products_data)):
+                cursor.execute(f"""
+                    WITH upserted AS (
+                        INSERT INTO {products_table} AS product
+                            (uuid, sku, name, description, content_hash, state, created_at, updated_at)
+                        SELECT uuid, sku, name, description, content_hash, %s, %s, %s
+                        FROM {staging_table}
+                        ORDER BY sku
+                        ON CONFLICT (sku) DO UPDATE SET
+                            name = EXCLUDED.name,
+                            description = EXCLUDED.description,
+                            content_hash = EXCLUDED.content_hash,
+                            updated_at = EXCLUDED.updated_at
+                        WHERE product.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                        RETURNING (xmax = 0) AS created
+                    )
+                    SELECT
+                        COUNT(*) FILTER (WHERE created),
+                        COUNT(*) FILTER (WHERE NOT created)
+                    FROM upserted
+                """, [StateStatuses.ACTIVE, current_time, current_time])
+                created_count, updated_count = cursor.fetchone()
+        
+        return created_count, updated_count
+    
+    def _to_copy_buffer(self, products_data):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for product_data in products_data:
+            writer.writerow((
+                uuid.uuid4(),
+                product_data['sku'],
+                product_data['name'],
+                product_data['description'],
+                product_data['content_hash'],
+            ))
+        buffer.seek(0)
+        return buffer
+
+
+class DryRunProductDiffEngine:
+    
+    def __init__(self):
+        self.product_dbio = ProductDbIO()
+        self.sku_index = None
+        self.max_batch_size = ProductConstants.BULK_CREATE_BATCH_SIZE
+        self.batch_size = 0
+        self.stage_metrics = ImportStageMetrics()
+    
+    def upsert(self, products_data):
+        skus = _filter_possibly_existing_skus(products_data, self.sku_index)
+        existing_content_hashes = {}
+        if skus:
+            with self.stage_metrics.measure('lookup', len(skus)):
+                existing_content_hashes = dict(
+                    self.product_dbio.filter_obj({'sku__in': skus}).values_list('sku', 'content_hash')
+                )
+        
+        created_count = 0
+        updated_count = 0
+        
+        for product_data in products_data:
+            if product_data['sku'] not in existing_content_hashes:
+                created_count += 1
+            elif existing_content_hashes[product_data['sku']] != product_data['content_hash']:
+                updated_count += 1
+        
+        return created_count, updated_count
+
+
+def _filter_possibly_existing_skus(products_data, sku_index):
+    if sku_index is None:
+        return [p['sku'] for p in products_data]
+    return [p['sku'] for p in products_data if sku_index.might_contain(p['sku'])]
+
+
+def get_product_upsert_engine():
+    engine = ProductConstants.UPSERT_ENGINE
+    if engine == UpsertEngines.ORM or connection.vendor != 'postgresql':
+        return OrmProductUpsertEngine()
+    return PostgresCopyUpsertEngine()
@@ -0,0 +1,31 @@
+from django.core.cache import cache
+
+from products.constants import ImportJobConstants
+
+
+class ImportProgressCache:
+    
+    def get(self, job_uuid):
+        try:
+            return cache.get(self._build_key(job_uuid))
+        except Exception:
+            return None
+    
+    def set(self, job_uuid, job_data, timeout=None):
+        try:
+            cache.set(
+                self._build_key(job_uuid),
+                job_data,
+                timeout or ImportJobConstants.PROGRESS_CACHE_TIMEOUT
+            )
+        except Exception:
+            pass
+    
+    def delete(self, job_uuid):
+        try:
+            cache.delete(self._build_key(job_uuid))
+        except Exception:
+            pass
+    
+    def _build_key(self, job_uuid):
+        return f"{ImportJobConstants.PROGRESS_CACHE_KEY_PREFIX}:{job_uuid}"
@@ -0,0 +1,316 @@
+import csv
+import itertools
+import json
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    ipc = None
+    pq = None
+
+from products.choices import ImportFileFormats
+from products.constants import ProductConstants
+from products.handlers.csv_stream import (
+    CsvFile,
+    CsvLineStream,
+    estimate_csv_records,
+    iter_csv_column_batches,
+    read_csv_header,
+    read_file_sample
+)
+
+
+def get_import_file_format(file_name):
+    file_name = file_name.lower()
+    for extension, file_format in ProductConstants.IMPORT_FILE_EXTENSIONS.items():
+        if file_name.endswith(extension):
+            return file_format
+    
+    raise ValueError(f"Invalid file type. Only {ProductConstants.IMPORT_ALLOWED_EXTENSIONS} are allowed")
+
+
+def validate_import_file_format(file_name):
+    file_format = get_import_file_format(file_name)
+    if file_format in ImportFileFormats.COLUMNAR_FORMATS and pa is None:
+        raise ValueError(f"Importing {file_format} files requires pyarrow to be installed")
+    
+    return file_format
+
+
+class CsvBatchReader:
+    
+    def __init__(self, file_path, batch_size, max_batch_size=None):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size or batch_size)
+        self.file = CsvFile(file_path)
+        self.line_stream = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @property
+    def supports_byte_ranges(self):
+        return not self.file.is_compressed
+    
+    @property
+    def position(self):
+        return self.line_stream.bytes_read
+    
+    def count_records(self, estimate=True):
+        if not estimate:
+            return None, True
+        return estimate_csv_records(self.file_path), True
+    
+    def iter_batches(self, start_position=None, end_position=None):
+        fieldnames, header_size = read_csv_header(self.file.stream)
+        start_position = start_position or header_size
+        self.file.skip_to(start_position, header_size)
+        
+        self.line_stream = self._open_line_stream(start_position, end_position)
+        return iter_csv_column_batches(
+            csv.reader(self.line_stream), fieldnames, lambda: self.batch_size
+        )
+    
+    def progress_offset(self):
+        return self.file.progress_offset(self.position)
+    
+    def close(self):
+        self.file.close()
+    
+    def _open_line_stream(self, start_position, end_position):
+        return CsvLineStream(
+            self.file.stream,
+            start_offset=start_position,
+            end_offset=end_position,
+            max_bytes=ProductConstants.CSV_MAX_DECOMPRESSED_SIZE
+        )
+
+
+class JsonlBatchReader(CsvBatchReader):
+    
+    @property
+    def supports_byte_ranges(self):
+        return False
+    
+    def count_records(self, estimate=True):
+        if not estimate:
+            return None, True
+        
+        sample_size = ProductConstants.CSV_ROW_ESTIMATE_SAMPLE_SIZE
+        sample, file_size = read_file_sample(self.file_path, sample_size)
+        if len(sample) < sample_size:
+            return sum(1 for line in sample.splitlines() if line.strip()), True
+        
+        sample = sample[:sample.rfind(b'\n') + 1]
+        record_count = sum(1 for line in sample.splitlines() if line.strip())
+        if record_count == 0:
+            return 0, True
+        return int(file_size / (len(sample) / record_count)), True
+    
+    def iter_batches(self, start_position=None, end_position=None):
+        start_position = start_position or 0
+        self.file.skip_to(start_position, 0)
+        
+        self.line_stream = self._open_line_stream(start_position, end_position)
+        lines = (line for line in self.line_stream if line.strip())
+        
+        while True:
+            records = [self._parse_record(line) for line in itertools.islice(lines, self.batch_size)]
+            if not records:
+                return
+            
+            yield {
+                field: [
+                    None if record is None else self._to_text(record.get(field))
+                    for record in records
+                ]
+                for field in ProductConstants.IMPORT_COLUMNS
+            }, len(records)
+    
+    def _parse_record(self, line):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        return record if isinstance(record, dict) else None
+    
+    def _to_text(self, value):
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        return json.dumps(value)
+
+
+class ArrowBatchReader:
+    supports_byte_ranges = False
+    
+    def __init__(self, file_path, batch_size, max_batch_size=None):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size or batch_size)
+        self.file_size = os.path.getsize(file_path)
+        self.position = 0
+        self.total_rows = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def count_records(self, estimate=True):
+        return self.total_rows, self.total_rows is None
+    
+    def progress_offset(self):
+        if not self.total_rows:
+            return 0
+        return int(self.file_size * self.position / self.total_rows)
+    
+    def close(self):
+        pass
+    
+    def _projected_columns(self, column_names):
+        missing_columns = [
+            column for column in ProductConstants.CSV_REQUIRED_COLUMNS
+            if column not in column_names
+        ]
+        if missing_columns:
+            raise ValueError(f"File is missing required columns: {', '.join(missing_columns)}")
+        
+        return [column for column in ProductConstants.IMPORT_COLUMNS if column in column_names]
+    
+    def _iter_column_batches(self, record_batches, skip_rows=0, end_position=None):
+        for record_batch in record_batches:
+            if skip_rows >= record_batch.num_rows:
+                skip_rows -= record_batch.num_rows
+                continue
+            
+            record_batch = record_batch.slice(skip_rows)
+            skip_rows = 0
+            
+            offset = 0
+            while offset < record_batch.num_rows:
+                batch_size = self.batch_size
+                if end_position is not None:
+                    batch_size = min(batch_size, end_position - self.position)
+                    if batch_size <= 0:
+                        return
+                
+                batch = record_batch.slice(offset, batch_size)
+                offset += batch.num_rows
+                self.position += batch.num_rows
+                yield self._to_columns(batch), batch.num_rows
+    
+    def _to_columns(self, batch):
+        columns = {}
+        for field in ProductConstants.IMPORT_COLUMNS:
+            index = batch.schema.get_field_index(field)
+            if index == -1:
+                columns[field] = pa.array([''] * batch.num_rows, type=pa.string())
+                continue
+            
+            values = batch.column(index)
+            if values.type != pa.string():
+                values = values.cast(pa.string())
+            columns[field] = values.fill_null('')
+        
+        return columns
+
+
+class ParquetBatchReader(ArrowBatchReader):
+    
+    def __init__(self, file_path, batch_size, max_batch_size=None):
+        super().__init__(file_path, batch_size, max_batch_size)
+        self.parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        self.columns = self._projected_columns(self.parquet_file.schema_arrow.names)
+        self.total_rows = self.parquet_file.metadata.num_rows
+    
+    def iter_batches(self, start_position=None, end_position=None):
+        self.position = start_position or 0
+        skip_rows = self.position
+        row_groups = []
+        
+        for index in range(self.parquet_file.num_row_groups):
+            group_rows = self.parquet_file.metadata.row_group(index).num_rows
+            if not row_groups and skip_rows >= group_rows:
+                skip_rows -= group_rows
+                continue
+            row_groups.append(index)
+        
+        if not row_groups:
+            return iter(())
+        
+        record_batches = self.parquet_file.iter_batches(
+            batch_size=self.max_batch_size,
+            row_groups=row_groups,
+            columns=self.columns
+        )
+        return self._iter_column_batches(record_batches, skip_rows, end_position)
+    
+    def close(self):
+        self.parquet_file.close()
+
+
+class ArrowIpcBatchReader(ArrowBatchReader):
+    
+    def __init__(self, file_path, batch_size, max_batch_size=None):
+        super().__init__(file_path, batch_size, max_batch_size)
+        self.source = pa.memory_map(file_path, 'r')
+        
+        try:
+            self.ipc_reader = ipc.open_file(self.source)
+            self.total_rows = sum(
+                self.ipc_reader.get_batch(index).num_rows
+                for index in range(self.ipc_reader.num_record_batches)
+            )
+        except pa.ArrowInvalid:
+            self.source.seek(0)
+            self.ipc_reader = ipc.open_stream(self.source)
+        
+        self.columns = self._projected_columns(self.ipc_reader.schema.names)
+    
+    def iter_batches(self, start_position=None, end_position=None):
+        self.position = start_position or 0
+        
+        if isinstance(self.ipc_reader, ipc.RecordBatchFileReader):
+            record_batches = (
+                self.ipc_reader.get_batch(index)
+                for index in range(self.ipc_reader.num_record_batches)
+            )
+        else:
+            record_batches = self.ipc_reader
+        
+        return self._iter_column_batches(
+            (record_batch.select(self.columns) for record_batch in record_batches),
+            self.position,
+            end_position
+        )
+    
+    def close(self):
+        self.source.close()
+
+
+IMPORT_READERS = {
+    ImportFileFormats.CSV: CsvBatchReader,
+    ImportFileFormats.JSONL: JsonlBatchReader,
+    ImportFileFormats.PARQUET: ParquetBatchReader,
+    ImportFileFormats.ARROW_IPC: ArrowIpcBatchReader,
+}
+
+
+def open_import_reader(file_path, batch_size=None, max_batch_size=None):
+    file_format = validate_import_file_format(os.path.basename(file_path))
+    return IMPORT_READERS[file_format](
+        file_path,
+        batch_size or ProductConstants.CSV_CHUNK_SIZE,
+        max_batch_size
+    )
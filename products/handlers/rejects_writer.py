@@ -0,0 +1,83 @@
+import csv
+import glob
+import gzip
+import os
+import shutil
+import uuid
+
+from django.conf import settings
+
+from products.constants import ImportJobConstants, ProductConstants
+
+
+def get_rejects_dir():
+    return os.path.join(settings.BASE_DIR, ImportJobConstants.REJECTS_DIR_NAME)
+
+
+def build_rejects_file_path(import_job_uuid, part=None):
+    rejects_dir = get_rejects_dir()
+    os.makedirs(rejects_dir, exist_ok=True)
+    
+    suffix = f"_part{part}" if part is not None else ''
+    return os.path.join(rejects_dir, f"rejects_{import_job_uuid}{suffix}.csv.gz")
+
+
+def parse_rejects_file_job_uuid(file_name):
+    if not file_name.startswith('rejects_') or not file_name.endswith('.csv.gz'):
+        return None
+    try:
+        return str(uuid.UUID(file_name[len('rejects_'):-len('.csv.gz')].split('_part')[0]))
+    except ValueError:
+        return None
+
+
+def remove_rejects_files(import_job_uuid):
+    file_paths = glob.glob(os.path.join(get_rejects_dir(), f"rejects_{import_job_uuid}*.csv.gz"))
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+    return len(file_paths)
+
+
+class RejectsWriter:
+    COLUMNS = [*ProductConstants.IMPORT_COLUMNS, ImportJobConstants.REJECTS_REASON_COLUMN]
+    
+    def __init__(self, file_path, include_header=True):
+        self.file_path = file_path
+        self.include_header = include_header
+    
+    @property
+    def size(self):
+        if os.path.exists(self.file_path):
+            return os.path.getsize(self.file_path)
+        return 0
+    
+    def write(self, rows):
+        write_header = self.include_header and self.size == 0
+        
+        with gzip.open(self.file_path, 'at', encoding='utf-8', newline='') as rejects_file:
+            writer = csv.writer(rejects_file)
+            if write_header:
+                writer.writerow(self.COLUMNS)
+            writer.writerows(rows)
+    
+    def truncate(self, size):
+        if not os.path.exists(self.file_path):
+            return
+        
+        if size:
+            os.truncate(self.file_path, size)
+        else:
+            os.remove(self.file_path)
+    
+    def merge(self, part_paths):
+        self.truncate(0)
+        self.write([])
+        
+        with open(self.file_path, 'ab') as rejects_file:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part_file:
+                    shutil.copyfileobj(part_file, rejects_file)
+                os.remove(part_path)
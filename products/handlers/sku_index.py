@@ -0,0 +1,86 @@
+import hashlib
+import heapq
+from array import array
+from bisect import bisect_left
+
+from products.constants import ProductConstants
+from products.dbio import ProductDbIO
+
+
+def hash_sku(sku):
+    return int.from_bytes(
+        hashlib.blake2b(sku.encode('utf-8'), digest_size=8).digest(),
+        'big'
+    )
+
+
+class SkuHashSet:
+    
+    def __init__(self, run_size=None):
+        self.run_size = run_size or ProductConstants.SKU_INDEX_RUN_SIZE
+        self.runs = []
+        self.pending = set()
+    
+    def __contains__(self, sku):
+        return self.contains_hash(hash_sku(sku))
+    
+    def contains_hash(self, sku_hash):
+        if sku_hash in self.pending:
+            return True
+        
+        for run in self.runs:
+            index = bisect_left(run, sku_hash)
+            if index < len(run) and run[index] == sku_hash:
+                return True
+        return False
+    
+    def add(self, sku):
+        self.add_hash(hash_sku(sku))
+    
+    def add_hash(self, sku_hash):
+        self.pending.add(sku_hash)
+        if len(self.pending) >= self.run_size:
+            self.flush()
+    
+    def update(self, skus):
+        for sku in skus:
+            self.add_hash(hash_sku(sku))
+    
+    def iter_hashes(self):
+        self.flush()
+        if len(self.runs) == 1:
+            return iter(self.runs[0])
+        return self._merge_unique(*self.runs)
+    
+    def flush(self):
+        if not self.pending:
+            return
+        
+        self.runs.append(array('Q', sorted(self.pending)))
+        self.pending = set()
+        
+        while len(self.runs) > 1 and len(self.runs[-2]) <= len(self.runs[-1]):
+            newer_run = self.runs.pop()
+            older_run = self.runs.pop()
+            self.runs.append(array('Q', self._merge_unique(older_run, newer_run)))
+    
+    def _merge_unique(self, *runs):
+        previous = None
+        for sku_hash in heapq.merge(*runs):
+            if sku_hash != previous:
+                yield sku_hash
+                previous = sku_hash
+
+
+class ProductSkuIndex(SkuHashSet):
+    
+    @classmethod
+    def build(cls):
+        sku_index = cls()
+        skus = ProductDbIO().get_all().order_by().values_list('sku', flat=True)
+        sku_index.update(skus.iterator(chunk_size=ProductConstants.SKU_INDEX_BUILD_BATCH_SIZE))
+        sku_index.flush()
+        return sku_index
+    
+    def might_contain(self, sku):
+        return sku in self
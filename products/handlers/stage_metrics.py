@@ -0,0 +1,71 @@
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+class QueryCounter:
+    
+    def __init__(self):
+        self.count = 0
+    
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ImportStageMetrics:
+    COUNTER_KEYS = ('calls', 'rows', 'queries', 'wall_seconds', 'cpu_seconds')
+    
+    def __init__(self, stages=None):
+        self.stages = {}
+        if stages:
+            self.merge(stages)
+    
+    @contextmanager
+    def measure(self, stage, rows=0):
+        query_counter = QueryCounter()
+        wall_started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        try:
+            with connection.execute_wrapper(query_counter):
+                yield
+        finally:
+            self.add(
+                stage,
+                rows=rows,
+                queries=query_counter.count,
+                wall_seconds=time.perf_counter() - wall_started_at,
+                cpu_seconds=time.process_time() - cpu_started_at
+            )
+    
+    def add(self, stage, calls=1, rows=0, queries=0, wall_seconds=0.0, cpu_seconds=0.0):
+        metrics = self.stages.setdefault(stage, dict.fromkeys(self.COUNTER_KEYS, 0))
+        metrics['calls'] += calls
+        metrics['rows'] += rows
+        metrics['queries'] += queries
+        metrics['wall_seconds'] += wall_seconds
+        metrics['cpu_seconds'] += cpu_seconds
+    
+    def add_rows(self, stage, rows):
+        self.add(stage, calls=0, rows=rows)
+    
+    def merge(self, stages):
+        for stage, metrics in stages.items():
+            self.add(stage, **{key: metrics.get(key, 0) for key in self.COUNTER_KEYS})
+    
+    def to_dict(self):
+        return {
+            stage: {
+                'calls': metrics['calls'],
+                'rows': metrics['rows'],
+                'queries': metrics['queries'],
+                'wall_seconds': round(metrics['wall_seconds'], 4),
+                'cpu_seconds': round(metrics['cpu_seconds'], 4),
+                'rows_per_second': (
+                    round(metrics['rows'] / metrics['wall_seconds'], 1)
+                    if metrics['rows'] and metrics['wall_seconds'] else None
+                ),
+            }
+            for stage, metrics in self.stages.items()
+        }
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from product_importer.celery import app
+from products.constants import BenchmarkConstants
+from products.handlers.import_benchmark import ImportBenchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmark CsvProcessor end to end against a throwaway copy of the configured database'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=BenchmarkConstants.DEFAULT_ROW_COUNTS)
+        parser.add_argument('--duplicate-ratio', type=float, default=0.0)
+        parser.add_argument('--update-ratio', type=float, default=0.0)
+        parser.add_argument('--invalid-ratio', type=float, default=0.0)
+        parser.add_argument('--description-length', type=int, default=BenchmarkConstants.DESCRIPTION_LENGTH)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--work-dir', default=None, help='Directory for generated files')
+        parser.add_argument('--output', default=None, help='Write the JSON results to this file')
+    
+    def handle(self, *args, **options):
+        app.conf.task_always_eager = True
+        work_dir = options['work_dir'] or tempfile.mkdtemp(prefix='import_benchmark_')
+        os.makedirs(work_dir, exist_ok=True)
+        
+        old_database_name = connection.settings_dict['NAME']
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = os.path.join(
+                work_dir, BenchmarkConstants.SQLITE_DATABASE_NAME
+            )
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        
+        try:
+            results = ImportBenchmark(
+                work_dir,
+                duplicate_ratio=options['duplicate_ratio'],
+                update_ratio=options['update_ratio'],
+                invalid_ratio=options['invalid_ratio'],
+                description_length=options['description_length'],
+                seed=options['seed']
+            ).run_all(options['rows'])
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0)
+        
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                output_file.write(output + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Wrote benchmark results to {options['output']}"))
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from products.constants import BenchmarkConstants
+from products.handlers.catalog_generator import generate_catalog_csv
+
+
+class Command(BaseCommand):
+    help = 'Generate a synthetic product catalog CSV'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Path of the CSV file to write')
+        parser.add_argument('--rows', type=int, default=BenchmarkConstants.DEFAULT_ROW_COUNTS[0])
+        parser.add_argument('--duplicate-ratio', type=float, default=0.0)
+        parser.add_argument('--invalid-ratio', type=float, default=0.0)
+        parser.add_argument('--description-length', type=int, default=BenchmarkConstants.DESCRIPTION_LENGTH)
+        parser.add_argument('--seed', type=int, default=None)
+    
+    def handle(self, *args, **options):
+        generate_catalog_csv(
+            options['output'],
+            options['rows'],
+            duplicate_ratio=options['duplicate_ratio'],
+            invalid_ratio=options['invalid_ratio'],
+            description_length=options['description_length'],
+            seed=options['seed']
+        )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['rows']} rows to {options['output']}"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from products.constants import ImportJobConstants
+from products.handlers.import_job_handler import ImportJobHandler
+
+
+class Command(BaseCommand):
+    help = 'Delete rejects files of import jobs that finished before the retention period and of deleted jobs'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=ImportJobConstants.REJECTS_RETENTION_DAYS)
+    
+    def handle(self, *args, **options):
+        removed_files = ImportJobHandler().purge_expired_rejects(options['days'])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {removed_files} rejects files"))
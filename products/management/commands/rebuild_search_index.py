@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from products.handlers.product_search import SqliteFts5SearchBackend, get_product_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Recreate the SQLite FTS5 product search table and triggers and rebuild the index from the products table; run it after a migration that rebuilds the table and after every VACUUM'
+    
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            search_backend = SqliteFts5SearchBackend()
+        else:
+            search_backend = get_product_search_backend()
+        if search_backend.rebuild_index():
+            self.stdout.write(self.style.SUCCESS('Rebuilt the product search index'))
+        else:
+            self.stdout.write(f"{type(search_backend).__name__} keeps its indexes up to date; nothing to rebuild")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from base.choices import STATE_CHOICES
+from products.handlers.product_counts import ProductStateCounter
+
+
+class Command(BaseCommand):
+    help = 'Recount products per state and reset the maintained product counters'
+    
+    def handle(self, *args, **options):
+        counts = ProductStateCounter().recount()
+        for state, label in STATE_CHOICES:
+            self.stdout.write(f"{label}: {counts[state]}")
+        self.stdout.write(self.style.SUCCESS('Product counters updated'))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_importjob_total_records_estimated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='created_records',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='updated_records',
+            field=models.IntegerField(default=0),
+        ),
+    ]
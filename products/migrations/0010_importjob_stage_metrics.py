@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_importjob_chunk_sizes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='stage_metrics',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
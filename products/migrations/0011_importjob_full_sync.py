@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_importjob_stage_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='deactivated_records',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='full_sync',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='reactivated_records',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='ImportSeenSku',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sku', models.CharField(max_length=255)),
+                ('import_job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seen_skus', to='products.importjob')),
+            ],
+            options={
+                'db_table': 'import_seen_skus',
+                'unique_together': {('import_job', 'sku')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_importjob_full_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='duplicate_policy',
+            field=models.CharField(choices=[('first_wins', 'First Wins'), ('last_wins', 'Last Wins'), ('reject', 'Reject')], default='last_wins', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='importjob',
+            name='duplicate_records',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,94 @@
+from django.db import OperationalError, migrations
+
+
+POSTGRES_FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS products_sku_trgm ON products USING gin (UPPER(sku::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS products_name_trgm ON products USING gin (UPPER(name::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS products_description_trgm ON products USING gin (UPPER(description::text) gin_trgm_ops)",
+    """
+    CREATE INDEX IF NOT EXISTS products_search_vector ON products USING gin (
+        to_tsvector('simple'::regconfig, COALESCE(name::text, '') || ' ' || COALESCE(description::text, ''))
+    )
+    """,
+]
+
+POSTGRES_REVERSE_SQL = [
+    "DROP INDEX IF EXISTS products_search_vector",
+    "DROP INDEX IF EXISTS products_description_trgm",
+    "DROP INDEX IF EXISTS products_name_trgm",
+    "DROP INDEX IF EXISTS products_sku_trgm",
+]
+
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        sku, name, description, content='products', content_rowid='rowid', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts (rowid, sku, name, description)
+        VALUES (new.rowid, new.sku, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts (products_fts, rowid, sku, name, description)
+        VALUES ('delete', old.rowid, old.sku, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_update AFTER UPDATE OF sku, name, description ON products BEGIN
+        INSERT INTO products_fts (products_fts, rowid, sku, name, description)
+        VALUES ('delete', old.rowid, old.sku, old.name, old.description);
+        INSERT INTO products_fts (rowid, sku, name, description)
+        VALUES (new.rowid, new.sku, new.name, new.description);
+    END
+    """,
+    "INSERT INTO products_fts (products_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS products_fts_update",
+    "DROP TRIGGER IF EXISTS products_fts_delete",
+    "DROP TRIGGER IF EXISTS products_fts_insert",
+    "DROP TABLE IF EXISTS products_fts",
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for sql in POSTGRES_FORWARD_SQL:
+            schema_editor.execute(sql)
+    elif vendor == 'sqlite':
+        try:
+            for sql in SQLITE_FORWARD_SQL:
+                schema_editor.execute(sql)
+        except OperationalError:
+            drop_search_indexes(apps, schema_editor)
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        sql_statements = POSTGRES_REVERSE_SQL
+    elif vendor == 'sqlite':
+        sql_statements = SQLITE_REVERSE_SQL
+    else:
+        return
+
+    for sql in sql_statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_importjob_duplicate_policy'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_product_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductStateCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('state', models.IntegerField(choices=[(0, 'ACTIVE'), (1, 'INACTIVE')], unique=True)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'product_state_counts',
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+import base.operations
+
+
+LEGACY_SEARCH_VECTOR_SQL = """
+    CREATE INDEX IF NOT EXISTS products_search_vector ON products USING gin (
+        to_tsvector('simple'::regconfig, COALESCE(name::text, '') || ' ' || COALESCE(description::text, ''))
+    )
+"""
+
+
+def drop_legacy_search_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS products_search_vector")
+
+
+def create_legacy_search_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(LEGACY_SEARCH_VECTOR_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0016_product_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_legacy_search_vector_index, create_legacy_search_vector_index),
+        base.operations.AddPostgresIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', 'description', config='simple'), name='products_search_vector'),
+        ),
+    ]
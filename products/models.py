@@ -1,8 +1,12 @@
+import hashlib
+
 from django.db import models
 
-from base.choices import StateStatuses
+from base.choices import STATE_CHOICES, StateStatuses
 from base.models import AbstractBaseModel
 from products.choices import (
+    DUPLICATE_POLICY_CHOICES,
+    DuplicatePolicies,
     IMPORT_JOB_STATUS_CHOICES,
     ImportJobStatuses,
     WEBHOOK_EVENT_TYPES
@@ -28,11 +32,28 @@ class Product(AbstractBaseModel):
         null=True,
         max_length=ProductConstants.DESCRIPTION_MAX_LENGTH
     )
+    content_hash = models.CharField(
+        max_length=ProductConstants.CONTENT_HASH_LENGTH,
+        blank=True,
+        null=True
+    )
     
     def save(self, *args, **kwargs):
         self.sku = self.sku.lower().strip()
+        self.content_hash = self.build_content_hash(self.name, self.description)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and ('name' in update_fields or 'description' in update_fields):
+            kwargs['update_fields'] = {*update_fields, 'content_hash'}
         super().save(*args, **kwargs)
     
+    @staticmethod
+    def build_content_hash(name, description):
+        content = f"{name}\x1f{description if description is not None else chr(0)}"
+        return hashlib.blake2b(
+            content.encode('utf-8'),
+            digest_size=ProductConstants.CONTENT_HASH_LENGTH // 2
+        ).hexdigest()
+    
     def __str__(self):
         return f"{self.sku} - {self.name}"
     
@@ -49,10 +70,12 @@ class Product(AbstractBaseModel):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['sku']),
+            models.Index(fields=['sku', 'content_hash']),
             models.Index(fields=['state']),
             models.Index(fields=['name']),
             models.Index(fields=['state', 'created_at']),
             models.Index(fields=['state', 'name']),
+            models.Index(fields=['state', '-created_at', '-uuid']),
         ]
 
 
@@ -100,15 +123,57 @@ class ImportJob(AbstractBaseModel):
     )
     progress = models.IntegerField(default=0)
     total_records = models.IntegerField(default=0)
+    total_records_estimated = models.BooleanField(default=False)
     processed_records = models.IntegerField(default=0)
     successful_records = models.IntegerField(default=0)
+    created_records = models.IntegerField(default=0)
+    updated_records = models.IntegerField(default=0)
+    unchanged_records = models.IntegerField(default=0)
     failed_records = models.IntegerField(default=0)
+    duplicate_records = models.IntegerField(default=0)
+    duplicate_policy = models.CharField(
+        max_length=ImportJobConstants.DUPLICATE_POLICY_MAX_LENGTH,
+        choices=DUPLICATE_POLICY_CHOICES,
+        default=DuplicatePolicies.LAST_WINS
+    )
     error_message = models.TextField(blank=True, null=True)
     file_name = models.CharField(
         max_length=ImportJobConstants.FILE_NAME_MAX_LENGTH,
         blank=True
     )
     file_size = models.BigIntegerField(default=0)
+    file_checksum = models.CharField(
+        max_length=ImportJobConstants.FILE_CHECKSUM_MAX_LENGTH,
+        blank=True
+    )
+    file_path = models.CharField(
+        max_length=ImportJobConstants.FILE_PATH_MAX_LENGTH,
+        blank=True
+    )
+    checkpoint_offset = models.BigIntegerField(default=0)
+    checkpoint_records = models.IntegerField(default=0)
+    resume_count = models.IntegerField(default=0)
+    worker_token = models.UUIDField(null=True, blank=True)
+    chunk_size = models.IntegerField(default=0)
+    batch_size = models.IntegerField(default=0)
+    stage_metrics = models.JSONField(default=dict, blank=True)
+    dry_run = models.BooleanField(default=False)
+    full_sync = models.BooleanField(default=False)
+    deactivated_records = models.IntegerField(default=0)
+    reactivated_records = models.IntegerField(default=0)
+    reject_reason_counts = models.JSONField(default=dict, blank=True)
+    rejects_file_path = models.CharField(
+        max_length=ImportJobConstants.FILE_PATH_MAX_LENGTH,
+        blank=True
+    )
+    rejects_file_size = models.BigIntegerField(default=0)
+    retry_of = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='retries'
+    )
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
@@ -131,3 +196,32 @@ class ImportJob(AbstractBaseModel):
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['state', 'created_at']),
         ]
+
+
+class ImportSeenSku(models.Model):
+    
+    import_job = models.ForeignKey(
+        ImportJob,
+        on_delete=models.CASCADE,
+        related_name='seen_skus'
+    )
+    sku = models.CharField(max_length=ProductConstants.SKU_MAX_LENGTH)
+    
+    def __str__(self):
+        return f"{self.import_job_id} - {self.sku}"
+    
+    class Meta:
+        db_table = 'import_seen_skus'
+        unique_together = [['import_job', 'sku']]
+
+
+class ProductStateCount(models.Model):
+    
+    state = models.IntegerField(choices=STATE_CHOICES, unique=True)
+    count = models.BigIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.get_state_display()} - {self.count}"
+    
+    class Meta:
+        db_table = 'product_state_counts'
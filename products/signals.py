@@ -0,0 +1,13 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from products.handlers.rejects_writer import remove_rejects_files
+from products.models import ImportJob
+
+
+@receiver(post_delete, sender=ImportJob)
+def remove_deleted_import_job_rejects(sender, instance, **kwargs):
+    transaction.on_commit(partial(remove_rejects_files, instance.uuid))
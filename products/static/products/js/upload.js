@@ -17,6 +17,8 @@ const uploadAnotherBtn = document.getElementById('uploadAnotherBtn');
 
 let currentJobId = null;
 let pollInterval = null;
+let eventSource = null;
+let jobState = {};
 let isUploading = false;
 
 selectFileBtn.addEventListener('click', (e) => {
@@ -53,10 +55,10 @@ uploadArea.addEventListener('drop', (e) => {
     
     if (e.dataTransfer.files.length > 0) {
         const file = e.dataTransfer.files[0];
-        if (file.name.endsWith('.csv')) {
+        if (isSupportedCsvFile(file.name)) {
             handleFileSelect(file);
         } else {
-            showError('Please select a CSV file');
+            showError('Please select a CSV, JSONL, Parquet or Arrow file');
         }
     }
 });
@@ -137,7 +139,7 @@ function uploadFile(formData) {
         currentJobId = data.job_id;
         statusValue.textContent = data.status || 'pending';
         isUploading = false;
-        startPolling(currentJobId);
+        startProgressUpdates(currentJobId);
     })
     .catch(error => {
         isUploading = false;
@@ -146,6 +148,37 @@ function uploadFile(formData) {
     });
 }
 
+function startProgressUpdates(jobId) {
+    if (!window.EventSource) {
+        startPolling(jobId);
+        return;
+    }
+    
+    stopPolling();
+    jobState = {};
+    eventSource = new EventSource(`/api/import/${jobId}/events/`);
+    
+    eventSource.addEventListener('progress', (event) => {
+        jobState = { ...jobState, ...JSON.parse(event.data) };
+        handleJobStatus(jobState);
+    });
+    
+    eventSource.addEventListener('end', () => {
+        stopPolling();
+    });
+    
+    eventSource.addEventListener('not_found', (event) => {
+        showError(JSON.parse(event.data).error);
+    });
+    
+    eventSource.onerror = () => {
+        if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+            stopPolling();
+            startPolling(jobId);
+        }
+    };
+}
+
 function startPolling(jobId) {
     if (pollInterval) {
         clearInterval(pollInterval);
@@ -161,22 +194,7 @@ function startPolling(jobId) {
                     return;
                 }
                 
-                updateProgress(
-                    data.progress,
-                    data.status,
-                    data.total_records,
-                    data.processed_records,
-                    data.successful_records,
-                    data.failed_records
-                );
-                
-                if (data.status === 'completed') {
-                    stopPolling();
-                    showSuccess();
-                } else if (data.status === 'failed') {
-                    stopPolling();
-                    showError(data.error_message || 'Import failed');
-                }
+                handleJobStatus(data);
             })
             .catch(error => {
                 showError(`Failed to get status: ${error.message}`);
@@ -185,11 +203,34 @@ function startPolling(jobId) {
     }, 2000);
 }
 
+function handleJobStatus(data) {
+    updateProgress(
+        data.progress,
+        data.status,
+        data.total_records,
+        data.processed_records,
+        data.successful_records,
+        data.failed_records
+    );
+    
+    if (data.status === 'completed') {
+        stopPolling();
+        showSuccess();
+    } else if (data.status === 'failed') {
+        stopPolling();
+        showError(data.error_message || 'Import failed');
+    }
+}
+
 function stopPolling() {
     if (pollInterval) {
         clearInterval(pollInterval);
         pollInterval = null;
     }
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
 }
 
 function updateProgress(progress, status, total, processed, successful, failed) {
@@ -224,6 +265,15 @@ function resetUI() {
     stopPolling();
 }
 
+function isSupportedCsvFile(fileName) {
+    const name = fileName.toLowerCase();
+    return [
+        '.csv', '.csv.gz', '.csv.bz2', '.csv.zst',
+        '.jsonl', '.jsonl.gz', '.jsonl.bz2', '.jsonl.zst',
+        '.parquet', '.arrow', '.feather'
+    ].some(extension => name.endsWith(extension));
+}
+
 function formatFileSize(bytes) {
     if (bytes === 0) return '0 Bytes';
     const k = 1024;
@@ -1,32 +1,130 @@
-from celery import shared_task
+from celery import chord, shared_task
 from celery.exceptions import SoftTimeLimitExceeded
 
+from products.constants import ImportJobConstants
+from products.dbio import ImportJobDbIO
 from products.handlers.csv_processor import CsvProcessor
+from products.handlers.import_admission import ImportAdmissionPolicy
+from products.handlers.import_job_handler import ImportJobHandler
 from products.handlers.webhook_handler import WebhookHandler
 from products.choices import WebhookEventTypes
 
 
+def enqueue_csv_import(import_job_uuid, file_path, file_size, parallel=False, countdown=None):
+    task = process_csv_import_parallel if parallel else process_csv_import
+    task.apply_async(
+        args=[import_job_uuid, file_path],
+        queue=ImportAdmissionPolicy().get_queue(file_size),
+        countdown=countdown
+    )
+
+
+def _admit_import(import_job_uuid, file_path, parallel=False):
+    import_job = ImportJobDbIO().get_obj({'uuid': import_job_uuid})
+    if ImportAdmissionPolicy().can_start(import_job):
+        return True
+    
+    enqueue_csv_import(
+        import_job_uuid,
+        file_path,
+        import_job.file_size,
+        parallel=parallel,
+        countdown=ImportJobConstants.ADMISSION_RETRY_DELAY
+    )
+    return False
+
+
 @shared_task(
     time_limit=60 * 60,
-    soft_time_limit=55 * 60
+    soft_time_limit=55 * 60,
+    acks_late=True,
+    reject_on_worker_lost=True
 )
 def process_csv_import(import_job_uuid, file_path):
+    if not _admit_import(import_job_uuid, file_path):
+        return
+    
     processor = CsvProcessor(import_job_uuid)
     try:
         processor.process_csv_file(file_path)
     except SoftTimeLimitExceeded:
+        if processor.import_job is None:
+            processor.import_job = processor.import_job_dbio.get_obj({'uuid': import_job_uuid})
+        
+        if processor.import_job.resume_count < ImportJobConstants.MAX_AUTO_RESUMES:
+            processor.import_job.resume_count += 1
+            processor.import_job.save(update_fields=['resume_count'])
+            processor.flush_progress()
+            processor.release_job()
+            enqueue_csv_import(import_job_uuid, file_path, processor.import_job.file_size)
+            return
+        
         error_msg = (
-            'Import task exceeded time limit (55 minutes). '
+            f'Import task exceeded time limit (55 minutes) after '
+            f'{processor.import_job.resume_count} automatic resumes. '
             'The file may be too large or processing is too slow on the current CPU tier. '
             'Please try with a smaller file or consider upgrading to a higher CPU tier.'
         )
-        if processor.import_job is None:
-            processor.import_job = processor.import_job_dbio.get_obj({'uuid': import_job_uuid})
         processor._handle_processing_error(error_msg)
         processor._trigger_import_failed_webhook(error_msg)
+        processor._remove_file(file_path)
         raise
 
 
+@shared_task(
+    time_limit=10 * 60,
+    soft_time_limit=9 * 60
+)
+def process_csv_import_parallel(import_job_uuid, file_path):
+    if not _admit_import(import_job_uuid, file_path, parallel=True):
+        return None
+    
+    processor = CsvProcessor(import_job_uuid)
+    byte_ranges = processor.start_parallel_import(file_path)
+    if byte_ranges is None:
+        return None
+    if not byte_ranges:
+        processor.finalize_parallel_import([], file_path)
+        return {'ranges': 0}
+    
+    callback = finalize_parallel_csv_import.s(import_job_uuid, file_path)
+    callback.link_error(fail_parallel_csv_import.s(import_job_uuid, file_path))
+    
+    chord(
+        process_csv_range.s(import_job_uuid, file_path, start_offset, end_offset)
+        for start_offset, end_offset in byte_ranges
+    )(callback)
+    
+    return {'ranges': len(byte_ranges)}
+
+
+@shared_task(
+    time_limit=60 * 60,
+    soft_time_limit=55 * 60,
+    acks_late=True,
+    reject_on_worker_lost=True
+)
+def process_csv_range(import_job_uuid, file_path, start_offset, end_offset):
+    return CsvProcessor(import_job_uuid).process_csv_range(
+        file_path, start_offset, end_offset
+    )
+
+
+@shared_task
+def finalize_parallel_csv_import(range_results, import_job_uuid, file_path):
+    CsvProcessor(import_job_uuid).finalize_parallel_import(range_results, file_path)
+
+
+@shared_task
+def fail_parallel_csv_import(request, exc, traceback, import_job_uuid, file_path):
+    CsvProcessor(import_job_uuid).fail_parallel_import(str(exc), file_path)
+
+
+@shared_task
+def purge_expired_import_rejects():
+    return ImportJobHandler().purge_expired_rejects()
+
+
 @shared_task
 def deliver_webhook_task(webhook_uuid, event_type, payload):
     from products.dbio import WebhookDbIO
@@ -1,2 +1,886 @@
-from django.test import TestCase
+import csv
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+import warnings
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipIf
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from base.choices import StateStatuses
+from products.choices import DuplicatePolicies, ImportJobStatuses, RejectReasons
+from products.constants import ImportJobConstants, ProductConstants
+from products.handlers import batch_validator, readers
+from products.handlers.chunk_sizer import AdaptiveChunkSizer, get_current_rss_mb
+from products.handlers.csv_processor import CsvProcessor
+from products.handlers.file_handler import StagedCsvUploadHandler
+from products.handlers.import_job_handler import ImportJobHandler
+from products.handlers.job_event_stream import ImportJobEventStream
+from products.handlers.product_counts import ProductStateCounter
+from products.handlers.product_handler import ProductHandler
+from products.handlers.product_search import SqliteFts5SearchBackend, get_product_search_backend
+from products.handlers.product_upsert import OrmProductUpsertEngine, PostgresCopyUpsertEngine
+from products.models import ImportJob, Product, ProductStateCount
+from products.tasks import process_csv_import_parallel
+
+
+class ProductCursorPaginationTests(TestCase):
+    
+    def setUp(self):
+        Product.objects.bulk_create([
+            Product(sku=f'sku-{i}', name=f'Product {i}') for i in range(7)
+        ])
+        Product.objects.update(created_at=timezone.now())
+    
+    def test_pages_across_rows_with_equal_created_at(self):
+        handler = ProductHandler()
+        seen_uuids = []
+        cursor = None
+        
+        while True:
+            page = handler.list_products_by_cursor(cursor=cursor, page_size=3)
+            seen_uuids.extend(product['uuid'] for product in page['results'])
+            if not page['has_next']:
+                break
+            cursor = page['next_cursor']
+        
+        expected_uuids = [
+            str(product_uuid) for product_uuid in
+            Product.objects.order_by('-created_at', '-uuid').values_list('uuid', flat=True)
+        ]
+        self.assertEqual(seen_uuids, expected_uuids)
+
+
+@skipIf(connection.vendor != 'sqlite', 'the FTS5 search backend only runs on SQLite')
+class SqliteFts5SearchTests(TestCase):
+    
+    def setUp(self):
+        SqliteFts5SearchBackend().rebuild_index()
+        Product.objects.create(sku='lamp-001', name='Desk Lamp', description='Adjustable arm')
+        Product.objects.create(sku='chair-002', name='Office Chair', description='Lumbar support')
+        Product.objects.create(sku='ab-003', name='Ab Roller', description='Core trainer')
+    
+    def search_skus(self, queryset):
+        return sorted(queryset.values_list('sku', flat=True))
+    
+    def test_uses_fts5_backend_once_index_exists(self):
+        self.assertIsInstance(get_product_search_backend(), SqliteFts5SearchBackend)
+    
+    def test_search_matches_trigram_substrings_kept_in_sync_by_triggers(self):
+        search_backend = get_product_search_backend()
+        
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'amp')), ['lamp-001'])
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'lumbar')), ['chair-002'])
+        self.assertEqual(
+            self.search_skus(search_backend.filter_substring(Product.objects.all(), 'sku', 'IR-0')),
+            ['chair-002']
+        )
+        
+        Product.objects.filter(sku='lamp-001').update(name='Floor Light')
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'lamp')), ['lamp-001'])
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'desk')), [])
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'light')), ['lamp-001'])
+        
+        Product.objects.filter(sku='chair-002').delete()
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'lumbar')), [])
+    
+    def test_short_terms_fall_back_to_icontains(self):
+        search_backend = get_product_search_backend()
+        
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'ab')), ['ab-003', 'lamp-001'])
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'ab roller')), ['ab-003'])
+        self.assertEqual(
+            self.search_skus(search_backend.filter_substring(Product.objects.all(), 'name', 'ch')),
+            ['chair-002']
+        )
+    
+    def test_rebuild_index_restores_search_after_triggers_are_dropped(self):
+        fts_table = ProductConstants.SEARCH_FTS_TABLE
+        with connection.cursor() as cursor:
+            for trigger_name in SqliteFts5SearchBackend.TRIGGER_NAMES:
+                cursor.execute(f'DROP TRIGGER {trigger_name}')
+            cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('delete-all')")
+        Product.objects.create(sku='desk-004', name='Standing Desk')
+        self.assertNotIsInstance(get_product_search_backend(), SqliteFts5SearchBackend)
+        
+        SqliteFts5SearchBackend().rebuild_index()
+        
+        search_backend = get_product_search_backend()
+        self.assertIsInstance(search_backend, SqliteFts5SearchBackend)
+        self.assertEqual(self.search_skus(search_backend.search(Product.objects.all(), 'desk')), ['desk-004', 'lamp-001'])
+
+
+class ProductStateCounterTests(TestCase):
+    
+    def setUp(self):
+        ProductStateCounter().recount()
+        handler = ProductHandler()
+        self.products = [
+            handler.create_product({'sku': f'count-{i}', 'name': f'Counted {i}'}) for i in range(4)
+        ]
+        handler.delete_product(self.products[0]['uuid'])
+    
+    def test_maintains_counts_through_product_writes(self):
+        counter = ProductStateCounter()
+        
+        self.assertEqual(counter.get(StateStatuses.ACTIVE), 3)
+        self.assertEqual(counter.get(StateStatuses.INACTIVE), 1)
+        self.assertEqual(counter.total(), 4)
+        
+        ProductHandler().bulk_delete_all_products()
+        self.assertEqual(counter.get(StateStatuses.ACTIVE), 0)
+        self.assertEqual(counter.get(StateStatuses.INACTIVE), 4)
+    
+    def test_recount_products_repairs_drifted_counts(self):
+        handler = ProductHandler()
+        Product.objects.filter(sku='count-1').update(state=StateStatuses.INACTIVE)
+        
+        page = handler.list_products()
+        self.assertEqual((page['total_count'], page['total_count_exact']), (3, False))
+        filtered_page = handler.list_products({'name': 'Counted'})
+        self.assertEqual((filtered_page['total_count'], filtered_page['total_count_exact']), (2, True))
+        
+        output = StringIO()
+        call_command('recount_products', stdout=output)
+        
+        self.assertIn('Product counters updated', output.getvalue())
+        page = handler.list_products()
+        self.assertEqual((page['total_count'], page['total_count_exact']), (2, False))
+        self.assertEqual(ProductStateCounter().get(StateStatuses.INACTIVE), 2)
+    
+    def test_recounts_when_counter_rows_are_missing(self):
+        ProductStateCount.objects.all().delete()
+        
+        self.assertEqual(ProductStateCounter().total(), 4)
+        self.assertEqual(
+            dict(ProductStateCount.objects.values_list('state', 'count')),
+            {StateStatuses.ACTIVE: 3, StateStatuses.INACTIVE: 1}
+        )
+
+
+class ProductResponseCacheTests(TestCase):
+    
+    def setUp(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        cache_settings = override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': cache_dir},
+        })
+        cache_settings.enable()
+        self.addCleanup(cache_settings.disable)
+        ProductStateCounter().recount()
+        self.product = ProductHandler().create_product({'sku': 'cached-1', 'name': 'Cached One'})
+    
+    def listed_skus(self, handler):
+        return [product['sku'] for product in handler.list_products()['results']]
+    
+    def test_serves_cached_pages_until_catalog_version_changes(self):
+        handler = ProductHandler()
+        self.assertTrue(handler.response_cache.enabled)
+        self.assertEqual(self.listed_skus(handler), ['cached-1'])
+        self.assertEqual(handler.get_product(self.product['uuid'])['name'], 'Cached One')
+        
+        Product.objects.filter(sku='cached-1').update(name='Renamed Outside The API')
+        self.assertEqual(handler.get_product(self.product['uuid'])['name'], 'Cached One')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            handler.create_product({'sku': 'cached-2', 'name': 'Cached Two'})
+        
+        self.assertEqual(sorted(self.listed_skus(handler)), ['cached-1', 'cached-2'])
+        self.assertEqual(handler.get_product(self.product['uuid'])['name'], 'Renamed Outside The API')
+    
+    def test_bumps_version_only_after_commit(self):
+        handler = ProductHandler()
+        version = handler.response_cache.get_version()
+        
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            handler.delete_product(self.product['uuid'])
+        
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(handler.response_cache.get_version(), version)
+        callbacks[0]()
+        self.assertNotEqual(handler.response_cache.get_version(), version)
+        self.assertEqual(self.listed_skus(handler), [])
+    
+    def test_disabled_for_process_local_cache(self):
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertFalse(ProductHandler().response_cache.enabled)
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class ProductExportStreamingTests(TestCase):
+    
+    def setUp(self):
+        Product.objects.bulk_create([
+            Product(sku=f'sku-{i}', name=f'Product {i}', description='x' * 50) for i in range(200)
+        ])
+    
+    @mock.patch.object(ProductConstants, 'EXPORT_FLUSH_SIZE', 1024)
+    def test_wsgi_export_is_streamed_in_chunks(self):
+        response = self.client.get('/api/products/export/')
+        
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks).count(b'\n'), 201)
+    
+    @mock.patch.object(ProductConstants, 'EXPORT_FLUSH_SIZE', 1024)
+    async def test_asgi_export_is_streamed_from_an_async_iterator(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings('error', message='StreamingHttpResponse must consume')
+            response = await self.async_client.get('/api/products/export/', {'file_format': 'jsonl'})
+            
+            self.assertTrue(response.streaming)
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks).count(b'\n'), 200)
+
+
+@mock.patch('products.tasks.trigger_webhooks_for_event.delay')
+@mock.patch.object(ProductConstants, 'ADAPTIVE_CHUNK_SIZING', False)
+@mock.patch.object(ProductConstants, 'CSV_CHUNK_SIZE', 500)
+@mock.patch.object(ProductConstants, 'PROGRESS_UPDATE_TIME_INTERVAL', 0)
+class CsvImportPipelineTests(TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+        settings_override = override_settings(BASE_DIR=self.work_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+    
+    def write_csv(self, rows, name='products.csv'):
+        file_path = os.path.join(self.work_dir, name)
+        with open(file_path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['sku', 'name', 'description'])
+            writer.writerows(rows)
+        return file_path
+    
+    def create_job(self, file_path, **fields):
+        return ImportJob.objects.create(
+            file_name=os.path.basename(file_path),
+            file_size=os.path.getsize(file_path),
+            file_path=file_path,
+            **fields
+        )
+    
+    def import_file(self, rows, **fields):
+        file_path = self.write_csv(rows)
+        import_job = self.create_job(file_path, **fields)
+        CsvProcessor(str(import_job.uuid)).process_csv_file(file_path)
+        import_job.refresh_from_db()
+        return import_job
+    
+    def import_file_in_ranges(self, rows, **fields):
+        file_path = self.write_csv(rows)
+        import_job = self.create_job(file_path, **fields)
+        job_uuid = str(import_job.uuid)
+        
+        byte_ranges = CsvProcessor(job_uuid).start_parallel_import(file_path)
+        range_results = [
+            CsvProcessor(job_uuid).process_csv_range(file_path, start_offset, end_offset)
+            for start_offset, end_offset in byte_ranges
+        ]
+        CsvProcessor(job_uuid).finalize_parallel_import(range_results, file_path)
+        import_job.refresh_from_db()
+        return import_job, len(byte_ranges)
+    
+    def build_duplicate_rows(self):
+        rows = [[f'sku-{i % 1000}', f'Product {i}', f'Description {i}'] for i in range(1500)]
+        rows.append(['', 'Missing sku', ''])
+        return rows
+    
+    def expected_names(self, rows, policy):
+        names = {}
+        for sku, name, _ in rows:
+            if not sku:
+                continue
+            if policy == DuplicatePolicies.LAST_WINS or sku not in names:
+                names[sku] = name
+        return names
+    
+    def product_names(self):
+        return dict(Product.objects.values_list('sku', 'name'))
+    
+    def test_counts_created_updated_and_unchanged_rows(self, _):
+        rows = [[f'sku-{i}', f'Product {i}', f'Description {i}'] for i in range(1200)]
+        import_job = self.import_file(rows)
+        
+        self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+        self.assertEqual(import_job.total_records, 1200)
+        self.assertEqual(import_job.processed_records, 1200)
+        self.assertEqual(import_job.created_records, 1200)
+        self.assertEqual(Product.objects.count(), 1200)
+        
+        rows[10][1] = 'Renamed product'
+        import_job = self.import_file(rows)
+        
+        self.assertEqual(import_job.created_records, 0)
+        self.assertEqual(import_job.updated_records, 1)
+        self.assertEqual(import_job.unchanged_records, 1199)
+        self.assertEqual(Product.objects.get(sku='sku-10').name, 'Renamed product')
+    
+    def test_rejects_invalid_rows(self, _):
+        rows = [
+            ['sku-1', 'Product 1', ''],
+            ['', 'Missing sku', ''],
+            ['sku-2', '', 'Missing name'],
+            ['x' * (ProductConstants.SKU_MAX_LENGTH + 1), 'Long sku', ''],
+            ['sku-3', 'Product 3', 'Description 3'],
+        ]
+        import_job = self.import_file(rows)
+        
+        self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+        self.assertEqual(import_job.successful_records, 2)
+        self.assertEqual(import_job.failed_records, 3)
+        self.assertEqual(import_job.reject_reason_counts, {
+            RejectReasons.MISSING_SKU: 1,
+            RejectReasons.MISSING_NAME: 1,
+            RejectReasons.SKU_TOO_LONG: 1,
+        })
+        self.assertTrue(os.path.exists(import_job.rejects_file_path))
+        self.assertEqual(set(self.product_names()), {'sku-1', 'sku-3'})
+    
+    def test_deleting_a_job_removes_its_rejects_file(self, _):
+        import_job = self.import_file([['sku-1', 'Product 1', ''], ['', 'Missing sku', '']])
+        rejects_file_path = import_job.rejects_file_path
+        
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            import_job.delete()
+        self.assertTrue(os.path.exists(rejects_file_path))
+        
+        for callback in callbacks:
+            callback()
+        self.assertFalse(os.path.exists(rejects_file_path))
+    
+    def test_purges_expired_and_orphaned_rejects_files(self, _):
+        rows = [['sku-1', 'Product 1', ''], ['', 'Missing sku', '']]
+        expired_job = self.import_file(rows)
+        recent_job = self.import_file(rows)
+        ImportJob.objects.filter(uuid=expired_job.uuid).update(
+            completed_at=timezone.now() - timedelta(days=ImportJobConstants.REJECTS_RETENTION_DAYS + 1)
+        )
+        rejects_dir = os.path.dirname(recent_job.rejects_file_path)
+        orphaned_file_path = os.path.join(rejects_dir, f'rejects_{uuid.uuid4()}_part0.csv.gz')
+        stale_orphaned_file_path = os.path.join(rejects_dir, f'rejects_{uuid.uuid4()}.csv.gz')
+        for file_path in (orphaned_file_path, stale_orphaned_file_path):
+            with open(file_path, 'wb'):
+                pass
+        stale_mtime = (timezone.now() - timedelta(days=ImportJobConstants.REJECTS_RETENTION_DAYS + 1)).timestamp()
+        os.utime(stale_orphaned_file_path, (stale_mtime, stale_mtime))
+        
+        output = StringIO()
+        call_command('purge_import_rejects', stdout=output)
+        
+        self.assertIn('Deleted 2 rejects files', output.getvalue())
+        self.assertFalse(os.path.exists(expired_job.rejects_file_path))
+        self.assertFalse(os.path.exists(stale_orphaned_file_path))
+        self.assertTrue(os.path.exists(recent_job.rejects_file_path))
+        self.assertTrue(os.path.exists(orphaned_file_path))
+        expired_job.refresh_from_db()
+        self.assertEqual((expired_job.rejects_file_path, expired_job.rejects_file_size), ('', 0))
+        self.assertFalse(ImportJobHandler().serialize_job(expired_job)['rejects_available'])
+    
+    @mock.patch.object(ProductConstants, 'CSV_MAX_DECOMPRESSED_SIZE', 20000)
+    def test_fails_compressed_file_over_the_decompressed_size_cap(self, _):
+        rows = [[f'sku-{i}', f'Product {i}', f'Description {i}'] for i in range(1200)]
+        csv_path = self.write_csv(rows)
+        file_path = f'{csv_path}.gz'
+        with open(csv_path, 'rb') as csv_file, gzip.open(file_path, 'wb') as gzip_file:
+            shutil.copyfileobj(csv_file, gzip_file)
+        import_job = self.create_job(file_path)
+        
+        with self.assertRaises(ValueError):
+            CsvProcessor(str(import_job.uuid)).process_csv_file(file_path)
+        import_job.refresh_from_db()
+        
+        self.assertEqual(import_job.status, ImportJobStatuses.FAILED)
+        self.assertIn('Decompressed CSV exceeds maximum allowed size', import_job.error_message)
+        self.assertLess(Product.objects.count(), 1200)
+    
+    def build_format_rows(self):
+        rows = [[f'sku-{i}', f'Product {i}', f'Description {i}'] for i in range(1200)]
+        rows.append(['', 'Missing sku', ''])
+        rows.append(['sku-missing-name', None, ''])
+        return rows
+    
+    def write_format_file(self, rows, file_format):
+        file_path = os.path.join(self.work_dir, f'products.{file_format}')
+        if file_format == 'jsonl':
+            with open(file_path, 'w') as jsonl_file:
+                for sku, name, description in rows:
+                    jsonl_file.write(json.dumps({'sku': sku, 'name': name, 'description': description}))
+                    jsonl_file.write('\n')
+                jsonl_file.write('{not json\n')
+            return file_path
+        
+        table = readers.pa.table({
+            field: [row[index] for row in rows]
+            for index, field in enumerate(ProductConstants.IMPORT_COLUMNS)
+        })
+        if file_format == 'parquet':
+            readers.pq.write_table(table, file_path, row_group_size=300)
+        else:
+            with readers.ipc.new_file(file_path, table.schema) as writer:
+                writer.write_table(table, max_chunksize=300)
+        return file_path
+    
+    def read_rejects(self, import_job):
+        with gzip.open(import_job.rejects_file_path, 'rt', newline='') as rejects_file:
+            return list(csv.reader(rejects_file))[1:]
+    
+    @skipIf(readers.pa is None, 'pyarrow is not installed')
+    def test_imports_jsonl_parquet_and_arrow_files(self, _):
+        rows = self.build_format_rows()
+        
+        for file_format in ('jsonl', 'parquet', 'arrow'):
+            with self.subTest(file_format=file_format):
+                Product.objects.all().delete()
+                file_path = self.write_format_file(rows, file_format)
+                import_job = self.create_job(file_path)
+                CsvProcessor(str(import_job.uuid)).process_csv_file(file_path)
+                import_job.refresh_from_db()
+                
+                expected_reasons = {RejectReasons.MISSING_SKU: 1, RejectReasons.MISSING_NAME: 1}
+                if file_format == 'jsonl':
+                    expected_reasons[RejectReasons.MALFORMED_ROW] = 1
+                
+                self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+                self.assertEqual(import_job.successful_records, 1200)
+                self.assertEqual(import_job.created_records, 1200)
+                self.assertEqual(import_job.reject_reason_counts, expected_reasons)
+                self.assertEqual(
+                    sorted(row[-1] for row in self.read_rejects(import_job)),
+                    sorted(reason for reason, count in expected_reasons.items() for _ in range(count))
+                )
+                self.assertEqual(Product.objects.get(sku='sku-1199').name, 'Product 1199')
+    
+    def seed_full_sync_catalog(self):
+        Product.objects.all().delete()
+        Product.objects.bulk_create([
+            Product(sku=f'sku-{i}', name=f'Product {i}', state=StateStatuses.ACTIVE) for i in range(1000)
+        ] + [
+            Product(sku=f'old-{i}', name=f'Old {i}', state=StateStatuses.INACTIVE) for i in range(10)
+        ])
+    
+    def test_full_sync_deactivates_unseen_and_reactivates_seen_products(self, _):
+        rows = [[f'sku-{i}', f'Product {i}', ''] for i in range(600)]
+        rows.extend([f'old-{i}', f'Old {i}', ''] for i in range(4))
+        rows.append(['sku-999', '', 'Rejected but seen'])
+        rows.append(['new-1', 'New 1', ''])
+        
+        for dry_run in (True, False):
+            with self.subTest(dry_run=dry_run):
+                self.seed_full_sync_catalog()
+                import_job = self.import_file(rows, full_sync=True, dry_run=dry_run)
+                
+                self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+                self.assertEqual(import_job.deactivated_records, 399)
+                self.assertEqual(import_job.reactivated_records, 4)
+                self.assertEqual(import_job.created_records, 1)
+                
+                active_count = Product.objects.filter(state=StateStatuses.ACTIVE).count()
+                self.assertEqual(active_count, 1000 if dry_run else 606)
+        
+        self.assertEqual(Product.objects.get(sku='sku-999').state, StateStatuses.ACTIVE)
+        self.assertEqual(Product.objects.get(sku='sku-700').state, StateStatuses.INACTIVE)
+    
+    def test_full_sync_without_valid_products_fails(self, _):
+        self.seed_full_sync_catalog()
+        
+        with self.assertRaises(ValueError):
+            self.import_file([['', 'Missing sku', '']], full_sync=True)
+        
+        self.assertEqual(ImportJob.objects.get().status, ImportJobStatuses.FAILED)
+        self.assertEqual(Product.objects.filter(state=StateStatuses.ACTIVE).count(), 1000)
+    
+    def test_applies_duplicate_policies_across_chunks(self, _):
+        rows = self.build_duplicate_rows()
+        
+        for policy in DuplicatePolicies.POLICIES:
+            with self.subTest(policy=policy):
+                Product.objects.all().delete()
+                import_job = self.import_file(rows, duplicate_policy=policy)
+                
+                self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+                self.assertEqual(import_job.successful_records, 1000)
+                self.assertEqual(import_job.created_records, 1000)
+                self.assertEqual(import_job.duplicate_records, 500)
+                self.assertEqual(self.product_names(), self.expected_names(rows, policy))
+                
+                expected_updated = 500 if policy == DuplicatePolicies.LAST_WINS else 0
+                self.assertEqual(import_job.updated_records, expected_updated)
+                
+                expected_failed = 501 if policy == DuplicatePolicies.REJECT else 1
+                self.assertEqual(import_job.failed_records, expected_failed)
+    
+    def test_last_wins_writes_a_repeated_sku_once_per_chunk(self, _):
+        self.import_file([['sku-a', 'A1', '']])
+        original_upsert = OrmProductUpsertEngine.upsert
+        
+        with mock.patch.object(OrmProductUpsertEngine, 'upsert', autospec=True,
+                               side_effect=original_upsert) as upsert:
+            import_job = self.import_file([['sku-a', 'A1', ''], ['sku-a', 'A3', '']])
+        
+        self.assertEqual(upsert.call_count, 1)
+        self.assertEqual([p['name'] for p in upsert.call_args.args[1]], ['A3'])
+        self.assertEqual(import_job.updated_records, 1)
+        self.assertEqual(import_job.unchanged_records, 0)
+        self.assertEqual(import_job.duplicate_records, 1)
+        self.assertEqual(Product.objects.get(sku='sku-a').name, 'A3')
+    
+    def test_dry_run_reports_last_wins_overwrites_like_an_import(self, _):
+        self.import_file([['sku-a', 'A1', '']])
+        rows = [['sku-a', 'A1', '']]
+        rows.extend([f'sku-{i}', f'Product {i}', ''] for i in range(499))
+        rows.append(['sku-a', 'A3', ''])
+        
+        dry_run_job = self.import_file(rows, dry_run=True)
+        self.assertEqual(Product.objects.get(sku='sku-a').name, 'A1')
+        import_job = self.import_file(rows)
+        
+        self.assertEqual(Product.objects.get(sku='sku-a').name, 'A3')
+        for field in CsvProcessor.COUNTER_FIELDS:
+            self.assertEqual(getattr(dry_run_job, field), getattr(import_job, field), field)
+        self.assertEqual(import_job.updated_records, 1)
+    
+    def test_dry_run_treats_products_without_content_hash_as_existing(self, _):
+        Product.objects.bulk_create([Product(sku='sku-a', name='A1')])
+        
+        import_job = self.import_file([['sku-a', 'A1', '']], dry_run=True)
+        
+        self.assertEqual(import_job.created_records, 0)
+        self.assertEqual(import_job.updated_records, 1)
+    
+    @override_settings(IMPORT_WORKER_CONCURRENCY=4)
+    @mock.patch.object(ProductConstants, 'PARALLEL_IMPORT_MIN_RANGE_SIZE', 1024)
+    def test_applies_duplicate_policies_across_ranges(self, _):
+        rows = self.build_duplicate_rows()
+        
+        for policy in DuplicatePolicies.POLICIES:
+            with self.subTest(policy=policy):
+                Product.objects.all().delete()
+                import_job, range_count = self.import_file_in_ranges(rows, duplicate_policy=policy)
+                
+                self.assertGreater(range_count, 1)
+                self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+                self.assertEqual(import_job.successful_records, 1000)
+                self.assertEqual(import_job.duplicate_records, 500)
+                self.assertEqual(self.product_names(), self.expected_names(rows, policy))
+                self.assertFalse([
+                    name for name in os.listdir(self.work_dir) if '.duplicates_part' in name
+                ])
+    
+    def test_parallel_import_of_header_only_file_completes(self, _):
+        file_path = self.write_csv([])
+        import_job = self.create_job(file_path)
+        
+        result = process_csv_import_parallel(str(import_job.uuid), file_path)
+        import_job.refresh_from_db()
+        
+        self.assertEqual(result, {'ranges': 0})
+        self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+        self.assertEqual(import_job.total_records, 0)
+        self.assertFalse(os.path.exists(file_path))
+    
+    def interrupt_import(self, file_path, import_job, chunk_number):
+        original_commit_chunk = CsvProcessor._commit_chunk
+        
+        def interrupt_chunk(processor, *args):
+            processor.chunks_committed = getattr(processor, 'chunks_committed', 0) + 1
+            if processor.chunks_committed == chunk_number:
+                raise SoftTimeLimitExceeded()
+            return original_commit_chunk(processor, *args)
+        
+        processor = CsvProcessor(str(import_job.uuid))
+        with mock.patch.object(CsvProcessor, '_commit_chunk', autospec=True,
+                               side_effect=interrupt_chunk):
+            with self.assertRaises(SoftTimeLimitExceeded):
+                processor.process_csv_file(file_path)
+        processor.flush_progress()
+        processor.release_job()
+        import_job.refresh_from_db()
+    
+    def test_resumes_from_checkpoint(self, _):
+        rows = self.build_duplicate_rows()
+        
+        for policy in (DuplicatePolicies.FIRST_WINS, DuplicatePolicies.LAST_WINS):
+            with self.subTest(policy=policy):
+                Product.objects.all().delete()
+                file_path = self.write_csv(rows)
+                import_job = self.create_job(file_path, duplicate_policy=policy)
+                
+                self.interrupt_import(file_path, import_job, chunk_number=3)
+                self.assertEqual(import_job.checkpoint_records, 1000)
+                
+                CsvProcessor(str(import_job.uuid)).process_csv_file(file_path)
+                import_job.refresh_from_db()
+                
+                self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+                self.assertEqual(import_job.successful_records, 1000)
+                self.assertEqual(import_job.created_records, 1000)
+                self.assertEqual(import_job.duplicate_records, 500)
+                self.assertEqual(import_job.failed_records, 1)
+                self.assertEqual(self.product_names(), self.expected_names(rows, policy))
+    
+    def test_throttled_progress_keeps_every_checkpoint(self, _):
+        rows = [[f'sku-{i}', f'Product {i}', f'Description {i}'] for i in range(2000)]
+        file_path = self.write_csv(rows)
+        import_job = self.create_job(file_path)
+        
+        with mock.patch.object(ProductConstants, 'PROGRESS_UPDATE_TIME_INTERVAL', 60):
+            self.interrupt_import(file_path, import_job, chunk_number=4)
+        
+        self.assertEqual(Product.objects.count(), 1500)
+        self.assertEqual(import_job.checkpoint_records, 1500)
+        self.assertEqual(import_job.created_records, 1500)
+        
+        CsvProcessor(str(import_job.uuid)).process_csv_file(file_path)
+        import_job.refresh_from_db()
+        
+        self.assertEqual(import_job.status, ImportJobStatuses.COMPLETED)
+        self.assertEqual(import_job.created_records, 2000)
+        self.assertEqual(import_job.unchanged_records, 0)
+
+
+class AdaptiveChunkSizerTests(TestCase):
+    
+    def record_chunks(self, rss_readings, db_seconds=0.1):
+        chunk_sizer = AdaptiveChunkSizer(8000, enabled=True)
+        chunk_sizes = []
+        with mock.patch('products.handlers.chunk_sizer.get_current_rss_mb', side_effect=rss_readings):
+            for _ in rss_readings:
+                chunk_sizes.append(chunk_sizer.record_chunk(chunk_sizer.chunk_size, db_seconds))
+        return chunk_sizes
+    
+    def test_grows_back_once_rss_drops_under_the_cap(self):
+        rss_over_cap = ProductConstants.CHUNK_MAX_RSS_MB + 1
+        rss_under_cap = ProductConstants.CHUNK_MAX_RSS_MB - 1
+        
+        self.assertEqual(
+            self.record_chunks([rss_over_cap, rss_over_cap, rss_under_cap, rss_under_cap]),
+            [4000, 2000, 4500, 7000]
+        )
+    
+    def test_skips_memory_check_without_current_rss(self):
+        self.assertEqual(self.record_chunks([None, None]), [10500, 13000])
+        self.assertEqual(self.record_chunks([None], db_seconds=2), [4000])
+        
+        with mock.patch('builtins.open', side_effect=OSError):
+            self.assertIsNone(get_current_rss_mb())
+
+
+class ProductUpsertEngineTests(TestCase):
+    
+    def build_products_data(self, names):
+        return [
+            {
+                'sku': sku,
+                'name': name,
+                'description': 'Upserted',
+                'content_hash': Product.build_content_hash(name, 'Upserted'),
+            }
+            for sku, name in names.items()
+        ]
+    
+    def assert_upserts(self, upsert_engine):
+        Product.objects.create(sku='upsert-1', name='Unchanged', description='Upserted')
+        Product.objects.create(sku='upsert-2', name='Stale', description='Upserted')
+        
+        counts = upsert_engine.upsert(self.build_products_data({
+            'upsert-1': 'Unchanged', 'upsert-2': 'Fresh', 'upsert-3': 'Created',
+        }))
+        
+        self.assertEqual(counts, (1, 1))
+        self.assertEqual(
+            dict(Product.objects.values_list('sku', 'name')),
+            {'upsert-1': 'Unchanged', 'upsert-2': 'Fresh', 'upsert-3': 'Created'}
+        )
+        self.assertEqual(Product.objects.get(sku='upsert-3').state, StateStatuses.ACTIVE)
+    
+    def test_orm_engine_creates_and_updates_changed_products(self):
+        self.assert_upserts(OrmProductUpsertEngine())
+    
+    @skipIf(connection.vendor != 'postgresql', 'the COPY upsert engine only runs on PostgreSQL')
+    def test_copy_engine_creates_and_updates_changed_products(self):
+        self.assert_upserts(PostgresCopyUpsertEngine())
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+@mock.patch.object(StagedCsvUploadHandler, 'chunk_size', 8)
+@mock.patch('products.handlers.csv_upload_handler.enqueue_csv_import')
+class StagedCsvUploadTests(TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+        settings_override = override_settings(BASE_DIR=self.work_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.staging_dir = os.path.join(self.work_dir, 'temp_csv_files')
+    
+    def upload(self, name, content, **data):
+        return self.client.post('/api/upload/', {'file': SimpleUploadedFile(name, content), **data})
+    
+    def staged_files(self):
+        return os.listdir(self.staging_dir) if os.path.isdir(self.staging_dir) else []
+    
+    def test_stages_upload_in_chunks_and_enqueues_job(self, enqueue_csv_import):
+        content = b'sku,name,description\n' + b''.join(
+            f'staged-{i},Staged {i},Streamed to disk\n'.encode() for i in range(50)
+        )
+        
+        response = self.upload('products.csv', content)
+        
+        self.assertEqual(response.status_code, 201)
+        import_job = ImportJob.objects.get(uuid=response.json()['job_id'])
+        self.assertEqual(import_job.file_size, len(content))
+        self.assertEqual(import_job.file_checksum, hashlib.sha256(content).hexdigest())
+        with open(import_job.file_path, 'rb') as staged_file:
+            self.assertEqual(staged_file.read(), content)
+        enqueue_csv_import.assert_called_once_with(
+            str(import_job.uuid), import_job.file_path, len(content), parallel=False
+        )
+    
+    def test_validates_header_of_compressed_upload(self, enqueue_csv_import):
+        content = gzip.compress(b'sku,name\nstaged-1,Staged 1\n')
+        
+        response = self.upload('products.csv.gz', content)
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(self.staged_files()), 1)
+    
+    def test_discards_staged_file_when_validation_fails(self, enqueue_csv_import):
+        cases = [
+            ('products.csv', b'sku,title\nstaged-1,Staged 1\n', {}, 'missing required columns: name'),
+            ('products.csv', b'sku,name\nstaged-1,Staged 1\n', {'duplicate_policy': 'newest'}, 'Invalid duplicate policy'),
+            ('products.csv', b'sku,name\n', {'retry_of': 'not-a-job'}, 'Invalid import job ID'),
+        ]
+        for name, content, data, error in cases:
+            with self.subTest(error=error):
+                response = self.upload(name, content, **data)
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(error, response.json()['error'])
+                self.assertEqual(self.staged_files(), [])
+        
+        with mock.patch.object(ProductConstants, 'CSV_MAX_FILE_SIZE', 32):
+            response = self.upload('products.csv', b'sku,name\n' + b'staged-1,Staged 1\n' * 4)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.staged_files(), [])
+        self.assertFalse(ImportJob.objects.exists())
+        enqueue_csv_import.assert_not_called()
+
+
+@skipIf(batch_validator.pa is None, 'pyarrow is not installed')
+class BatchValidatorTests(TestCase):
+    
+    def build_columns(self):
+        long_sku = 'S' * (ProductConstants.SKU_MAX_LENGTH + 1)
+        long_name = 'N' * (ProductConstants.PRODUCT_NAME_MAX_LENGTH + 1)
+        long_description = 'D' * (ProductConstants.DESCRIPTION_MAX_LENGTH + 10)
+        rows = [
+            ('  SKU-Mixed ', ' Name ', ' Description '),
+            ('sku-1', 'Name 1', ''),
+            ('sku-2', 'Name 2', '   '),
+            ('\tsku-3\n', 'Name 3', long_description),
+            ('', 'Missing sku', ''),
+            ('   ', 'Blank sku', ''),
+            ('sku-4', '', ''),
+            ('sku-5', ' \t ', ''),
+            (long_sku, 'Long sku', ''),
+            ('sku-6', long_name, ''),
+            (None, 'Malformed', ''),
+            ('sku-7', 'Malformed', None),
+        ]
+        rows = rows * 20
+        return {
+            field: [row[index] for row in rows]
+            for index, field in enumerate(ProductConstants.IMPORT_COLUMNS)
+        }
+    
+    def test_arrow_and_python_validation_agree(self):
+        columns = self.build_columns()
+        
+        python_result = batch_validator._validate_python_batch(columns)
+        with mock.patch.object(ProductConstants, 'ARROW_VALIDATION_MIN_BATCH_SIZE', 1), \
+                mock.patch.object(batch_validator, '_validate_arrow_batch',
+                                  wraps=batch_validator._validate_arrow_batch) as validate_arrow_batch:
+            arrow_result = batch_validator.validate_product_batch(columns)
+        
+        validate_arrow_batch.assert_called_once()
+        self.assertEqual(arrow_result, python_result)
+        self.assertEqual(len(python_result[0]), 80)
+        self.assertEqual(
+            list(batch_validator.iter_valid_skus(columns)),
+            [product['sku'] for product in python_result[0]]
+        )
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class ImportJobEventStreamTests(TestCase):
+    
+    def parse_events(self, content):
+        events = []
+        for block in content.split('\n\n'):
+            fields = dict(line.split(': ', 1) for line in block.splitlines() if ': ' in line)
+            if 'event' in fields:
+                events.append((fields['event'], json.loads(fields['data'])))
+        return events
+    
+    def test_stream_ends_for_finished_job(self):
+        import_job = ImportJob.objects.create(file_name='products.csv', status=ImportJobStatuses.COMPLETED)
+        
+        response = self.client.get(f'/api/import/{import_job.uuid}/events/')
+        content = b''.join(response.streaming_content).decode()
+        
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertTrue(content.startswith(f'retry: {ImportJobConstants.EVENT_STREAM_RETRY_MS}'))
+        events = self.parse_events(content)
+        self.assertEqual([event_type for event_type, _ in events], ['progress', 'end'])
+        self.assertEqual(events[0][1]['status'], ImportJobStatuses.COMPLETED)
+        self.assertEqual(events[1][1], {'status': ImportJobStatuses.COMPLETED})
+    
+    async def test_async_stream_ends_for_finished_job(self):
+        import_job = await ImportJob.objects.acreate(file_name='products.csv', status=ImportJobStatuses.FAILED)
+        
+        response = await self.async_client.get(f'/api/import/{import_job.uuid}/events/')
+        content = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        
+        self.assertTrue(response.is_async)
+        self.assertEqual(self.parse_events(content)[-1], ('end', {'status': ImportJobStatuses.FAILED}))
+    
+    def test_unknown_job_returns_not_found(self):
+        response = self.client.get('/api/import/00000000-0000-0000-0000-000000000000/events/')
+        
+        self.assertEqual(response.status_code, 404)
+    
+    @mock.patch.object(ImportJobConstants, 'EVENT_STREAM_POLL_INTERVAL', 0)
+    def test_stream_reports_job_deleted_while_streaming(self):
+        import_job = ImportJob.objects.create(file_name='products.csv', status=ImportJobStatuses.PROCESSING)
+        job_uuid = str(import_job.uuid)
+        event_stream = ImportJobEventStream(job_uuid, ImportJobHandler().get_job_status(job_uuid))
+        events = event_stream.iter_events()
+        
+        self.assertTrue(next(events).startswith('retry:'))
+        self.assertEqual(self.parse_events(next(events))[0][0], 'progress')
+        import_job.delete()
+        
+        remaining_events = self.parse_events(''.join(events))
+        self.assertEqual([event_type for event_type, _ in remaining_events], ['not_found'])
 
@@ -2,9 +2,13 @@ from django.urls import path
 
 from products.views import (
     CsvUploadView,
+    ImportJobEventsView,
+    ImportJobRejectsView,
+    ImportJobResumeView,
     ImportJobStatusView,
     ProductBulkDeleteView,
     ProductDetailView,
+    ProductExportView,
     ProductListView,
     WebhookDetailView,
     WebhookListView,
@@ -20,7 +24,11 @@ urlpatterns = [
     path('webhooks/', webhooks_page, name='webhooks-page'),
     path('api/upload/', CsvUploadView.as_view(), name='csv-upload'),
     path('api/import/<uuid:job_id>/status/', ImportJobStatusView.as_view(), name='import-job-status'),
+    path('api/import/<uuid:job_id>/events/', ImportJobEventsView.as_view(), name='import-job-events'),
+    path('api/import/<uuid:job_id>/rejects/', ImportJobRejectsView.as_view(), name='import-job-rejects'),
+    path('api/import/<uuid:job_id>/resume/', ImportJobResumeView.as_view(), name='import-job-resume'),
     path('api/products/', ProductListView.as_view(), name='product-list'),
+    path('api/products/export/', ProductExportView.as_view(), name='product-export'),
     path('api/products/<uuid:product_id>/', ProductDetailView.as_view(), name='product-detail'),
     path('api/products/bulk-delete/', ProductBulkDeleteView.as_view(), name='product-bulk-delete'),
     path('api/webhooks/', WebhookListView.as_view(), name='webhook-list'),
@@ -1,6 +1,10 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.views import View
 from rest_framework import status
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny
@@ -8,8 +12,12 @@ from rest_framework.permissions import AllowAny
 from base.constants import BaseConstants
 from base.response import APIResponse
 from base.views import AbstractAPIView
+from products.choices import ImportFileFormats
+from products.exceptions import ImportJobConflictError
 from products.handlers.csv_upload_handler import CsvUploadHandler
+from products.handlers.file_handler import StagedCsvUploadHandler
 from products.handlers.import_job_handler import ImportJobHandler
+from products.handlers.job_event_stream import ImportJobEventStream
 from products.handlers.product_handler import ProductHandler
 from products.handlers.webhook_handler import WebhookHandler
 from products.models import Product, Webhook
@@ -38,6 +46,8 @@ class CsvUploadView(AbstractAPIView):
         return csrf_exempt(super().dispatch)(request, *args, **kwargs)
     
     def post(self, request, *args, **kwargs):
+        request.upload_handlers = [StagedCsvUploadHandler(request)]
+        
         if 'file' not in request.FILES:
             return APIResponse(
                 data={'error': 'No file provided'},
@@ -45,9 +55,21 @@ class CsvUploadView(AbstractAPIView):
             )
         
         uploaded_file = request.FILES['file']
+        parallel = self.get_bool_value_from_string(request.data.get('parallel'))
+        retry_of = request.data.get('retry_of') or None
+        dry_run = self.get_bool_value_from_string(request.data.get('dry_run'))
+        full_sync = self.get_bool_value_from_string(request.data.get('full_sync'))
+        duplicate_policy = request.data.get('duplicate_policy') or None
         
         try:
-            data = CsvUploadHandler().upload_csv_file(uploaded_file)
+            data = CsvUploadHandler().upload_csv_file(
+                uploaded_file,
+                parallel=parallel,
+                retry_of=retry_of,
+                dry_run=dry_run,
+                full_sync=full_sync,
+                duplicate_policy=duplicate_policy
+            )
             return APIResponse(data=data, status=status.HTTP_201_CREATED)
         except ValueError as e:
             return APIResponse(
@@ -81,9 +103,79 @@ class ImportJobStatusView(AbstractAPIView):
             )
 
 
-class ProductListView(AbstractAPIView):
+class ImportJobEventsView(View):
+    
+    async def get(self, request, *args, **kwargs):
+        job_uuid = str(kwargs.get('job_id'))
+        
+        try:
+            job_data = await sync_to_async(ImportJobHandler().get_job_status)(job_uuid)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+        
+        event_stream = ImportJobEventStream(job_uuid, job_data)
+        response = StreamingHttpResponse(
+            event_stream.aiter_events() if isinstance(request, ASGIRequest) else event_stream.iter_events(),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class ImportJobRejectsView(AbstractAPIView):
     
     def get(self, request, *args, **kwargs):
+        job_uuid = kwargs.get('job_id')
+        
+        try:
+            file_path, file_name = ImportJobHandler().get_rejects_file(job_uuid)
+            return FileResponse(
+                open(file_path, 'rb'),
+                as_attachment=True,
+                filename=file_name,
+                content_type='application/gzip'
+            )
+        except ValueError as e:
+            return APIResponse(
+                data={'error': str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return APIResponse(
+                data={'error': f'Failed to get rejected rows: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ImportJobResumeView(AbstractAPIView):
+    
+    def post(self, request, *args, **kwargs):
+        job_uuid = kwargs.get('job_id')
+        
+        try:
+            data = ImportJobHandler().resume_job(job_uuid)
+            return APIResponse(data=data, status=status.HTTP_202_ACCEPTED)
+        except ImportJobConflictError as e:
+            return APIResponse(
+                data={'error': str(e)},
+                status=status.HTTP_409_CONFLICT
+            )
+        except ValueError as e:
+            return APIResponse(
+                data={'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return APIResponse(
+                data={'error': f'Failed to resume import job: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class ProductFilterMixin:
+    
+    def get_product_filters(self, request):
         filters = {}
         
         sku = request.GET.get('sku')
@@ -98,10 +190,22 @@ class ProductListView(AbstractAPIView):
         if description:
             filters['description'] = description
         
+        search = request.GET.get('search', '').strip()
+        if search:
+            filters['search'] = search
+        
         active_param = request.GET.get('active')
         if active_param is not None:
             filters['active'] = self.get_bool_query_value('active')
         
+        return filters
+
+
+class ProductListView(ProductFilterMixin, AbstractAPIView):
+    
+    def get(self, request, *args, **kwargs):
+        filters = self.get_product_filters(request)
+        
         page = request.GET.get('page')
         page = int(page) if page and page.isdigit() else 1
         
@@ -109,8 +213,18 @@ class ProductListView(AbstractAPIView):
         page_size = int(page_size) if page_size and page_size.isdigit() else BaseConstants.PAGINATION_PAGE_SIZE
         
         try:
-            data = ProductHandler().list_products(filters, page, page_size)
+            if 'cursor' in request.GET:
+                data = ProductHandler().list_products_by_cursor(
+                    filters, request.GET.get('cursor'), page_size
+                )
+            else:
+                data = ProductHandler().list_products(filters, page, page_size)
             return APIResponse(data=data, status=status.HTTP_200_OK)
+        except ValueError as e:
+            return APIResponse(
+                data={'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return APIResponse(
                 data={'error': f'Failed to list products: {str(e)}'},
@@ -208,6 +322,34 @@ class ProductDetailView(AbstractAPIView):
             )
 
 
+class ProductExportView(ProductFilterMixin, AbstractAPIView):
+    
+    def get(self, request, *args, **kwargs):
+        filters = self.get_product_filters(request)
+        file_format = request.GET.get('file_format', ImportFileFormats.CSV).lower()
+        
+        try:
+            content, content_type, file_name = ProductHandler().export_products(
+                filters, file_format, is_async=isinstance(request._request, ASGIRequest)
+            )
+        except ValueError as e:
+            return APIResponse(
+                data={'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return APIResponse(
+                data={'error': f'Failed to export products: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{file_name}"'
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
 class ProductBulkDeleteView(AbstractAPIView):
     
     def post(self, request, *args, **kwargs):
@@ -1,18 +1,33 @@
 #!/bin/bash
 set -e
 
-echo "Starting Celery worker..."
-celery -A product_importer worker --loglevel=info &
-CELERY_PID=$!
+CELERY_PIDS=()
+
+function start_worker {
+    local name=$1
+    local queues=$2
+    local concurrency=$3
+
+    echo "Starting Celery worker '$name' for queues: $queues (concurrency: $concurrency)..."
+    celery -A product_importer worker --loglevel=info -n "$name@%h" -Q "$queues" -c "$concurrency" "${@:4}" &
+    CELERY_PIDS+=($!)
+}
+
+start_worker imports imports "${IMPORT_WORKER_CONCURRENCY:-2}"
+start_worker imports-small imports_small "${SMALL_IMPORT_WORKER_CONCURRENCY:-1}"
+start_worker webhooks default,webhooks_fanout,webhooks "${WEBHOOK_WORKER_CONCURRENCY:-2}" --beat
 
 function cleanup {
-    echo "Shutting down Celery worker (PID: $CELERY_PID)..."
-    kill $CELERY_PID 2>/dev/null || true
-    wait $CELERY_PID 2>/dev/null || true
-    echo "Celery worker shut down."
+    echo "Shutting down Celery workers (PIDs: ${CELERY_PIDS[*]})..."
+    for pid in "${CELERY_PIDS[@]}"; do
+        kill $pid 2>/dev/null || true
+    done
+    for pid in "${CELERY_PIDS[@]}"; do
+        wait $pid 2>/dev/null || true
+    done
+    echo "Celery workers shut down."
 }
 trap cleanup SIGTERM SIGINT
 
-echo "Starting Gunicorn..."
-exec gunicorn product_importer.wsgi:application --bind 0.0.0.0:$PORT --timeout 120
-
+echo "Starting Gunicorn with Uvicorn workers..."
+exec gunicorn product_importer.asgi:application --worker-class uvicorn_worker.UvicornWorker --bind 0.0.0.0:$PORT --timeout 120